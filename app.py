@@ -6,15 +6,18 @@ import streamlit as st
 import altair as alt
 import io
 import traceback
+from kdt_dataset_module.utils.download_cache import fetch_cached
+from kdt_dataset_module.utils.snapshot_store import load_excel_file
 
 @st.cache_data
 def load_data():
     url = "https://github.com/yulechestnuts/KDT_Dataset/blob/main/data_paste.xlsx?raw=true"
     try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            df = pd.read_excel(io.BytesIO(response.content), engine="openpyxl")
-            return df
+        # 디스크 캐시 사용 (재시작 시 변경이 없으면 다시 내려받지 않음)
+        download = fetch_cached(url, timeout=10)
+        # 통합문서 내용 해시별 스냅샷 (openpyxl 변환은 통합문서가 바뀌었을 때만, 기관명/연도별 매출 컬럼만 로드)
+        df = load_excel_file(download['path'], download['sha256'], url, profile='app')
+        return df
     except Exception as e:
         st.error(f"데이터를 불러올 수 없습니다: {e}")
     return pd.DataFrame()
@@ -47,9 +50,6 @@ def main():
     df = df[df['기관명'] != '합계']
     year_columns = ['2021년', '2022년', '2023년', '2024년']
 
-    for col in year_columns:
-        df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', ''), errors='coerce')
-
     # '누적매출' 계산
     df['누적매출'] = df[year_columns].sum(axis=1)
 
@@ -1,14 +1,46 @@
-import requests
 import pandas as pd
+import numpy as np
 import logging
-import time
 import threading
-from tkinter import Tk, Label, Button, filedialog, messagebox, StringVar, Progressbar
+import time
+import math
+import os
+import sys
+import argparse
 import csv
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from tkcalendar import Calendar
 import re
+import itertools
+import json
+import xml.etree.ElementTree as ET
+from types import MappingProxyType
+
+# GUI 모듈이 없는 서버에서도 헤드리스 수집은 가능하도록 선택적으로 로드
+try:
+    from tkinter import Tk, Toplevel, Label, Button, filedialog, messagebox, StringVar
+    from tkinter.ttk import Progressbar
+    from tkcalendar import Calendar
+except ImportError:
+    Tk = None
+
+from kdt_collector.checkpoint import CheckpointJournal
+from kdt_collector.employment_scheduler import EmploymentScheduler
+from kdt_collector.decoders import (
+    DETAIL_FIELDS, DETAIL_RECORD, EMPLOYMENT_FIELDS, EMPLOYMENT_RECORD, cache_endpoint, get_decoder
+)
+from kdt_collector.delta import DeltaPlan, carry_over_row, load_snapshot, snapshot_date
+from kdt_collector.enrichment import EnrichmentEngine, TokenBucket
+from kdt_collector.institution_resolver import InstitutionResolver
+from kdt_collector.metrics import CollectorMetrics
+from kdt_collector.records import CourseRecord, to_frame
+from kdt_collector.response_cache import ResponseCache
+from kdt_collector.sharding import SharedTokenBucket, ShardStore, merge_shards, split_date_range
+from kdt_collector.sinks import CsvSink, open_sink
+from kdt_collector.transport import CircuitOpenError, Work24Transport, Work24TransportError
+
+# 과정 1건의 상세/취업 통계 조회 실패로 보는 예외 (재시도 후 실패, 회로 차단, 손상된 응답)
+FETCH_ERRORS = (Work24TransportError, ET.ParseError, ValueError)
 
 # 로깅 설정
 logging.basicConfig(
@@ -42,24 +74,26 @@ class KDTDataCalculator:
             '한국폴리텍대학교': ['한국폴리텍대학교', '폴리텍대학교'],
             '한국폴리텍대학교': ['한국폴리텍대학교', '폴리텍대학교'],
         }
+        
+    @property
+    def institution_groups(self):
+        """기관 그룹화 규칙 (읽기 전용, 바꾸려면 새 dict 를 대입)"""
+        return self._institution_groups
+    
+    @institution_groups.setter
+    def institution_groups(self, groups):
+        # 제자리 수정으로 색인과 규칙이 어긋나지 않도록 읽기 전용으로 보관하고, 대입할 때마다 색인을 비움
+        self._institution_groups = MappingProxyType({
+            group_name: tuple(variants) for group_name, variants in groups.items()
+        })
+        # 기관명 → 그룹명 색인 (첫 조회 시 생성)
+        self.resolver = None
     
     def group_institutions_advanced(self, institution_name, similarity_threshold=0.6):
-        """기관명 그룹화 (유사도 기반)"""
-        if not institution_name:
-            return institution_name
-        
-        # 정확한 매칭 우선 확인
-        for group_name, variants in self.institution_groups.items():
-            if institution_name in variants:
-                return group_name
-        
-        # 유사도 기반 매칭
-        for group_name, variants in self.institution_groups.items():
-            for variant in variants:
-                if self.calculate_similarity(institution_name, variant) >= similarity_threshold:
-                    return group_name
-        
-        return institution_name
+        """기관명 그룹화 (유사도 기반, 색인 + 캐시 사용)"""
+        if self.resolver is None:
+            self.resolver = InstitutionResolver(self.institution_groups)
+        return self.resolver.resolve(institution_name, similarity_threshold)
     
     def calculate_similarity(self, str1, str2):
         """문자열 유사도 계산 (간단한 버전)"""
@@ -98,6 +132,27 @@ class KDTDataCalculator:
         
         return False, None
     
+    def detect_leading_company_frame(self, courses):
+        """detect_leading_company_course 의 DataFrame 버전
+        
+        반환: (선도기업 여부 Series, 파트너기관 Series - 선도기업이 아니면 '')
+        """
+        institutions = courses.get('훈련기관', pd.Series('', index=courses.index)).fillna('')
+        course_names = courses.get('과정명', pd.Series('', index=courses.index)).fillna('').astype(str)
+        
+        # 기관명 그룹화는 서로 다른 기관명마다 한 번만 계산
+        unique_names = institutions.unique()
+        grouped_names = dict(zip(unique_names, [self.group_institutions_advanced(name) for name in unique_names]))
+        grouped = institutions.map(grouped_names)
+        
+        # 특별 기관이 참여하거나 과정명에 선도기업 키워드가 있는 경우
+        leading_keywords = ['선도기업', '파트너십', '컨소시엄', '산학연계']
+        has_keyword = course_names.str.contains('|'.join(map(re.escape, leading_keywords)), regex=True)
+        is_leading = grouped.isin(self.special_institutions) | has_keyword
+        
+        partner_institution = grouped.where(is_leading, '').fillna('')
+        return is_leading, partner_institution
+    
     def calculate_course_revenue(self, course_data, target_year=None):
         """과정별 매출 계산"""
         base_revenue = 0
@@ -155,6 +210,105 @@ class KDTDataCalculator:
         
         return yearly_revenue
     
+    def calculate_yearly_revenue_frame(self, courses, years=range(2021, 2027)):
+        """과정 DataFrame 전체의 연도별 매출 일괄 계산
+        
+        calculate_course_revenue 를 과정마다 호출한 것과 같은 값을 돌려줍니다.
+        월별 매출을 같은 순서로 더하므로 부동소수점 값까지 일치합니다.
+        날짜가 없거나 잘못된 과정은 기존과 같이 전체 매출을 현재 연도에 넣습니다.
+        (시작일이 29~31일인 과정은 기존 루프가 Timestamp.replace 에서 중단되었지만 여기서는 계산됩니다.)
+        
+        반환: (연도 컬럼 DataFrame, 과정별 총 매출 Series)
+        """
+        index = courses.index
+        
+        # 기본 매출 계산 (훈련비 * 정원)
+        training_cost = self.safe_int_series(courses.get('훈련비'), index)
+        capacity = self.safe_int_series(courses.get('정원'), index)
+        base_revenue = np.where((training_cost > 0) & (capacity > 0), training_cost * capacity, 0.0)
+        
+        # 수료율에 따른 보정
+        completion_rate = self.safe_float_series(courses.get('수료율'), index)
+        adjustment_factor = np.select(
+            [completion_rate >= 80, completion_rate >= 50, completion_rate > 0],
+            [1.2, 1.0, 0.75],
+            default=1.0
+        )
+        base_revenue = base_revenue * adjustment_factor
+        
+        # 시작/종료 월 (월 단위 정수: 연도*12 + 월-1)
+        start_date = self.to_datetime_series(courses.get('과정시작일'), index)
+        end_date = self.to_datetime_series(courses.get('과정종료일'), index)
+        valid = (start_date.notna() & end_date.notna()).to_numpy()
+        
+        start_month = (start_date.dt.year * 12 + start_date.dt.month - 1).fillna(0).to_numpy(dtype=np.int64)
+        end_month = (end_date.dt.year * 12 + end_date.dt.month - 1).fillna(0).to_numpy(dtype=np.int64)
+        total_months = end_month - start_month + 1
+        valid &= total_months > 0
+        
+        # 기존 루프는 시작일과 같은 일자로 한 달씩 이동하므로
+        # 종료월의 일자/시각이 시작일보다 앞서면 마지막 달은 포함되지 않음
+        start_offset = (start_date - start_date.dt.to_period('M').dt.start_time).to_numpy()
+        end_offset = (end_date - end_date.dt.to_period('M').dt.start_time).to_numpy()
+        allocated_months = np.where(valid, total_months - (start_offset > end_offset), 0)
+        
+        monthly_revenue = np.zeros(len(courses))
+        np.divide(base_revenue, total_months, out=monthly_revenue, where=valid)
+        
+        # 과정이 걸친 모든 연도에 월별 매출을 순서대로 누적
+        first_year = int(start_month[valid].min() // 12) if valid.any() else min(years)
+        last_year = int((start_month + allocated_months - 1)[valid].max() // 12) if valid.any() else max(years)
+        first_year = min(first_year, min(years))
+        last_year = max(last_year, max(years))
+        accumulated = np.zeros((len(courses), last_year - first_year + 1))
+        
+        rows = np.arange(len(courses))
+        for step in range(int(allocated_months.max()) if len(courses) else 0):
+            active = step < allocated_months
+            year_index = (start_month[active] + step) // 12 - first_year
+            accumulated[rows[active], year_index] += monthly_revenue[active]
+        
+        # 총 매출 = 연도별 매출 합계 (연도 순서대로 합산)
+        total_revenue = np.zeros(len(courses))
+        for column in range(accumulated.shape[1]):
+            total_revenue += accumulated[:, column]
+        
+        # 날짜 정보가 없으면 전체 매출을 현재 연도에 할당
+        current_year = datetime.now().year
+        total_revenue = np.where(valid, total_revenue, base_revenue)
+        
+        yearly = {}
+        for year in years:
+            yearly[f'{year}년'] = np.where(
+                valid,
+                accumulated[:, year - first_year],
+                base_revenue if year == current_year else 0.0
+            )
+        
+        return pd.DataFrame(yearly, index=index), pd.Series(total_revenue, index=index)
+    
+    def safe_int_series(self, values, index, default=0):
+        """safe_int 의 Series 버전"""
+        if values is None:
+            return np.full(len(index), float(default))
+        numbers = pd.to_numeric(values.astype(str).str.strip().str.replace(',', '', regex=False), errors='coerce')
+        numbers = np.trunc(numbers.to_numpy(dtype=float))
+        return np.where(np.isfinite(numbers), numbers, default)
+    
+    def safe_float_series(self, values, index, default=0.0):
+        """safe_float 의 Series 버전"""
+        if values is None:
+            return np.full(len(index), float(default))
+        cleaned = values.astype(str).str.strip().str.replace(',', '', regex=False).str.replace('%', '', regex=False)
+        numbers = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=float)
+        return np.where(np.isnan(numbers), default, numbers)
+    
+    def to_datetime_series(self, values, index):
+        """값마다 형식을 따로 해석하는 날짜 변환 (scalar pd.to_datetime 과 같은 결과)"""
+        if values is None:
+            return pd.Series(pd.NaT, index=index, dtype='datetime64[ns]')
+        return pd.to_datetime(values, errors='coerce', format='mixed')
+    
     def calculate_revenue_distribution(self, course_data):
         """매출 분배 계산 (선도기업/파트너기관)"""
         is_leading, partner_institution = self.detect_leading_company_course(course_data)
@@ -192,7 +346,9 @@ class KDTDataCalculator:
             return default
 
 class AutomatedKDTDataCollector:
-    def __init__(self):
+    def __init__(self, max_workers=8, requests_per_second=20, cache_path='kdt_response_cache.sqlite3',
+                 employment_queue_path='kdt_employment_queue.json', checkpoint_dir='kdt_checkpoints',
+                 rate_limiter=None, metrics_path='kdt_metrics', metrics_interval=30, response_format='xml-stream'):
         self.auth_key = "da3974b2-e74e-42f1-8fc5-fb2ae0d938ea"
         self.calculator = KDTDataCalculator()
         self.base_urls = {
@@ -200,10 +356,69 @@ class AutomatedKDTDataCollector:
             'detail': "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L02.do",
             'employment': "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L03.do"
         }
+        
+        # 동시 요청 수 및 API 호출 속도 제한 (기존 고정 0.1초 대기 대체)
+        # rate_limiter 를 넘기면 여러 프로세스가 공유하는 한도(SharedTokenBucket)를 사용
+        self.engine = EnrichmentEngine(max_workers=max_workers)
+        self.rate_limiter = rate_limiter or TokenBucket(requests_per_second)
+        
+        # 요청/캐시/처리량 지표 ({metrics_path}.json, .prom 으로 주기적 저장, None 이면 파일 저장 안 함)
+        self.metrics = CollectorMetrics(metrics_path)
+        self.metrics_interval = metrics_interval
+        
+        # 세 API 가 함께 사용하는 전송 계층 (keep-alive 연결 풀, 재시도, 회로 차단기)
+        self.transport = Work24Transport(
+            self.base_urls, rate_limiter=self.rate_limiter, pool_size=max_workers, metrics=self.metrics
+        )
+        
+        # 310L02/310L03 응답 형식 및 디코더 ('xml': 전체 파싱, 'xml-stream': 필요한 요소까지만 파싱, 'json')
+        self.decoder = get_decoder(response_format)
+        
+        # 상세/취업 통계 응답 디스크 캐시 (cache_path=None 이면 사용 안 함)
+        self.response_cache = ResponseCache(cache_path) if cache_path else None
+        
+        # 취업 통계 조회 시점 판단 (employment_queue_path=None 이면 모든 과정 조회)
+        self.employment_scheduler = EmploymentScheduler(employment_queue_path) if employment_queue_path else None
+        
+        # 수집 기간별 체크포인트 저장 위치 (checkpoint_dir=None 이면 사용 안 함)
+        self.checkpoint_dir = checkpoint_dir
+        
+        # 이번 실행에서 상세/취업 통계 조회에 실패한 과정 {고유값: 오류} (체크포인트에 기록하지 않음)
+        self.failed_fetches = {}
+        self.failed_lock = threading.Lock()
+        
+        # 훈련기관ID 별 상세 정보 (실행 중 중복 조회 방지)
+        self.institution_details = {}
+        self.institution_fetch_locks = {}
+        self.institution_lock = threading.Lock()
+    
+    def collect_and_process_data(self, start_date, end_date, progress_callback=None, sink=None,
+                                 previous_path=None, previous_date=None):
+        """데이터 수집 및 자동 계산 처리
+        
+        sink(kdt_collector.sinks 의 CsvSink/ParquetSink)를 넘기면 계산된 행을 chunk 단위로
+        바로 기록하고 기록한 행 수를 반환합니다. 넘기지 않으면 전체 결과 리스트를 반환합니다.
+        previous_path 에 이전 결과 파일을 넘기면 새 과정, 기본 정보가 바뀐 과정, 그 이후 취업 통계가
+        새로 집계된 과정만 조회하고 나머지는 이전 결과를 재사용합니다 (previous_date 기본값: 이전 결과에 기록된 수집 시각).
+        취업 통계 대기열에서 다음 단계 값이 나온 과정 중 수집 기간 밖에 있고 이전 결과에 있는 과정은
+        수료인원/취업 통계만 다시 조회해 결과 끝에 함께 기록합니다.
+        실행 중에는 metrics_interval 초마다, 끝나면 한 번 더 수집 지표 파일을 갱신합니다.
+        """
+        self.metrics.reset()
+        self.metrics.start_periodic(self.metrics_interval, before_write=self.transport.update_metric_gauges)
+        try:
+            return self.run_collection(start_date, end_date, progress_callback, sink, previous_path, previous_date)
+        finally:
+            self.metrics.stop_periodic()
+            self.transport.update_metric_gauges()
+            self.metrics.log_summary(self.metrics.write())
     
-    def collect_and_process_data(self, start_date, end_date, progress_callback=None):
-        """데이터 수집 및 자동 계산 처리"""
+    def run_collection(self, start_date, end_date, progress_callback=None, sink=None,
+                       previous_path=None, previous_date=None):
+        """collect_and_process_data 본문 (기본 정보 → 상세/취업 정보 → 자동 계산)"""
         logging.info("전체 데이터 수집 및 처리 시작")
+        with self.failed_lock:
+            self.failed_fetches = {}
         
         # 1단계: 기본 과정 정보 수집
         if progress_callback:
@@ -212,86 +427,282 @@ class AutomatedKDTDataCollector:
         basic_data = self.fetch_basic_data(start_date, end_date)
         
         if not basic_data:
-            logging.error("기본 과정 정보 수집 실패")
+            # 목록 조회 실패는 fetch_basic_data 에서 예외로 전달되므로 여기서는 과정이 없는 기간
+            logging.warning(f"수집 기간에 과정이 없습니다: {start_date} ~ {end_date}")
             return None
         
-        # 2단계: 상세 정보 및 취업 통계 수집
-        total_items = len(basic_data)
-        enriched_data = []
+        # 2단계: 상세 정보 및 취업 통계 수집 (동시 요청, 입력 순서 유지)
+        # 이전 실행이 중단되었다면 체크포인트에 기록된 과정은 다시 조회하지 않음
+        journal = self.open_checkpoint(start_date, end_date)
+        restored = {key: CourseRecord.from_row(row) for key, row in journal.load().items()} if journal else {}
+        pending_items = [item for item in basic_data if item['고유값'] not in restored]
+        
+        if restored:
+            logging.info(f"체크포인트 재개: 복원 {len(basic_data) - len(pending_items)}개, 남은 과정 {len(pending_items)}개")
+            if self.employment_scheduler:
+                # 복원된 과정도 취업 통계 대기열에는 다시 반영
+                for item in basic_data:
+                    if item['고유값'] in restored:
+                        self.employment_scheduler.should_fetch(item)
+        
+        # 델타 수집: 이전 결과와 비교해 바뀐 과정만 조회
+        carried = {}
+        employment_keys = set()
+        previous_rows = {}
+        if previous_path:
+            plan = self.plan_delta(pending_items, previous_path, previous_date)
+            plan.log_summary()
+            carried = plan.carried
+            employment_keys = plan.employment_keys
+            previous_rows = plan.previous
+            pending_items = [item for item in pending_items if item['고유값'] not in carried]
+            if self.employment_scheduler:
+                # 재사용하는 과정도 취업 통계 대기열에는 반영
+                for row in carried.values():
+                    self.employment_scheduler.should_fetch(row)
+        
+        def enrich_and_record(item):
+            # 조회에 실패한 과정은 체크포인트에 기록하지 않아 재실행 시 다시 조회
+            try:
+                if item['고유값'] in employment_keys:
+                    enriched_item = self.refresh_employment(item, previous_rows[item['고유값']])
+                else:
+                    enriched_item = self.enrich_course(item)
+            except FETCH_ERRORS as e:
+                self.record_failed_fetch(item, e)
+                if item['고유값'] in employment_keys:
+                    return carry_over_row(item, previous_rows[item['고유값']])
+                return item
+            if journal:
+                journal.append(enriched_item.to_row())
+            return enriched_item
         
-        for idx, item in enumerate(basic_data):
+        def report_progress(done, total):
             if progress_callback:
-                progress_callback(f"상세 정보 수집 중... ({idx+1}/{total_items})", 10 + (idx+1) / total_items * 60)
-            
-            # 상세 정보 수집
-            detail_info = self.fetch_detail_data(
-                item['훈련과정 ID'], 
-                item['회차'], 
-                item['훈련기관ID']
-            )
-            
-            # 취업 통계 수집
+                progress_callback(f"상세 정보 수집 중... ({done}/{total})", 10 + done / total * 60)
+        
+        new_items = self.engine.imap(enrich_and_record, pending_items, report_progress)
+        listed_keys = {item['고유값'] for item in basic_data}
+        enriched_rows = itertools.chain(
+            (
+                restored.pop(item['고유값']) if item['고유값'] in restored
+                else carried.pop(item['고유값']) if item['고유값'] in carried
+                else next(new_items)
+                for item in basic_data
+            ),
+            # 대기열에서 다음 단계 값이 나온 수집 기간 밖 과정은 이전 결과 행을 갱신해 함께 기록
+            self.collect_due_employment(listed_keys, previous_rows, progress_callback)
+        )
+        
+        # 3단계: 자동 계산 및 보정
+        try:
+            if sink is None:
+                final_data = self.apply_automated_calculations(list(enriched_rows))
+                row_count = len(final_data)
+                self.metrics.record_rows(row_count)
+            else:
+                # 수집된 순서대로 chunk 단위 계산 후 바로 기록 (전체 결과를 메모리에 쌓지 않음)
+                final_data = row_count = self.write_processed_rows(enriched_rows, sink)
+        finally:
+            if journal:
+                journal.close()
+        
+        if progress_callback:
+            progress_callback("처리 완료!", 100)
+        
+        if self.employment_scheduler:
+            self.employment_scheduler.save_queue()
+        self.save_failed_fetches(start_date, end_date)
+        self.transport.log_latency_summary()
+        if self.response_cache:
+            self.response_cache.log_summary()
+        logging.info(f"전체 데이터 처리 완료: {row_count}개")
+        return final_data
+    
+    def record_failed_fetch(self, item, error):
+        with self.failed_lock:
+            self.failed_fetches[item['고유값']] = str(error)
+        logging.error(f"과정 조회 실패 ({item['고유값']}), 체크포인트에 기록하지 않음: {error}")
+    
+    def failed_fetches_path(self, start_date, end_date):
+        return os.path.join(self.checkpoint_dir, f"kdt_checkpoint_{start_date}_{end_date}.failed.json")
+    
+    def save_failed_fetches(self, start_date, end_date):
+        """조회에 실패한 과정 목록을 체크포인트 옆에 저장 (모두 성공하면 이전 목록 삭제)"""
+        if not self.failed_fetches:
+            if self.checkpoint_dir and os.path.exists(self.failed_fetches_path(start_date, end_date)):
+                os.remove(self.failed_fetches_path(start_date, end_date))
+            return
+        
+        logging.error(f"상세/취업 통계 조회 실패 {len(self.failed_fetches)}개 (다시 실행하면 실패한 과정만 다시 조회)")
+        if self.checkpoint_dir:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            path = self.failed_fetches_path(start_date, end_date)
+            with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(self.failed_fetches, f, ensure_ascii=False, indent=1)
+            os.replace(f"{path}.tmp", path)
+    
+    def write_processed_rows(self, rows, sink, chunk_size=1000):
+        """수집된 행을 chunk 단위로 자동 계산해 출력기에 기록하고 기록한 행 수 반환"""
+        row_count = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                sink.write_rows(self.apply_automated_calculations(chunk))
+                row_count += len(chunk)
+                self.metrics.record_rows(len(chunk))
+                chunk = []
+        
+        if chunk:
+            sink.write_rows(self.apply_automated_calculations(chunk))
+            row_count += len(chunk)
+            self.metrics.record_rows(len(chunk))
+        
+        return row_count
+    
+    def checkpoint_path(self, start_date, end_date):
+        return os.path.join(self.checkpoint_dir, f"kdt_checkpoint_{start_date}_{end_date}.jsonl")
+    
+    def open_checkpoint(self, start_date, end_date):
+        """수집 기간별 체크포인트 저널 (사용하지 않으면 None)"""
+        if not self.checkpoint_dir:
+            return None
+        return CheckpointJournal(self.checkpoint_path(start_date, end_date))
+    
+    def clear_checkpoint(self, start_date, end_date):
+        """결과 파일 저장이 끝난 뒤 호출해 체크포인트 삭제"""
+        journal = self.open_checkpoint(start_date, end_date)
+        if journal:
+            journal.remove()
+    
+    def enrich_course(self, item):
+        """과정 1건에 상세 정보 및 취업 통계 결합"""
+        # 상세 정보 수집
+        detail_info = self.fetch_detail_data(
+            item['훈련과정 ID'], 
+            item['회차'], 
+            item['훈련기관ID']
+        )
+        
+        # 수료인원/취업 통계 수집 (아직 끝나지 않은 과정만 대기열에 넣고 종료 후 실행으로 미룸)
+        if self.employment_scheduler is None or self.employment_scheduler.should_fetch(item):
             employment_info = self.fetch_employment_data(
                 item['훈련과정 ID'], 
                 item['회차'], 
-                item['훈련기관ID']
+                item['훈련기관ID'],
+                end_date=item['과정종료일']
             )
-            
-            # 데이터 통합
-            enriched_item = {**item, **detail_info, **employment_info}
-            enriched_data.append(enriched_item)
-            
-            time.sleep(0.1)  # API 호출 간격 조절
+        else:
+            employment_info = {}
         
-        # 3단계: 자동 계산 및 보정
-        if progress_callback:
-            progress_callback("매출 및 기타 정보 계산 중...", 80)
+        # 데이터 통합 (새 dict 를 만들지 않고 레코드에 바로 반영)
+        item.update(detail_info)
+        item.update(employment_info)
+        return item
+    
+    def plan_delta(self, items, previous_path, previous_date=None):
+        """이전 결과 파일과 새 310L01 목록을 비교한 DeltaPlan"""
+        previous = load_snapshot(previous_path)
+        previous_date = previous_date or snapshot_date(previous_path)
+        scheduler = self.employment_scheduler or EmploymentScheduler(queue_path=None)
+        return DeltaPlan(
+            items, previous,
+            stage_now=scheduler.available_stage,
+            stage_then=lambda end_date: scheduler.available_stage(end_date, today=previous_date)
+        )
+    
+    def refresh_employment(self, item, previous_row):
+        """이전 결과의 상세 정보는 그대로 두고 취업 통계만 다시 조회 (조회 실패는 예외로 전달)"""
+        employment_info = self.fetch_employment_data(
+            item['훈련과정 ID'],
+            item['회차'],
+            item['훈련기관ID'],
+            end_date=item['과정종료일']
+        )
+        if self.employment_scheduler:
+            self.employment_scheduler.should_fetch(item)
+        refreshed = carry_over_row(item, previous_row)
+        refreshed.update(employment_info)
+        return refreshed
+    
+    def collect_due_employment(self, listed_keys, previous_rows, progress_callback=None):
+        """이전 실행에서 미뤄 둔 과정 중 다음 단계 값이 나왔을 과정의 310L03 만 다시 조회한 행 (제너레이터)
         
-        final_data = self.apply_automated_calculations(enriched_data)
+        이번 목록(listed_keys)에 있는 과정은 본 수집에서 처리하므로 제외하고, 나머지는 이전 결과(previous_rows)의
+        행에 새 수료인원/취업 통계를 합쳐 돌려줍니다. 이전 결과에 없는 과정은 합칠 행이 없으므로 대기열에 그대로 둡니다.
+        조회에 실패한 과정은 이전 행을 그대로 돌려주고 대기열도 갱신하지 않아 다음 실행에서 다시 조회합니다.
+        """
+        if self.employment_scheduler is None:
+            return iter(())
         
-        if progress_callback:
-            progress_callback("처리 완료!", 100)
+        due_items = [entry for entry in self.employment_scheduler.due_items() if entry['고유값'] not in listed_keys]
+        mergeable = [entry for entry in due_items if entry['고유값'] in previous_rows]
+        if len(mergeable) < len(due_items):
+            logging.info(f"대기열 과정 {len(due_items) - len(mergeable)}개는 이전 결과에 없어 다음 실행으로 미룸 "
+                         f"(--previous 로 해당 과정이 든 결과를 넘기면 함께 갱신)")
+        if not mergeable:
+            return iter(())
+        logging.info(f"대기열 취업 통계 조회 대상 (수집 기간 밖): {len(mergeable)}개")
         
-        logging.info(f"전체 데이터 처리 완료: {len(final_data)}개")
-        return final_data
+        def fetch_due(entry):
+            previous_row = CourseRecord.from_row(previous_rows[entry['고유값']])
+            previous_row['훈련기관ID'] = entry['훈련기관ID']
+            try:
+                employment_info = self.fetch_employment_data(
+                    entry['훈련과정 ID'],
+                    entry['회차'],
+                    entry['훈련기관ID'],
+                    end_date=entry['과정종료일']
+                )
+            except FETCH_ERRORS as e:
+                self.record_failed_fetch(entry, e)
+                return previous_row
+            self.employment_scheduler.should_fetch(entry)
+            previous_row.update(employment_info)
+            return previous_row
+        
+        def report_progress(done, total):
+            if progress_callback:
+                progress_callback(f"대기열 취업 통계 수집 중... ({done}/{total})", 70 + done / total * 10)
+        
+        return self.engine.imap(fetch_due, mergeable, report_progress)
     
     def apply_automated_calculations(self, data):
         """자동 계산 로직 적용"""
-        processed_data = []
+        if not data:
+            return []
         
-        for course in data:
-            # 선도기업/파트너기관 판단
-            revenue_dist = self.calculator.calculate_revenue_distribution(course)
-            
-            # 연도별 매출 계산
-            yearly_revenues = self.calculator.calculate_course_revenue(course)
-            total_revenue = sum(yearly_revenues.values()) if isinstance(yearly_revenues, dict) else yearly_revenues
-            
-            # 계산된 정보 추가
-            processed_course = course.copy()
-            
-            # 선도기업/파트너기관 정보
-            processed_course['선도기업'] = 'Y' if revenue_dist['is_leading_company'] else 'N'
-            processed_course['파트너기관'] = revenue_dist['partner_institution']
-            
-            # 매출 정보
-            processed_course['매출 최소'] = total_revenue * 0.8  # 보수적 추정
-            processed_course['실 매출 대비'] = total_revenue
-            processed_course['매출 최대'] = total_revenue * 1.2  # 낙관적 추정
-            
-            # 연도별 매출
-            if isinstance(yearly_revenues, dict):
-                for year in range(2021, 2027):
-                    processed_course[f'{year}년'] = yearly_revenues.get(year, 0)
-            else:
-                # 단일 값인 경우 현재 연도에 할당
-                current_year = datetime.now().year
-                for year in range(2021, 2027):
-                    processed_course[f'{year}년'] = yearly_revenues if year == current_year else 0
-            
-            processed_data.append(processed_course)
+        # 결과 파일 컬럼 형식(dict)으로는 여기서 처음 변환
+        processed = self.apply_automated_calculations_frame(to_frame(data))
+        return processed.to_dict('records')
+    
+    def apply_automated_calculations_frame(self, courses):
+        """자동 계산 로직을 DataFrame 컬럼 단위로 한 번에 적용"""
+        started = time.perf_counter()
+        processed = courses.copy()
         
-        return processed_data
+        # 선도기업/파트너기관 판단
+        is_leading, partner_institution = self.calculator.detect_leading_company_frame(courses)
+        processed['선도기업'] = np.where(is_leading, 'Y', 'N')
+        processed['파트너기관'] = partner_institution
+        
+        # 연도별 매출 계산
+        yearly_frame, total_revenue = self.calculator.calculate_yearly_revenue_frame(courses)
+        
+        # 매출 정보
+        processed['매출 최소'] = total_revenue * 0.8  # 보수적 추정
+        processed['실 매출 대비'] = total_revenue
+        processed['매출 최대'] = total_revenue * 1.2  # 낙관적 추정
+        
+        # 연도별 매출
+        for column in yearly_frame.columns:
+            processed[column] = yearly_frame[column]
+        
+        elapsed = time.perf_counter() - started
+        rows_per_second = len(processed) / elapsed if elapsed > 0 else float('inf')
+        logging.info(f"자동 계산 완료: {len(processed)}개 ({rows_per_second:,.0f}행/s)")
+        return processed
     
     def fetch_basic_data(self, start_date, end_date):
         """기본 과정 정보 수집 (API 310L01)"""
@@ -310,164 +721,404 @@ class AutomatedKDTDataCollector:
             "crseTracseSe": "C0104"
         }
         
-        all_data = []
-        page_num = 1
+        page_size = int(params["pageSize"])
         
-        while True:
-            params["pageNum"] = str(page_num)
-            try:
-                response = requests.get(self.base_urls['basic'], params=params, timeout=30)
-                if response.status_code != 200:
-                    logging.error(f"API 요청 실패: {response.status_code}")
-                    break
-                
-                data = response.json()
-                if 'srchList' not in data or len(data['srchList']) == 0:
-                    break
-                
-                for item in data['srchList']:
-                    basic_info = {
-                        '고유값': f"{item.get('trprId', '')}_{item.get('trprDegr', '')}_{item.get('instCd', '')}",
-                        '과정명': item.get('title', ''),
-                        '훈련과정 ID': item.get('trprId', ''),
-                        '회차': item.get('trprDegr', ''),
-                        '훈련기관': item.get('instNm', ''),
-                        '훈련기관ID': item.get('instCd', ''),
-                        '총 훈련일수': item.get('trDcnt', ''),
-                        '총 훈련시간': item.get('trtm', ''),
-                        '과정시작일': item.get('traStartDate', ''),
-                        '과정종료일': item.get('traEndDate', ''),
-                        'NCS명': item.get('ncsNm', ''),
-                        'NCS코드': item.get('ncsCd', ''),
-                        '훈련비': item.get('courseMan', ''),
-                        '정원': item.get('yardMan', ''),
-                        '수강신청 인원': item.get('regCourseMan', ''),
-                        '수료인원': '',  # 3단계에서 채워질 예정
-                        '수료율': '',    # 3단계에서 계산될 예정
-                        '만족도': item.get('stdgScor', ''),
-                        '취업인원 (3개월)': '',  # 3단계에서 채워질 예정
-                        '취업률 (3개월)': '',    # 3단계에서 채워질 예정
-                        '취업인원 (6개월)': '',  # 3단계에서 채워질 예정
-                        '취업률 (6개월)': '',    # 3단계에서 채워될 예정
-                        '지역': item.get('trngAreaCd', ''),
-                        '주소': item.get('address', ''),
-                        '과정페이지 링크': item.get('titleLink', ''),
-                        # 이후 자동 계산될 컬럼들
-                        '선도기업': '',
-                        '파트너기관': '',
-                        '매출 최소': '',
-                        '실 매출 대비': '',
-                        '매출 최대': '',
-                        '2021년': '',
-                        '2022년': '',
-                        '2023년': '',
-                        '2024년': '',
-                        '2025년': '',
-                        '2026년': ''
-                    }
-                    all_data.append(basic_info)
-                
-                logging.info(f"페이지 {page_num} 처리 완료: {len(data['srchList'])}개 항목")
+        # 1페이지 조회 후 전체 결과 수(scn_cnt)로 남은 페이지 수 계산
+        # 재시도 후에도 조회하지 못한 페이지가 있으면 일부 목록을 반환하지 않고 Work24TransportError
+        first_list, total_count = self.fetch_listing_page(params, 1)
+        if not first_list:
+            logging.info("기본 과정 정보 수집 완료: 총 0개")
+            return []
+        
+        pages = [first_list]
+        
+        if total_count > 0:
+            total_pages = math.ceil(total_count / page_size)
+            logging.info(f"전체 {total_count}개, {total_pages}페이지 병렬 수집")
+            
+            # 남은 페이지는 동시에 요청하고 페이지 순서대로 병합
+            for srch_list, _ in self.engine.map(lambda num: self.fetch_listing_page(params, num), range(2, total_pages + 1)):
+                if srch_list:
+                    pages.append(srch_list)
+        else:
+            # 전체 결과 수가 없으면 빈 페이지가 나올 때까지 순차 조회
+            page_num = 2
+            srch_list = first_list
+            while srch_list:
+                srch_list, _ = self.fetch_listing_page(params, page_num)
+                if srch_list:
+                    pages.append(srch_list)
                 page_num += 1
-                
-            except Exception as e:
-                logging.error(f"기본 데이터 수집 중 오류: {e}")
-                break
+        
+        # 고유값 기준 중복 제거 (페이지 사이에 과정이 추가되어 밀린 경우 대비)
+        all_data = []
+        seen_keys = set()
+        for srch_list in pages:
+            for item in srch_list:
+                basic_info = self.build_basic_info(item)
+                if basic_info['고유값'] in seen_keys:
+                    continue
+                seen_keys.add(basic_info['고유값'])
+                all_data.append(basic_info)
         
         logging.info(f"기본 과정 정보 수집 완료: 총 {len(all_data)}개")
         return all_data
     
+    def fetch_basic_page(self, params, page_num):
+        """310L01 한 페이지 조회 후 (srchList, 전체 결과 수) 반환 (실패는 FETCH_ERRORS 예외)"""
+        page_params = {**params, "pageNum": str(page_num)}
+        response = self.transport.get('basic', page_params)
+        if response.status_code != 200:
+            raise Work24TransportError(f"basic 요청 실패: HTTP {response.status_code} (페이지 {page_num})")
+        
+        data = response.json()
+        srch_list = data.get('srchList') or []
+        total_count = self.calculator.safe_int(data.get('scn_cnt', 0))
+        
+        logging.info(f"페이지 {page_num} 처리 완료: {len(srch_list)}개 항목")
+        return srch_list, total_count
+    
+    def fetch_listing_page(self, params, page_num):
+        """목록 1페이지 조회 (재시도는 전송 계층 정책에 맡기고, 실패하면 페이지 번호를 붙여 Work24TransportError)
+
+        회로 차단기가 열린 경우(CircuitOpenError)는 그대로 올려 목록 수집을 바로 중단합니다.
+        """
+        try:
+            return self.fetch_basic_page(params, page_num)
+        except CircuitOpenError:
+            raise
+        except FETCH_ERRORS as e:
+            raise Work24TransportError(f"기본 과정 정보 {page_num}페이지 조회 실패: {e}") from e
+    
+    def build_basic_info(self, item):
+        """310L01 srchList 항목을 CourseRecord 로 변환 (자동 계산 컬럼은 3단계에서 추가)"""
+        return CourseRecord.from_api(item)
+    
+    def fetch_course_response(self, endpoint, params, record_tag, fields, end_date=None, cache_key=None):
+        """과정 단위 응답의 record_tag 요소 필드 조회 (디스크 캐시 우선, 요소가 없으면 None)
+        
+        캐시에는 디코딩에 성공하고 record_tag 요소가 있는 응답만 저장하며, 읽을 수 없는 캐시 본문은 지우고 다시 조회합니다.
+        요청 실패는 Work24TransportError, 빈 본문/오류 응답은 ET.ParseError 또는 ValueError 로 전달합니다 (FETCH_ERRORS).
+        """
+        key = cache_key or (params['srchTrprId'], params['srchTrprDegr'], params['srchTorgId'])
+        # XML/JSON 응답은 캐시에 따로 저장
+        stored_endpoint = cache_endpoint(endpoint, self.decoder)
+        
+        if self.response_cache:
+            cached = self.response_cache.get(*key, stored_endpoint)
+            if cached is not None:
+                try:
+                    data = self.decoder.decode(cached, record_tag, fields)
+                except (ET.ParseError, ValueError) as e:
+                    data = None
+                    logging.warning(f"캐시된 {endpoint} 응답을 읽을 수 없어 다시 조회 ({key}): {e}")
+                if data is not None:
+                    self.metrics.record_cache(endpoint, True)
+                    return data
+                self.response_cache.invalidate(*key, stored_endpoint)
+            self.metrics.record_cache(endpoint, False)
+        
+        response = self.transport.get(endpoint, params)
+        if response.status_code != 200:
+            raise Work24TransportError(f"{endpoint} 요청 실패: HTTP {response.status_code}")
+        
+        data = self.decoder.decode(response.content, record_tag, fields)
+        if data is not None and self.response_cache:
+            self.response_cache.put(*key, stored_endpoint, response.content, end_date=end_date)
+        return data
+    
     def fetch_detail_data(self, trpr_id, trpr_degr, torg_id):
-        """기관 상세 정보 수집 (API 310L02)"""
+        """기관 상세 정보 수집 (API 310L02, 훈련기관별 1회 조회)"""
+        # inst_base_info 는 기관 단위 정보이므로 같은 기관의 다른 과정/회차는 첫 응답을 재사용
+        with self.institution_lock:
+            if torg_id in self.institution_details:
+                return dict(self.institution_details[torg_id])
+            torg_lock = self.institution_fetch_locks.setdefault(torg_id, threading.Lock())
+        
+        # 같은 기관을 동시에 조회하려는 다른 스레드는 첫 조회가 끝날 때까지 대기
+        with torg_lock:
+            if torg_id not in self.institution_details:
+                detail_data = self.fetch_institution_detail(trpr_id, trpr_degr, torg_id)
+                with self.institution_lock:
+                    self.institution_details[torg_id] = detail_data
+        
+        return dict(self.institution_details[torg_id])
+    
+    def fetch_institution_detail(self, trpr_id, trpr_degr, torg_id):
+        """훈련기관 기본 정보 조회 (조회/디코딩 실패는 예외로 전달, FETCH_ERRORS 참고)"""
         params = {
             "authKey": self.auth_key,
-            "returnType": "XML",
+            "returnType": self.decoder.return_type,
             "outType": "2",
             "srchTrprId": trpr_id,
             "srchTrprDegr": trpr_degr,
             "srchTorgId": torg_id
         }
         
-        try:
-            response = requests.get(self.base_urls['detail'], params=params, timeout=30)
-            if response.status_code != 200:
-                return {}
-            
-            root = ET.fromstring(response.content)
-            base_info = root.find('inst_base_info')
-            
-            if base_info is None:
-                return {}
-            
-            detail_data = {}
-            
-            # 추가 상세 정보 추출
-            if base_info.find('instPerTrco') is not None:
-                detail_data['실제 훈련비'] = base_info.find('instPerTrco').text
-            if base_info.find('perTrco') is not None:
-                detail_data['정부지원금'] = base_info.find('perTrco').text
-            
-            return detail_data
-            
-        except Exception as e:
-            logging.error(f"상세 정보 수집 중 오류: {e}")
-            return {}
+        # inst_base_info 의 실제 훈련비/정부지원금만 추출 (디스크 캐시도 훈련기관ID 만으로 저장해 다음 실행에서 재사용)
+        detail_data = self.fetch_course_response('detail', params, DETAIL_RECORD, DETAIL_FIELDS,
+                                                 cache_key=('', '', torg_id))
+        return detail_data if detail_data is not None else {}
     
-    def fetch_employment_data(self, trpr_id, trpr_degr, torg_id):
-        """취업 통계 정보 수집 (API 310L03)"""
+    def fetch_employment_data(self, trpr_id, trpr_degr, torg_id, end_date=None):
+        """취업 통계 정보 수집 (API 310L03, 조회/디코딩 실패는 예외로 전달)"""
         params = {
             "authKey": self.auth_key,
-            "returnType": "XML",
+            "returnType": self.decoder.return_type,
             "outType": "2",
             "srchTrprId": trpr_id,
             "srchTrprDegr": trpr_degr,
             "srchTorgId": torg_id
         }
         
-        try:
-            response = requests.get(self.base_urls['employment'], params=params, timeout=30)
-            if response.status_code != 200:
-                return {}
-            
-            root = ET.fromstring(response.content)
-            scn_list = root.findall('scn_list')
-            
-            if not scn_list:
-                return {}
-            
-            info = scn_list[0]
-            employment_data = {}
-            
-            # 취업 관련 데이터 추출
-            if info.find('eiEmplCnt3') is not None:
-                employment_data['취업인원 (3개월)'] = info.find('eiEmplCnt3').text
-            if info.find('eiEmplRate3') is not None:
-                employment_data['취업률 (3개월)'] = info.find('eiEmplRate3').text
-            if info.find('eiEmplCnt6') is not None:
-                employment_data['취업인원 (6개월)'] = info.find('eiEmplCnt6').text
-            if info.find('eiEmplRate6') is not None:
-                employment_data['취업률 (6개월)'] = info.find('eiEmplRate6').text
-            
-            # 수료 관련 데이터 추출
-            if info.find('finiCnt') is not None:
-                employment_data['수료인원'] = info.find('finiCnt').text
-            
-            # 수료율 계산
-            completed = self.calculator.safe_int(employment_data.get('수료인원', 0))
-            enrolled = self.calculator.safe_int(employment_data.get('수강신청 인원', 0))
-            
-            if enrolled > 0:
-                completion_rate = (completed / enrolled) * 100
-                employment_data['수료율'] = f"{completion_rate:.1f}%"
-            
-            return employment_data
-            
-        except Exception as e:
-            logging.error(f"취업 통계 수집 중 오류: {e}")
+        # 첫 번째 scn_list 의 취업/수료 관련 데이터 추출
+        employment_data = self.fetch_course_response('employment', params, EMPLOYMENT_RECORD, EMPLOYMENT_FIELDS,
+                                                     end_date)
+        if employment_data is None:
             return {}
+        
+        # 수료율 계산
+        completed = self.calculator.safe_int(employment_data.get('수료인원', 0))
+        enrolled = self.calculator.safe_int(employment_data.get('수강신청 인원', 0))
+        
+        if enrolled > 0:
+            completion_rate = (completed / enrolled) * 100
+            employment_data['수료율'] = f"{completion_rate:.1f}%"
+        
+        return employment_data
+
+# 기간 분할 수집 작업 프로세스마다 하나씩 만드는 수집기
+shard_collector = None
+shard_use_employment_queue = True
+
+
+def init_shard_worker(rate_limiter, collector_options, base_urls, use_employment_queue):
+    """작업 프로세스 초기화 (전체 요청 한도를 공유하는 수집기 생성)"""
+    global shard_collector, shard_use_employment_queue
+    shard_collector = AutomatedKDTDataCollector(
+        rate_limiter=rate_limiter, employment_queue_path=None, **collector_options
+    )
+    if base_urls:
+        shard_collector.base_urls.update(base_urls)
+    shard_use_employment_queue = use_employment_queue
+
+
+def collect_shard(start_date, end_date, shard_dir, previous_path=None, previous_date=None):
+    """작업 프로세스에서 샤드 1개를 수집해 샤드 CSV 로 기록하고 요약 반환
+
+    요약의 status 는 'ok'(결과 있음), 'empty'(기간에 과정 없음), 'failed'(기본 목록 또는 일부 과정 조회 실패).
+    failed 샤드는 완료로 표시하지 않으므로 재실행 시 다시 수집합니다. (체크포인트로 성공한 과정은 재사용)
+    """
+    collector = shard_collector
+    
+    # 취업 통계 대기열은 샤드마다 메모리에서 갱신하고 부모 프로세스가 합쳐서 저장
+    collector.employment_scheduler = EmploymentScheduler(queue_path=None) if shard_use_employment_queue else None
+    
+    store = ShardStore(shard_dir)
+    rows_path = store.rows_path(start_date, end_date)
+    sink = CsvSink(rows_path)
+    error = None
+    try:
+        row_count = collector.collect_and_process_data(
+            start_date, end_date, sink=sink, previous_path=previous_path, previous_date=previous_date
+        ) or 0
+    except Work24TransportError as e:
+        # 기본 과정 목록 조회 실패는 과정이 없는 기간(empty)과 구분
+        row_count, error = 0, str(e)
+    except BaseException:
+        sink.abort()
+        raise
+    
+    if error is None and collector.failed_fetches:
+        error = f"상세/취업 통계 조회 실패 {len(collector.failed_fetches)}개"
+    status = 'failed' if error else 'ok' if row_count else 'empty'
+    
+    scheduler = collector.employment_scheduler
+    summary = {
+        'status': status,
+        'error': error,
+        'rows': row_count,
+        'collected_at': sink.collected_at,
+        'employment_queue': scheduler.queue if scheduler else {},
+        'skipped': scheduler.skipped if scheduler else 0,
+        'metrics': collector.metrics.snapshot(),
+    }
+    
+    if status == 'failed':
+        sink.abort()
+        return summary
+    
+    # 결과가 있을 때만 샤드 CSV 로 교체 (빈 샤드는 파일 없이 완료 표시)
+    sink.close()
+    store.mark_done(start_date, end_date, summary)
+    collector.clear_checkpoint(start_date, end_date)
+    return summary
+
+
+def collect_sharded(start_date, end_date, output_path, shard='month', processes=4, max_workers=8,
+                    requests_per_second=20, cache_path='kdt_response_cache.sqlite3',
+                    employment_queue_path='kdt_employment_queue.json', checkpoint_dir='kdt_checkpoints',
+                    shard_dir='kdt_shards', base_urls=None, metrics_path='kdt_metrics', response_format='xml-stream',
+                    previous_path=None, previous_date=None):
+    """수집 기간을 월/주 단위로 나눠 여러 프로세스에서 수집한 뒤 하나의 결과 파일로 병합
+    
+    모든 프로세스는 requests_per_second 한도를 함께 나눠 쓰며, 완료된 샤드는
+    shard_dir 에 남아 있어 중단 후 재실행하면 남은 샤드만 수집합니다. previous_path 를 넘기면
+    샤드마다 델타 수집을 하고, 취업 통계 대기열 중 수집 기간 밖 과정은 병합 후 부모 프로세스에서 조회해
+    이전 결과 행을 갱신해 함께 기록합니다. 기록한 행 수를 반환하고
+    실패한 샤드가 있으면 결과 파일을 만들지 않고 None 을 반환합니다.
+    """
+    shards = split_date_range(start_date, end_date, shard)
+    store = ShardStore(shard_dir)
+    
+    summaries = {}
+    pending_shards = []
+    for shard_range in shards:
+        summary = store.load_done(*shard_range)
+        if summary is None:
+            pending_shards.append(shard_range)
+        else:
+            summaries[shard_range] = summary
+    
+    logging.info(f"기간 분할 수집 시작: {start_date} ~ {end_date}, {len(shards)}개 샤드 ({shard} 단위, "
+                 f"완료된 샤드 {len(shards) - len(pending_shards)}개 건너뜀), "
+                 f"프로세스 {processes}개, 전체 초당 {requests_per_second}회")
+    
+    started = time.perf_counter()
+    failed_shards = []
+    
+    # 작업 프로세스의 지표는 샤드가 끝날 때마다 합쳐서 저장 (이전 실행에서 완료된 샤드 포함)
+    metrics = CollectorMetrics(metrics_path)
+    for summary in summaries.values():
+        metrics.merge(summary.get('metrics', {}))
+    
+    if pending_shards:
+        rate_limiter = SharedTokenBucket(requests_per_second)
+        collector_options = {
+            'max_workers': max_workers, 'cache_path': cache_path, 'checkpoint_dir': checkpoint_dir,
+            'metrics_path': None, 'response_format': response_format,
+        }
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(pending_shards)),
+            initializer=init_shard_worker,
+            initargs=(rate_limiter, collector_options, base_urls, bool(employment_queue_path))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    collect_shard, shard_start, shard_end, shard_dir, previous_path, previous_date
+                ): (shard_start, shard_end)
+                for shard_start, shard_end in pending_shards
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                shard_start, shard_end = futures[future]
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    logging.error(f"샤드 수집 실패: {shard_start} ~ {shard_end}: {e}")
+                    failed_shards.append((shard_start, shard_end))
+                    continue
+                
+                metrics.merge(summary.get('metrics', {}))
+                metrics.write()
+                if summary['status'] == 'failed':
+                    logging.error(f"샤드 수집 실패: {shard_start} ~ {shard_end}: {summary['error']} (다음 실행에서 다시 수집)")
+                    failed_shards.append((shard_start, shard_end))
+                    continue
+                
+                summaries[(shard_start, shard_end)] = summary
+                if summary['status'] == 'empty':
+                    logging.warning(f"샤드 결과 없음: {shard_start} ~ {shard_end} (기간에 과정 없음)")
+                logging.info(f"샤드 완료 ({done}/{len(pending_shards)}): {shard_start} ~ {shard_end}, "
+                             f"{summary['rows']}개")
+    
+    if failed_shards:
+        logging.error(f"실패한 샤드 {len(failed_shards)}개가 있어 병합하지 않음 (다시 실행하면 남은 샤드만 수집)")
+        return None
+    
+    # 기간 순서대로 병합하고 고유값 기준 중복 제거
+    # 결과의 수집 시각은 가장 먼저 수집한 샤드 기준 (이전 실행에서 완료된 샤드 포함)
+    collected_at = min((summary['collected_at'] for summary in summaries.values() if summary.get('collected_at')),
+                       default=None)
+    # 샤드 작업 프로세스의 대기열은 메모리에서 비어 있는 채로 시작하므로, 저장된 대기열은 부모 프로세스에서
+    # 샤드 갱신을 합친 뒤 수집 기간 밖 과정의 대기열 조회를 병합 결과에 한 번만 수행
+    due_collector = None
+    if employment_queue_path:
+        due_collector = AutomatedKDTDataCollector(
+            max_workers=max_workers, requests_per_second=requests_per_second, cache_path=cache_path,
+            employment_queue_path=employment_queue_path, checkpoint_dir=None, metrics_path=None,
+            response_format=response_format
+        )
+        if base_urls:
+            due_collector.base_urls.update(base_urls)
+    
+    with open_sink(output_path, start_date=start_date, end_date=end_date,
+                   collected_at=datetime.fromisoformat(collected_at) if collected_at else None) as sink:
+        shard_keys = merge_shards(store, shards, sink)
+        if due_collector:
+            scheduler = due_collector.employment_scheduler
+            for shard_range in shards:
+                summary = summaries.get(shard_range, {})
+                scheduler.merge_updates(summary.get('employment_queue', {}), shard_keys[shard_range],
+                                        summary.get('skipped', 0))
+            listed_keys = {key for keys in shard_keys.values() for key in keys}
+            previous_rows = load_snapshot(previous_path) if previous_path else {}
+            due_rows = due_collector.collect_due_employment(listed_keys, previous_rows)
+            due_collector.write_processed_rows(due_rows, sink)
+    row_count = sink.rows_written
+    
+    if due_collector:
+        due_collector.employment_scheduler.save_queue()
+        if due_collector.failed_fetches:
+            logging.error(f"대기열 취업 통계 조회 실패 {len(due_collector.failed_fetches)}개 "
+                          f"(이전 결과 값으로 저장, 대기열에 남아 다음 실행에서 다시 조회)")
+    
+    store.remove(shards)
+    metrics.log_summary(metrics.write())
+    elapsed = time.perf_counter() - started
+    logging.info(f"기간 분할 수집 완료: {row_count}개, {elapsed:.1f}s")
+    return row_count
+
+
+def run_headless(args):
+    """GUI 없이 지정한 기간을 수집해 결과 파일로 저장 (서버 예약 실행용)"""
+    output_path = args.output or f"kdt_automated_complete_{args.start}_{args.end}.csv"
+    
+    if args.shard == 'none':
+        collector = AutomatedKDTDataCollector(max_workers=args.workers, requests_per_second=args.rps,
+                                              response_format=args.format)
+        try:
+            with open_sink(output_path, start_date=args.start, end_date=args.end) as sink:
+                row_count = collector.collect_and_process_data(args.start, args.end, sink=sink,
+                                                               previous_path=args.previous,
+                                                               previous_date=args.previous_date)
+        except Work24TransportError as e:
+            # 기본 과정 목록을 끝까지 조회하지 못하면 일부 목록으로 결과를 만들지 않음
+            logging.error(f"기본 과정 정보 수집 실패: {e}")
+            return 1
+        if row_count and collector.failed_fetches:
+            # 실패한 과정이 있으면 체크포인트를 남겨 재실행 시 실패한 과정만 다시 조회
+            logging.error(f"조회 실패 {len(collector.failed_fetches)}개 과정은 빈 값으로 저장됨: {output_path}")
+            return 1
+        if row_count:
+            collector.clear_checkpoint(args.start, args.end)
+    else:
+        row_count = collect_sharded(
+            args.start, args.end, output_path, shard=args.shard, processes=args.processes,
+            max_workers=args.workers, requests_per_second=args.rps, shard_dir=args.shard_dir,
+            response_format=args.format, previous_path=args.previous, previous_date=args.previous_date
+        )
+    
+    if not row_count:
+        logging.error("데이터 수집에 실패했습니다.")
+        return 1
+    logging.info(f"저장 위치: {output_path} ({row_count}개 과정)")
+    return 0
+
 
 class AutomatedKDTDataCollectorGUI:
     def __init__(self):
+        if Tk is None:
+            raise ImportError("GUI 실행에는 tkinter 와 tkcalendar 가 필요합니다 (서버에서는 --start/--end 로 헤드리스 실행)")
         self.collector = AutomatedKDTDataCollector()
         self.setup_gui()
     
@@ -545,39 +1196,33 @@ class AutomatedKDTDataCollectorGUI:
         """완전 자동화 데이터 수집 시작"""
         def collect_and_process():
             try:
-                # 완전 자동화 데이터 수집 및 처리
-                data = self.collector.collect_and_process_data(
-                    start_date, 
-                    end_date, 
-                    self.update_progress
-                )
+                # 완전 자동화 데이터 수집 및 처리 (계산된 행을 chunk 단위로 바로 파일에 기록)
+                output_path = f"kdt_automated_complete_{start_date}_{end_date}.csv"
+                with open_sink(output_path) as sink:
+                    row_count = self.collector.collect_and_process_data(
+                        start_date, 
+                        end_date, 
+                        self.update_progress,
+                        sink=sink
+                    )
                 
-                if data:
-                    # 파일 저장
-                    self.update_progress("파일 저장 중...", 95)
-                    output_path = f"kdt_automated_complete_{start_date}_{end_date}.csv"
-                    
-                    # DataFrame 생성 및 저장
-                    df = pd.DataFrame(data)
-                    
-                    # 컬럼 순서 정리 (현재 CSV와 동일하게)
-                    column_order = [
-                        '고유값', '과정명', '훈련과정 ID', '회차', '훈련기관', '총 훈련일수', '총 훈련시간',
-                        '과정시작일', '과정종료일', 'NCS명', 'NCS코드', '훈련비', '정원', '수강신청 인원',
-                        '수료인원', '수료율', '만족도', '취업인원 (3개월)', '취업률 (3개월)',
-                        '취업인원 (6개월)', '취업률 (6개월)', '지역', '주소', '과정페이지 링크',
-                        '선도기업', '파트너기관', '매출 최소', '실 매출 대비', '매출 최대',
-                        '2021년', '2022년', '2023년', '2024년', '2025년', '2026년'
-                    ]
-                    
-                    df = df.reindex(columns=column_order)
-                    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+                failed_count = len(self.collector.failed_fetches)
+                if row_count and failed_count:
+                    # 실패한 과정만 다음 실행에서 다시 조회하도록 체크포인트 유지
+                    self.root.after(0, lambda: messagebox.showwarning("일부 실패", 
+                        f"{failed_count}개 과정의 상세/취업 통계 조회에 실패해 빈 값으로 저장했습니다.\n"
+                        f"같은 기간으로 다시 실행하면 실패한 과정만 다시 조회합니다.\n\n📁 저장 위치: {output_path}"))
+                    self.update_progress(f"⚠️ 조회 실패 {failed_count}개", 100)
+                
+                elif row_count:
+                    # 결과 파일이 저장되었으므로 재개용 체크포인트 삭제
+                    self.collector.clear_checkpoint(start_date, end_date)
                     
                     self.root.after(0, lambda: messagebox.showinfo("완료!", 
                         f"""🎉 완전 자동화 데이터 수집 완료!
                         
 📁 저장 위치: {output_path}
-📊 총 {len(data)}개 과정 데이터 수집
+📊 총 {row_count}개 과정 데이터 수집
 🤖 모든 계산 자동 완료:
    • 선도기업/파트너기관 판단
    • 매출 최소/최대 계산  
@@ -598,6 +1243,30 @@ class AutomatedKDTDataCollectorGUI:
         thread = threading.Thread(target=collect_and_process, daemon=True)
         thread.start()
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KDT 데이터 자동 수집기 (기간을 지정하지 않으면 GUI 실행)")
+    parser.add_argument('--start', help="수집 시작일 (YYYYMMDD)")
+    parser.add_argument('--end', help="수집 종료일 (YYYYMMDD)")
+    parser.add_argument('--output', help="결과 파일 (.csv 또는 .parquet), 끝이 / 인 디렉터리면 과정시작일 연/월 파티션 데이터셋")
+    parser.add_argument('--shard', choices=['month', 'week', 'none'], default='month', help="기간 분할 단위")
+    parser.add_argument('--processes', type=int, default=4, help="동시에 수집할 샤드 수 (프로세스 수)")
+    parser.add_argument('--workers', type=int, default=8, help="프로세스별 동시 요청 수")
+    parser.add_argument('--rps', type=float, default=20, help="전체 프로세스 합계 초당 요청 수")
+    parser.add_argument('--shard-dir', default='kdt_shards', help="샤드 결과 임시 저장 위치")
+    parser.add_argument('--previous', help="이전 결과 파일 또는 파티션 데이터셋 (지정하면 바뀐 과정만 다시 조회하는 델타 수집)")
+    parser.add_argument('--previous-date', type=lambda value: datetime.strptime(value, '%Y-%m-%d'),
+                        help="이전 결과를 수집한 날짜 (YYYY-MM-DD, 기본: 결과에 기록된 수집 시각)")
+    parser.add_argument('--format', choices=['xml', 'xml-stream', 'json'], default='xml-stream',
+                        help="310L02/310L03 응답 형식 및 디코더")
+    args = parser.parse_args(argv)
+    
+    if not args.start and not args.end:
+        app = AutomatedKDTDataCollectorGUI()
+        app.root.mainloop()
+        return 0
+    if not (args.start and args.end):
+        parser.error("--start 와 --end 를 함께 지정해야 합니다")
+    return run_headless(args)
+
 if __name__ == "__main__":
-    app = AutomatedKDTDataCollectorGUI()
-    app.root.mainloop()
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""자동 계산 단계 벤치마크 (기존 dict 단위 루프 vs DataFrame 컬럼 단위 계산)
+
+사용법: python benchmarks/bench_calculations.py [과정 수]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automated_kdt_data_collector import AutomatedKDTDataCollector
+from benchmarks.work24_server import make_course
+
+YEAR_COLUMNS = [f'{year}년' for year in range(2021, 2027)]
+RESULT_COLUMNS = ['선도기업', '파트너기관', '매출 최소', '실 매출 대비', '매출 최대'] + YEAR_COLUMNS
+
+
+def make_rows(course_count):
+    """수집 직후 형태의 과정 dict 목록 (기존 루프가 처리할 수 있도록 시작일은 28일 이하)"""
+    collector = AutomatedKDTDataCollector(cache_path=None, employment_queue_path=None, checkpoint_dir=None)
+    institutions = ['대한상공회의소', '한국표준협회지부', '폴리텍대학', '테스트훈련기관']
+    rows = []
+    for index in range(course_count):
+        row = collector.build_basic_info(make_course(index))
+        start = pd.Timestamp(row['과정시작일'])
+        row['과정시작일'] = start.replace(day=min(start.day, 28)).strftime('%Y-%m-%d')
+        row['훈련기관'] = f"{institutions[index % len(institutions)]}{'' if index % 3 else index}"
+        row['수료율'] = f"{(index * 7) % 100}.0%"
+        if index % 11 == 0:
+            row['과정명'] = f"선도기업 {row['과정명']}"
+        rows.append(row.to_row())
+    return collector, rows
+
+
+def apply_dict_loop(calculator, data):
+    """변경 전 apply_automated_calculations (과정마다 계산 메서드 3개 호출)"""
+    processed_data = []
+    for course in data:
+        revenue_dist = calculator.calculate_revenue_distribution(course)
+        yearly_revenues = calculator.calculate_course_revenue(course)
+        total_revenue = sum(yearly_revenues.values()) if isinstance(yearly_revenues, dict) else yearly_revenues
+
+        processed_course = course.copy()
+        processed_course['선도기업'] = 'Y' if revenue_dist['is_leading_company'] else 'N'
+        processed_course['파트너기관'] = revenue_dist['partner_institution']
+        processed_course['매출 최소'] = total_revenue * 0.8
+        processed_course['실 매출 대비'] = total_revenue
+        processed_course['매출 최대'] = total_revenue * 1.2
+
+        if isinstance(yearly_revenues, dict):
+            for year in range(2021, 2027):
+                processed_course[f'{year}년'] = yearly_revenues.get(year, 0)
+        else:
+            current_year = datetime.now().year
+            for year in range(2021, 2027):
+                processed_course[f'{year}년'] = yearly_revenues if year == current_year else 0
+        processed_data.append(processed_course)
+    return processed_data
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    collector, rows = make_rows(course_count)
+
+    started = time.perf_counter()
+    expected = pd.DataFrame(apply_dict_loop(collector.calculator, rows))
+    loop_elapsed = time.perf_counter() - started
+    print(f"dict 루프:      {loop_elapsed:.2f}s ({course_count / loop_elapsed:,.0f}행/s)")
+
+    frame = pd.DataFrame(rows)
+    started = time.perf_counter()
+    result = collector.apply_automated_calculations_frame(frame)
+    frame_elapsed = time.perf_counter() - started
+    print(f"DataFrame 계산: {frame_elapsed:.2f}s ({course_count / frame_elapsed:,.0f}행/s, "
+          f"{loop_elapsed / frame_elapsed:.0f}배)")
+
+    for column in RESULT_COLUMNS:
+        if column in ('선도기업', '파트너기관'):
+            same = (expected[column].fillna('') == result[column]).all()
+        else:
+            same = np.array_equal(expected[column].astype(float), result[column].astype(float))
+        assert same, f"{column} 결과 불일치"
+    print("결과 일치 확인 완료")
+
+
+if __name__ == '__main__':
+    main()
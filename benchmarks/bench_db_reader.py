@@ -0,0 +1,106 @@
+"""courses 테이블 조회 벤치마크 (전체 SELECT 후 pandas 필터 vs WHERE 절 조건 + chunk 조회), 로컬 SQLite 사용
+
+조회 전에 upsert_courses → read_courses 왕복으로 모든 컬럼 값이 원본과 같은지 확인합니다.
+
+사용법: python benchmarks/bench_db_reader.py [행 수]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import MetaData, Table, create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_loaders import make_result_frame
+from kdt_dataset_module.utils.database import (
+    COURSE_COLUMNS, courses_query, create_courses_table, read_courses, upsert_courses,
+)
+from kdt_dataset_module.utils.schema import NUMERIC_KINDS, RESULT_KDTDATA_SCHEMA, apply_schema
+
+
+def pandas_filter(df, institutions=None, start_date=None, end_date=None, training_types=None):
+    """변경 전 방식: 전체 행을 읽은 뒤 pandas 로 거름"""
+    mask = pd.Series(True, index=df.index)
+    if institutions:
+        mask &= df['훈련기관'].isin(institutions) | df['파트너기관'].isin(institutions)
+    start = pd.to_datetime(df['과정시작일'])
+    if start_date:
+        mask &= start >= pd.Timestamp(start_date)
+    if end_date:
+        mask &= start <= pd.Timestamp(end_date)
+    if training_types:
+        mask &= df['훈련유형'].isin(training_types)
+    return df[mask]
+
+
+def assert_round_trip(engine, frame):
+    """DB 에서 다시 읽은 행이 원본과 같은지 확인 (숫자/날짜는 스키마 타입 값, 나머지는 빈 값을 '' 로 본 문자열)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        actual = read_courses(engine, categories=False).set_index('고유값').sort_index()
+    expected = apply_schema(frame.copy(), categories=False).set_index('고유값').sort_index()
+    assert list(actual.index) == list(expected.index), "고유값 목록이 다릅니다"
+
+    for column in COURSE_COLUMNS:
+        if column == '고유값':
+            continue
+        kind = RESULT_KDTDATA_SCHEMA[column]
+        if kind in NUMERIC_KINDS:
+            left, right = actual[column].astype(float), expected[column].astype(float)
+        elif kind == 'date':
+            left, right = actual[column], expected[column]
+        else:
+            left, right = actual[column].fillna('').astype(str), expected[column].fillna('').astype(str)
+        pd.testing.assert_series_equal(left, right, check_names=False, obj=column)
+    print(f"왕복 확인: {len(actual):,}행 x {len(COURSE_COLUMNS)}개 컬럼 일치")
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'courses.db')}")
+        create_courses_table(engine)
+        frame = make_result_frame(row_count)
+        with contextlib.redirect_stdout(io.StringIO()):
+            upsert_courses(engine, frame, batch_size=5000)
+        print(f"SQLite courses {row_count:,}행")
+        assert_round_trip(engine, frame)
+
+        institutions = ['테스트훈련기관1', '테스트훈련기관2', '테스트훈련기관3']
+        views = {
+            '기관 3곳': {'institutions': institutions},
+            '기관 3곳 + 2023년': {'institutions': institutions, 'start_date': '2023-01-01', 'end_date': '2023-12-31'},
+            '2024년 상반기': {'start_date': '2024-01-01', 'end_date': '2024-06-30'},
+            '훈련유형 1개 + 2022년': {'training_types': ['재직자'], 'start_date': '2022-01-01', 'end_date': '2022-12-31'},
+        }
+
+        started = time.perf_counter()
+        everything = pd.read_sql('SELECT * FROM courses', engine)
+        full_read = time.perf_counter() - started
+        memory = everything.memory_usage(deep=True).sum() / 1e6
+        print(f"{'전체 SELECT *':<22} {full_read:>7.3f}초  {len(everything):>7,}행  {memory:>7.1f}MB")
+
+        table = Table('courses', MetaData(), autoload_with=engine)
+        for name, filters in views.items():
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                df = read_courses(engine, chunksize=2000, **filters)
+            elapsed = time.perf_counter() - started
+            expected = pandas_filter(everything, **filters)
+            assert sorted(df['고유값']) == sorted(expected['고유값']), name
+            memory = df.memory_usage(deep=True).sum() / 1e6
+            print(f"{name:<22} {elapsed:>7.3f}초  {len(df):>7,}행  {memory:>7.1f}MB")
+
+            query = courses_query(table, **filters).compile(engine, compile_kwargs={'literal_binds': True})
+            with engine.connect() as connection:
+                plan = [row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {query}"))]
+            print(f"{'':<22} {' / '.join(plan)}")
+
+
+if __name__ == '__main__':
+    main()
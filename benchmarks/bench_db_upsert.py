@@ -0,0 +1,101 @@
+"""courses 테이블 upsert 벤치마크 (batch 크기별 행/초), 로컬 SQLite 사용
+
+같은 결과를 두 번 넣을 때 행 수가 그대로이고 바뀐 행만 갱신되는지, 대시보드 컬럼(조정_*)은 유지되는지,
+테이블에 없는 결과 컬럼은 오류로 알리는지도 확인합니다.
+
+사용법: python benchmarks/bench_db_upsert.py [행 수]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import Column, MetaData, Numeric, Table, Text, create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_loaders import make_result_frame
+from kdt_dataset_module.utils.database import COURSE_COLUMNS, create_courses_table, upsert_courses
+
+
+def quiet(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def assert_idempotent(engine, frame):
+    """두 번째 적재에서 바뀐 행만 갱신되고 행 수와 조정_* 값은 그대로인지 확인"""
+    with engine.begin() as connection:
+        connection.execute(text('ALTER TABLE courses ADD COLUMN "조정_누적매출" NUMERIC'))
+        connection.execute(text('UPDATE courses SET "조정_누적매출" = 1'))
+
+    changed = frame.copy()
+    key = changed.loc[0, '고유값']
+    changed.loc[0, '과정명'] = '변경된 과정명'
+    changed.loc[0, '수료인원'] = 999
+    changed.loc[0, '누적매출'] = '1,234,567'
+    quiet(upsert_courses, engine, changed, batch_size=500)
+
+    with engine.connect() as connection:
+        count = connection.execute(text('SELECT COUNT(*) FROM courses')).scalar()
+        row = connection.execute(
+            text('SELECT "과정명", "수료인원", "누적매출", "조정_누적매출" FROM courses WHERE "고유값" = :key'),
+            {'key': key},
+        ).one()
+        unchanged = connection.execute(
+            text('SELECT "과정명" FROM courses WHERE "고유값" = :key'), {'key': frame.loc[1, '고유값']}
+        ).scalar()
+    assert count == len(frame), (count, len(frame))
+    assert (row[0], float(row[1]), float(row[2]), float(row[3])) == ('변경된 과정명', 999.0, 1234567.0, 1.0), row
+    assert unchanged == frame.loc[1, '과정명'], unchanged
+    print(f"재적재 확인: {count:,}행 유지, 바뀐 행 갱신, 조정_누적매출 유지")
+
+
+def assert_missing_columns_rejected(engine, frame):
+    """결과 컬럼이 빠진 테이블은 오류, add_missing_columns 이면 컬럼을 추가해 기록"""
+    Table('courses_old', MetaData(), Column('고유값', Text, primary_key=True), Column('과정명', Text),
+          Column('수료인원', Numeric)).create(engine)
+    try:
+        quiet(upsert_courses, engine, frame.head(10), table_name='courses_old')
+    except ValueError as e:
+        assert '누적매출' in str(e), e
+    else:
+        raise AssertionError("테이블에 없는 컬럼이 있는데 upsert 가 성공했습니다")
+
+    quiet(upsert_courses, engine, frame.head(10), table_name='courses_old', add_missing_columns=True)
+    with engine.connect() as connection:
+        total = connection.execute(text('SELECT SUM("누적매출") FROM courses_old')).scalar()
+    expected = frame.head(10)['누적매출'].str.replace(',', '').astype(float).sum()
+    assert float(total) == expected, (total, expected)
+    print(f"없는 컬럼 확인: 오류 후 add_missing_columns 로 {len(COURSE_COLUMNS) - 3}개 컬럼 추가")
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    frame = make_result_frame(row_count)
+    print(f"courses {row_count:,}행")
+
+    for batch_size in (1, 100, 500, 2000):
+        rows = row_count if batch_size > 1 else min(row_count, 2000)
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{os.path.join(directory, 'courses.db')}")
+            create_courses_table(engine)
+            result = quiet(upsert_courses, engine, frame.head(rows), batch_size=batch_size)
+            engine.dispose()
+        print(f"batch {batch_size:>5}  {result['seconds']:>7.2f}초  {result['rows_per_second']:>10,.0f}행/초  "
+              f"({result['rows']:,}행)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'courses.db')}")
+        create_courses_table(engine)
+        quiet(upsert_courses, engine, frame, batch_size=500)
+        assert_idempotent(engine, frame)
+        assert_missing_columns_rejected(engine, frame)
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
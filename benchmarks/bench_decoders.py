@@ -0,0 +1,99 @@
+"""310L02/310L03 응답 디코더 마이크로 벤치마크 (ElementTree 전체 파싱 vs iterparse 스트리밍 vs JSON)
+
+사용법:
+    python benchmarks/bench_decoders.py                          # 가짜 응답 (기관 상세 정보 목록 포함)
+    python benchmarks/bench_decoders.py fixtures/work24_202401.zip  # 녹화한 실제 응답
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.work24_server import detail_json, detail_xml, employment_json, employment_xml
+from kdt_collector.decoders import (
+    DETAIL_FIELDS, DETAIL_RECORD, EMPLOYMENT_FIELDS, EMPLOYMENT_RECORD, JsonDecoder, get_decoder
+)
+
+RECORDS = {'detail': (DETAIL_RECORD, DETAIL_FIELDS), 'employment': (EMPLOYMENT_RECORD, EMPLOYMENT_FIELDS)}
+
+
+def padded_detail_xml(params, extra_items=200):
+    """실제 310L02 처럼 inst_base_info 뒤에 시설/장비 목록이 길게 붙은 응답"""
+    base = detail_xml(params).decode('utf-8').replace('</HRDNet>', '')
+    items = ''.join(
+        f"<inst_facility_info><trafaNm>강의실{i}</trafaNm><holdQy>1</holdQy><ocuAcptnNmprCn>30</ocuAcptnNmprCn>"
+        f"<fcltyArCn>66</fcltyArCn></inst_facility_info>"
+        for i in range(extra_items)
+    )
+    return f"{base}{items}</HRDNet>".encode('utf-8')
+
+
+def synthetic_payloads():
+    params = {'srchTrprId': 'AIG20210000001', 'srchTrprDegr': '1', 'srchTorgId': '500000001'}
+    return {
+        ('detail', 'XML'): [detail_xml(params), padded_detail_xml(params)],
+        ('detail', 'JSON'): [detail_json(params)],
+        ('employment', 'XML'): [employment_xml(params)],
+        ('employment', 'JSON'): [employment_json(params)],
+    }
+
+
+def archive_payloads(path):
+    from benchmarks.fixtures import FixtureArchive
+
+    archive = FixtureArchive(path)
+    payloads = {}
+    for endpoint, bodies in (('detail', archive.detail_bodies), ('employment', archive.employment_bodies)):
+        return_type = 'JSON' if 'json' in archive.content_types.get(endpoint, '') else 'XML'
+        payloads[(endpoint, return_type)] = list(bodies.values())
+    return payloads
+
+
+def measure(decoder, bodies, record_tag, fields, min_seconds=0.5):
+    """min_seconds 이상 반복해 응답 1건당 평균 디코딩 시간(us)과 결과 반환"""
+    results = [decoder.decode(body, record_tag, fields) for body in bodies]
+    iterations = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < min_seconds:
+        for body in bodies:
+            decoder.decode(body, record_tag, fields)
+        iterations += len(bodies)
+    return (time.perf_counter() - started) / iterations * 1e6, results
+
+
+def main():
+    payloads = archive_payloads(sys.argv[1]) if len(sys.argv) > 1 else synthetic_payloads()
+
+    for (endpoint, return_type), bodies in payloads.items():
+        if not bodies:
+            continue
+        record_tag, fields = RECORDS[endpoint]
+        average_bytes = sum(len(body) for body in bodies) / len(bodies)
+        print(f"[{endpoint}] {return_type} 응답 {len(bodies)}건, 평균 {average_bytes:,.0f}바이트")
+
+        if return_type == 'JSON':
+            elapsed, _ = measure(JsonDecoder(), bodies, record_tag, fields)
+            print(f"  {'json':<11} {elapsed:8.1f}us")
+            continue
+
+        baseline = None
+        for name in ('xml', 'xml-stream'):
+            elapsed, results = measure(get_decoder(name), bodies, record_tag, fields)
+            if baseline is None:
+                baseline = (elapsed, results)
+                print(f"  {name:<11} {elapsed:8.1f}us")
+            else:
+                assert results == baseline[1], f"{name} 결과가 ElementTree 와 다름"
+                print(f"  {name:<11} {elapsed:8.1f}us ({baseline[0] / elapsed:.1f}배, 결과 일치)")
+
+        # 응답별 크기 차이가 크면 (기관 상세 목록 등) 크기별로도 표시
+        if len(bodies) > 1 and len({len(body) for body in bodies}) > 1 and len(bodies) <= 4:
+            for body in bodies:
+                full, _ = measure(get_decoder('xml'), [body], record_tag, fields, min_seconds=0.2)
+                stream, _ = measure(get_decoder('xml-stream'), [body], record_tag, fields, min_seconds=0.2)
+                print(f"    {len(body):>7,}바이트: xml {full:8.1f}us, xml-stream {stream:8.1f}us")
+
+
+if __name__ == '__main__':
+    main()
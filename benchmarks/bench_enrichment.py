@@ -0,0 +1,58 @@
+"""상세/취업 정보 수집 단계 벤치마크 (기존 순차 루프 vs 동시 요청 엔진)
+
+사용법: python benchmarks/bench_enrichment.py [과정 수] [서버 지연(초)]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automated_kdt_data_collector import AutomatedKDTDataCollector
+from benchmarks.work24_server import start_server
+
+
+def run_sequential(collector, basic_data):
+    """변경 전 방식: 과정마다 순차 호출 후 0.1초 대기"""
+    enriched = []
+    for item in basic_data:
+        detail_info = collector.fetch_detail_data(item['훈련과정 ID'], item['회차'], item['훈련기관ID'])
+        employment_info = collector.fetch_employment_data(item['훈련과정 ID'], item['회차'], item['훈련기관ID'])
+        enriched.append({**item.to_row(), **detail_info, **employment_info})
+        time.sleep(0.1)
+    return enriched
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+    server, base_urls = start_server(course_count=course_count, latency=latency)
+
+    collector = AutomatedKDTDataCollector(requests_per_second=0, cache_path=None)
+    collector.base_urls.update(base_urls)
+    basic_data = collector.fetch_basic_data('20210101', '20261231')
+    print(f"과정 수: {len(basic_data)}, 서버 지연: {latency * 1000:.0f}ms")
+
+    started = time.perf_counter()
+    baseline = run_sequential(collector, basic_data)
+    baseline_elapsed = time.perf_counter() - started
+    print(f"순차 + 0.1초 대기: {baseline_elapsed:.2f}s ({len(baseline) / baseline_elapsed:.1f} 과정/s)")
+
+    for max_workers in (4, 8, 16, 32):
+        collector = AutomatedKDTDataCollector(max_workers=max_workers, requests_per_second=0, cache_path=None)
+        collector.base_urls.update(base_urls)
+
+        started = time.perf_counter()
+        enriched = collector.engine.map(collector.enrich_course, basic_data)
+        elapsed = time.perf_counter() - started
+
+        assert [row['고유값'] for row in enriched] == [row['고유값'] for row in baseline]
+        print(f"동시 요청 {max_workers:>2}개: {elapsed:.2f}s "
+              f"({len(enriched) / elapsed:.1f} 과정/s, {baseline_elapsed / elapsed:.1f}배)")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
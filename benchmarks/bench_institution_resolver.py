@@ -0,0 +1,103 @@
+"""기관명 그룹화 벤치마크 (기존 전체 순회 vs 색인 + 캐시)
+
+사용법: python benchmarks/bench_institution_resolver.py [기관명 수] [추가 그룹 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automated_kdt_data_collector import KDTDataCalculator
+from kdt_collector.institution_resolver import InstitutionResolver
+
+SYLLABLES = '가나다라마바사아자차카타파하한국대학교육기술산업폴리텍전문협회상공'
+
+
+def scan_group(calculator, institution_name, similarity_threshold=0.6):
+    """변경 전 group_institutions_advanced (그룹과 변형명을 매번 전체 순회)"""
+    if not institution_name:
+        return institution_name
+    for group_name, variants in calculator.institution_groups.items():
+        if institution_name in variants:
+            return group_name
+    for group_name, variants in calculator.institution_groups.items():
+        for variant in variants:
+            if calculator.calculate_similarity(institution_name, variant) >= similarity_threshold:
+                return group_name
+    return institution_name
+
+
+def make_groups(base_groups, extra_count, rng):
+    groups = dict(base_groups)
+    for index in range(extra_count):
+        name = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 10)))
+        groups[f"{name}{index}"] = [name, f"{name}지부", name[1:] or name]
+    return groups
+
+
+def make_names(groups, name_count, rng):
+    variants = [variant for values in groups.values() for variant in values]
+    names = []
+    for _ in range(name_count):
+        kind = rng.random()
+        if kind < 0.3:
+            names.append(rng.choice(variants))
+        elif kind < 0.7:
+            variant = rng.choice(variants)
+            names.append(variant[:rng.randint(1, len(variant))] + ''.join(
+                rng.choice(SYLLABLES) for _ in range(rng.randint(0, 6))))
+        elif kind < 0.95:
+            names.append(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 12))))
+        else:
+            names.append('')
+    return names
+
+
+def main():
+    name_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    extra_groups = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng = random.Random(0)
+
+    calculator = KDTDataCalculator()
+    calculator.institution_groups = make_groups(calculator.institution_groups, extra_groups, rng)
+    names = make_names(calculator.institution_groups, name_count, rng)
+    print(f"그룹 {len(calculator.institution_groups)}개, 기관명 {name_count}개 (고유 {len(set(names))}개)")
+
+    started = time.perf_counter()
+    expected = [scan_group(calculator, name) for name in names]
+    scan_elapsed = time.perf_counter() - started
+    print(f"전체 순회:   {scan_elapsed:.2f}s ({name_count / scan_elapsed:,.0f}건/s)")
+
+    started = time.perf_counter()
+    resolver = InstitutionResolver(calculator.institution_groups)
+    build_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    result = [resolver.resolve(name) for name in names]
+    resolve_elapsed = time.perf_counter() - started
+    print(f"색인 + 캐시: {resolve_elapsed:.3f}s ({name_count / resolve_elapsed:,.0f}건/s, "
+          f"{scan_elapsed / resolve_elapsed:.0f}배), 색인 생성 {build_elapsed:.3f}s, {resolver.cache_info()}")
+
+    for threshold in (0.3, 0.6, 0.9):
+        uncached = InstitutionResolver(calculator.institution_groups, cache_size=0)
+        assert [uncached.resolve(name, threshold) for name in names[:3000]] == \
+            [scan_group(calculator, name, threshold) for name in names[:3000]], f"임계값 {threshold} 결과 불일치"
+    assert result == expected, "결과 불일치"
+    assert [calculator.group_institutions_advanced(name) for name in names] == expected
+    print("결과 일치 확인 완료")
+
+    # 그룹 규칙은 읽기 전용이고, 새 규칙을 대입하면 색인도 새로 만들어야 함
+    try:
+        calculator.institution_groups['새 그룹'] = ['새 기관명']
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("그룹 규칙을 제자리에서 수정할 수 있습니다")
+    calculator.institution_groups = {'새 그룹': ['새 기관명'], **calculator.institution_groups}
+    assert calculator.group_institutions_advanced('새 기관명') == '새 그룹'
+    print("그룹 규칙 변경 반영 확인 완료")
+
+
+if __name__ == '__main__':
+    main()
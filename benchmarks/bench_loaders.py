@@ -0,0 +1,167 @@
+"""대시보드 로더 벤치마크 (기본 dtype 으로 읽은 뒤 변환 vs utils.schema 로 필요한 컬럼만 타입 지정해 읽기)
+
+사용법: python benchmarks/bench_loaders.py [CSV 행 수] [엑셀 행 수]
+"""
+import io
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kdt_dataset_module.utils.schema import RESULT_KDTDATA_SCHEMA, columns_of_kind, read_result_csv, read_result_excel
+
+YEAR_COLUMNS = ['2021년', '2022년', '2023년', '2024년', '2025년', '2026년']
+
+
+def make_result_frame(row_count, seed=0):
+    """result_kdtdata 와 같은 컬럼 구성의 가짜 데이터 (매출은 쉼표가 들어간 문자열)"""
+    rng = random.Random(seed)
+    institutions = [f"테스트훈련기관{index}" for index in range(800)]
+    ncs_names = [f"NCS분류{index}" for index in range(120)]
+    regions = ['서울', '경기', '부산', '대구', '인천', '광주', '대전', '온라인']
+    types = ['대학주도형', 'K-디지털 트레이닝', '재직자', '선도기업형', '신기술 파트너']
+    rows = []
+    for index in range(row_count):
+        start = pd.Timestamp('2021-01-04') + pd.Timedelta(days=rng.randint(0, 1800))
+        applied = rng.randint(0, 40)
+        finished = rng.randint(0, applied)
+        fee = rng.randint(50, 200) * 100000
+        revenue = fee * finished
+        row = {
+            '고유값': f"AIG{index:011d}_{rng.randint(1, 9)}_{fee}_0",
+            '과정명': f"테스트 과정 {index % 5000}",
+            '훈련과정 ID': f"AIG{index:011d}",
+            '회차': rng.randint(1, 9),
+            '훈련기관': rng.choice(institutions),
+            '총 훈련일수': rng.randint(20, 200),
+            '총 훈련시간': rng.randint(100, 1000),
+            '과정시작일': start.strftime('%Y-%m-%d'),
+            '과정종료일': (start + pd.Timedelta(days=150)).strftime('%Y-%m-%d'),
+            'NCS명': rng.choice(ncs_names),
+            'NCS코드': f"{rng.randint(0, 20):02d}0{rng.randint(1000, 9999)}",
+            '훈련비': fee,
+            '정원': 40,
+            '수강신청 인원': applied,
+            '수료인원': finished,
+            '수료율': round(finished / applied * 100, 1) if applied else '',
+            '만족도': round(rng.uniform(80, 100), 1),
+            '취업인원 (3개월)': rng.randint(0, finished),
+            '취업률 (3개월)': round(rng.uniform(0, 100), 1),
+            '취업인원 (6개월)': rng.randint(0, finished),
+            '취업률 (6개월)': round(rng.uniform(0, 100), 1),
+            '지역': rng.choice(regions),
+            '주소': f"{rng.choice(regions)}시 테스트로 {rng.randint(1, 999)}",
+            '과정페이지 링크': f"https://www.work24.go.kr/course?id=AIG{index:011d}",
+            '선도기업': rng.choice(['', '', '', '테스트선도기업']),
+            '파트너기관': rng.choice(['', '', '', rng.choice(institutions)]),
+            '매출 최소': f"{int(revenue * 0.9):,}",
+            '실 매출 대비': f"{revenue:,}",
+            '매출 최대': f"{int(revenue * 1.1):,}",
+            '누적매출': f"{revenue:,}",
+            '훈련유형': rng.choice(types),
+        }
+        for year in YEAR_COLUMNS:
+            row[year] = f"{revenue:,}" if year[:4] == start.strftime('%Y') else '0'
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def to_number(series):
+    return pd.to_numeric(series.astype(str).str.replace(',', ''), errors='coerce')
+
+
+def old_machinelearning(source):
+    """변경 전 machinelearning_kdt.load_and_preprocess_data 의 읽기/변환"""
+    df = pd.read_csv(source, encoding='utf-8')
+    if df['2025년'].dtype == object:
+        df['2025년'] = to_number(df['2025년']).fillna(0)
+    df['과정시작일'] = pd.to_datetime(df['과정시작일'], errors='coerce')
+    for column in ['수강신청 인원', '수료인원', '누적매출']:
+        if df[column].dtype == object:
+            df[column] = to_number(df[column])
+    return df
+
+
+def old_excel(source, year_columns):
+    """변경 전 app.load_data / streamlit_app.load_data 의 읽기 + 매출 변환"""
+    df = pd.read_excel(source, engine='openpyxl')
+    df.columns = df.columns.str.strip()
+    for column in year_columns:
+        df[column] = to_number(df[column])
+    return df
+
+
+def measure(name, load, repeat=3):
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        df = load()
+        elapsed.append(time.perf_counter() - started)
+    memory = df.memory_usage(deep=True).sum() / 1e6
+    print(f"{name:<34} {min(elapsed):>7.3f}초  {memory:>8.1f}MB  {df.shape[1]:>3}개 컬럼")
+    return df
+
+
+def measure_pair(old_name, old_load, new_name, new_load, repeat=5):
+    """두 로더를 번갈아 실행해 측정 (느린 엑셀 읽기에서 시스템 부하 변화가 한쪽에만 몰리지 않게)"""
+    elapsed = {old_name: [], new_name: []}
+    frames = {}
+    for _ in range(repeat):
+        for name, load in ((old_name, old_load), (new_name, new_load)):
+            started = time.perf_counter()
+            frames[name] = load()
+            elapsed[name].append(time.perf_counter() - started)
+    for name in (old_name, new_name):
+        df = frames[name]
+        memory = df.memory_usage(deep=True).sum() / 1e6
+        print(f"{name:<34} {min(elapsed[name]):>7.3f}초  {memory:>8.1f}MB  {df.shape[1]:>3}개 컬럼")
+    return frames[old_name], min(elapsed[old_name]), frames[new_name], min(elapsed[new_name])
+
+
+def main():
+    csv_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    excel_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    frame = make_result_frame(csv_rows)
+    unknown = [column for column in frame.columns if column not in RESULT_KDTDATA_SCHEMA]
+    assert not unknown, unknown
+    csv_bytes = frame.to_csv(index=False).encode('utf-8')
+    print(f"CSV {csv_rows:,}행 ({len(csv_bytes) / 1e6:.1f}MB)")
+
+    measure("전체 컬럼 기본 dtype", lambda: pd.read_csv(io.BytesIO(csv_bytes)))
+    measure("전체 컬럼 스키마 (category)", lambda: read_result_csv(io.BytesIO(csv_bytes)))
+    old = measure("machinelearning 변경 전", lambda: old_machinelearning(io.BytesIO(csv_bytes)))
+    new = measure("machinelearning 스키마", lambda: read_result_csv(io.BytesIO(csv_bytes), profile='machinelearning'))
+    for column in new.columns:
+        pd.testing.assert_series_equal(
+            new[column].astype(object) if column == '훈련기관' else new[column], old[column],
+            check_dtype=column != '훈련기관', check_names=False,
+        )
+
+    excel = io.BytesIO()
+    make_result_frame(excel_rows).to_excel(excel, index=False, engine='openpyxl')
+    excel_bytes = excel.getvalue()
+    print(f"\n엑셀 {excel_rows:,}행 ({len(excel_bytes) / 1e6:.1f}MB)")
+    old, old_seconds, new, new_seconds = measure_pair(
+        "streamlit_app 변경 전", lambda: old_excel(io.BytesIO(excel_bytes), YEAR_COLUMNS[:4]),
+        "streamlit_app 스키마", lambda: read_result_excel(io.BytesIO(excel_bytes), profile='streamlit_app'),
+    )
+    # 변경 전 경로는 날짜와 연도 외 매출 컬럼을 문자열 그대로 두므로 비교할 때만 변환
+    for column in new.columns:
+        expected = old[column]
+        if column in columns_of_kind('date'):
+            expected = pd.to_datetime(expected)
+        elif column in columns_of_kind('revenue'):
+            expected = to_number(expected)
+        actual = new[column].astype(object) if isinstance(new[column].dtype, pd.CategoricalDtype) else new[column]
+        pd.testing.assert_series_equal(actual, expected, check_dtype=False, check_names=False)
+    # 스키마 경로는 읽은 뒤 변환만 더하므로 변경 전보다 느리면 안 됨 (측정 오차 10% 허용)
+    assert new_seconds <= old_seconds * 1.1, (new_seconds, old_seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""수집 파이프라인 전체(기본 → 상세/취업 → 자동 계산 → CSV 저장) 처리량 및 메모리 벤치마크
+
+로컬 재생 서버(benchmarks/work24_server.py)만 사용하므로 네트워크 없이 실행됩니다.
+규모마다 별도 프로세스에서 수집해 최대 메모리(RSS)를 따로 측정합니다.
+
+사용법:
+    python benchmarks/bench_pipeline.py                            # 가짜 과정 200개 × 1/10/100배
+    python benchmarks/bench_pipeline.py --archive fixtures/work24_202401.zip --scales 1,10
+    python benchmarks/bench_pipeline.py --latency 0.02 --jitter 0.03 --error-rate 0.01
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.work24_server import start_server
+
+try:
+    import resource
+except ImportError:
+    # Windows 에서는 RSS 대신 tracemalloc 측정만 사용
+    resource = None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    # Linux 는 KB, macOS 는 byte 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_collection(base_urls, options, results):
+    """작업 프로세스: 수집기 1회 실행 후 결과를 큐로 전달"""
+    import logging
+    from automated_kdt_data_collector import AutomatedKDTDataCollector
+    from kdt_collector.sinks import CsvSink
+
+    # 벤치마크 출력이 로그에 묻히지 않도록 경고 이상만 표시
+    logging.getLogger().setLevel(logging.WARNING)
+    if options['tracemalloc']:
+        tracemalloc.start()
+
+    collector = AutomatedKDTDataCollector(
+        max_workers=options['workers'], requests_per_second=0, cache_path=None,
+        employment_queue_path=None, checkpoint_dir=None, metrics_path=None
+    )
+    collector.base_urls.update(base_urls)
+    rss_before = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, 'bench.csv')
+        started = time.perf_counter()
+        with CsvSink(output_path) as sink:
+            rows = collector.collect_and_process_data('20210101', '20261231', sink=sink) or 0
+        elapsed = time.perf_counter() - started
+        output_mb = os.path.getsize(output_path) / 1024 / 1024 if rows else 0.0
+
+    snapshot = collector.metrics.snapshot()
+    # 다음 실행 지표에 이전 실행 값이 남지 않는지 (동시 요청 한도 gauge 포함)
+    assert snapshot['gauges'], "수집 후 gauge 가 기록되지 않았습니다"
+    collector.metrics.reset()
+    cleared = collector.metrics.snapshot()
+    assert not cleared['endpoints'] and not cleared['gauges'] and cleared['rows'] == 0, cleared
+
+    results.put({
+        'rows': rows,
+        'elapsed': elapsed,
+        'requests': sum(stats['requests'] for stats in snapshot['endpoints'].values()),
+        'retries': sum(stats['retries'] for stats in snapshot['endpoints'].values()),
+        'p99_ms': max((stats['latency']['p99_seconds'] * 1000 for stats in snapshot['endpoints'].values()),
+                      default=0.0),
+        'rss_before_mb': rss_before,
+        'peak_rss_mb': peak_rss_mb(),
+        'heap_peak_mb': tracemalloc.get_traced_memory()[1] / 1024 / 1024 if options['tracemalloc'] else None,
+        'output_mb': output_mb,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 파이프라인 처리량/메모리 벤치마크 (오프라인)")
+    parser.add_argument('--archive', help="benchmarks/fixtures.py 로 녹화한 아카이브 (없으면 가짜 과정)")
+    parser.add_argument('--courses', type=int, default=200, help="가짜 과정 수 (1배 기준)")
+    parser.add_argument('--scales', default='1,10,100', help="과정 수 배율 목록")
+    parser.add_argument('--latency', type=float, default=0.005, help="서버 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 오류 주입 비율")
+    parser.add_argument('--workers', type=int, default=16, help="수집기 동시 요청 수")
+    parser.add_argument('--tracemalloc', action='store_true', help="Python 힙 최대 사용량도 측정 (느려짐)")
+    args = parser.parse_args()
+
+    options = {'workers': args.workers, 'tracemalloc': args.tracemalloc}
+    print(f"{'배율':>4} {'과정':>7} {'시간(s)':>8} {'행/s':>8} {'요청':>7} {'재시도':>6} {'p99(ms)':>8} "
+          f"{'RSS(MB)':>8} {'힙(MB)':>7} {'CSV(MB)':>7}")
+
+    for scale in [int(value) for value in args.scales.split(',')]:
+        server, base_urls = start_server(
+            course_count=args.courses, latency=args.latency, archive=args.archive, scale=scale,
+            latency_jitter=args.jitter, error_rate=args.error_rate
+        )
+        results = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=run_collection, args=(base_urls, options, results))
+        worker.start()
+        result = results.get()
+        worker.join()
+        server.shutdown()
+        server.server_close()
+
+        rss = f"{result['peak_rss_mb']:.0f}" if result['peak_rss_mb'] is not None else '-'
+        heap = f"{result['heap_peak_mb']:.0f}" if result['heap_peak_mb'] is not None else '-'
+        print(f"{scale:>4} {result['rows']:>7} {result['elapsed']:>8.2f} {result['rows'] / result['elapsed']:>8.0f} "
+              f"{result['requests']:>7} {result['retries']:>6} {result['p99_ms']:>8.0f} {rss:>8} {heap:>7} "
+              f"{result['output_mb']:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""동시 요청 한도 자동 조절(AIMD) 벤치마크 (고정 동시 요청 수 vs 엔드포인트별 자동 조절)
+
+서버가 동시에 처리할 수 있는 요청 수를 넘으면 429 를 반환하도록 하고,
+같은 과정 목록을 수집할 때 걸린 시간과 429 응답 수를 비교합니다.
+
+사용법: python benchmarks/bench_rate_control.py [과정 수] [서버 동시 처리 한도] [수집기 동시 요청 수]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automated_kdt_data_collector import FETCH_ERRORS, AutomatedKDTDataCollector
+from benchmarks.work24_server import start_server
+from kdt_collector.transport import Work24Transport
+
+
+def run(base_urls, server, basic_data, max_workers, adaptive):
+    collector = AutomatedKDTDataCollector(
+        max_workers=max_workers, requests_per_second=0, cache_path=None, employment_queue_path=None,
+        checkpoint_dir=None
+    )
+    collector.base_urls.update(base_urls)
+    collector.transport = Work24Transport(
+        collector.base_urls, pool_size=max_workers, backoff_base=0.05, backoff_max=0.5, adaptive=adaptive
+    )
+
+    def enrich(item):
+        try:
+            return collector.enrich_course(item)
+        except FETCH_ERRORS:
+            return None
+
+    server.throttled = 0
+    started = time.perf_counter()
+    # enrich_course 는 레코드를 제자리에서 갱신하므로 실행마다 사본 사용
+    enriched = collector.engine.map(enrich, [item.copy() for item in basic_data])
+    elapsed = time.perf_counter() - started
+
+    missing = sum(1 for row in enriched if row is None)
+    limits = {name: int(controller.limit) for name, controller in collector.transport.controllers.items()}
+    label = '자동 조절' if adaptive else '고정'
+    print(f"{label:>5}: {elapsed:.2f}s, 429 응답 {server.throttled}회, 조회 실패 {missing}개"
+          + (f", 최종 한도 {limits}" if limits else ""))
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    max_concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+
+    server, base_urls = start_server(course_count=course_count, latency=0.02)
+    collector = AutomatedKDTDataCollector(requests_per_second=0, cache_path=None, employment_queue_path=None,
+                                          checkpoint_dir=None)
+    collector.base_urls.update(base_urls)
+    basic_data = collector.fetch_basic_data('20210101', '20261231')
+    server.max_concurrency = max_concurrency
+    print(f"과정 수: {len(basic_data)}, 서버 동시 처리 한도: {max_concurrency}, 수집기 동시 요청: {max_workers}")
+
+    run(base_urls, server, basic_data, max_workers, adaptive=False)
+    run(base_urls, server, basic_data, max_workers, adaptive=True)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""과정 레코드 벤치마크 (기존 36키 dict vs CourseRecord 슬롯 레코드)
+
+과정당 메모리, 상세/취업 정보 결합 비용, 자동 계산용 DataFrame 구성 시간을 비교합니다.
+
+사용법: python benchmarks/bench_records.py [과정 수]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.work24_server import make_course
+from kdt_collector.records import CourseRecord, to_frame
+
+PLACEHOLDER_COLUMNS = [
+    '수료인원', '수료율', '취업인원 (3개월)', '취업률 (3개월)', '취업인원 (6개월)', '취업률 (6개월)',
+    '선도기업', '파트너기관', '매출 최소', '실 매출 대비', '매출 최대',
+    '2021년', '2022년', '2023년', '2024년', '2025년', '2026년',
+]
+
+
+def build_dict(item):
+    """변경 전 build_basic_info (자리표시 빈 문자열을 포함한 36키 dict)"""
+    row = CourseRecord.from_api(item).to_row()
+    del row['실제 훈련비'], row['정부지원금']
+    for column in PLACEHOLDER_COLUMNS:
+        row.setdefault(column, '')
+    return row
+
+
+def measure_memory(build, items):
+    """items 를 모두 변환해 보관할 때 늘어난 메모리 (과정당 바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = [build(item) for item in items]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(rows), rows
+
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    course_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    # API 응답 문자열은 과정마다 새로 만들어지므로 양쪽 모두 같은 원본을 공유
+    items = [make_course(index) for index in range(course_count)]
+    detail = {'실제 훈련비': '1000000', '정부지원금': '900000'}
+    employment = {'취업인원 (3개월)': '10', '취업률 (3개월)': '50.0', '취업인원 (6개월)': '12',
+                  '취업률 (6개월)': '60.0', '수료인원': '20'}
+    print(f"과정 수: {course_count:,}")
+
+    dict_bytes, dict_rows = measure_memory(build_dict, items)
+    record_bytes, records = measure_memory(CourseRecord.from_api, items)
+    print(f"과정당 메모리: dict {dict_bytes:,.0f}B, CourseRecord {record_bytes:,.0f}B "
+          f"({dict_bytes / record_bytes:.1f}배 절감)")
+
+    dict_merge = timed(lambda: [{**row, **detail, **employment} for row in dict_rows])
+    record_merge = timed(lambda: [(record.update(detail), record.update(employment)) for record in records])
+    print(f"상세/취업 정보 결합: dict 병합 {dict_merge * 1e9 / course_count:,.0f}ns/과정, "
+          f"레코드 갱신 {record_merge * 1e9 / course_count:,.0f}ns/과정")
+
+    merged_rows = [{**row, **detail, **employment} for row in dict_rows]
+    dict_frame = timed(lambda: pd.DataFrame(merged_rows))
+    record_frame = timed(lambda: to_frame(records))
+    print(f"DataFrame 구성: dict 목록 {dict_frame:.3f}s, 레코드 컬럼 단위 {record_frame:.3f}s")
+
+    frame = to_frame(records)
+    expected = pd.DataFrame(merged_rows)
+    for column in frame.columns:
+        assert frame[column].equals(expected[column]), f"{column} 값 불일치"
+    print("결과 일치 확인 완료")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Work24 API 응답 녹화/재생용 fixture 아카이브
+
+녹화 (실제 API 호출, 네트워크 필요):
+    python benchmarks/fixtures.py 20240101 20240131 fixtures/work24_202401.zip [최대 과정 수]
+
+녹화한 아카이브는 benchmarks/work24_server.py 의 start_server(archive=...) 로 오프라인 재생합니다.
+아카이브는 zip 파일이며 index.json (엔드포인트, 요청 파라미터, 상태 코드, 본문 파일명)과
+응답 본문 파일로 구성됩니다. 인증키(authKey)는 저장하지 않습니다.
+"""
+import json
+import os
+import sys
+import threading
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 아카이브에 저장하지 않는 요청 파라미터
+SECRET_PARAMS = ('authKey',)
+
+
+class FixtureRecorder:
+    """Work24Transport 를 감싸 응답을 fixture 아카이브에 기록 (나머지 속성은 원래 전송 계층으로 위임)"""
+
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.index = []
+        self.lock = threading.Lock()
+
+    def get(self, endpoint, params):
+        response = self.transport.get(endpoint, params)
+        with self.lock:
+            name = f"responses/{len(self.index):06d}.bin"
+            self.archive.writestr(name, response.content)
+            self.index.append({
+                'endpoint': endpoint,
+                'params': {key: value for key, value in params.items() if key not in SECRET_PARAMS},
+                'status': response.status_code,
+                'content_type': response.headers.get('Content-Type', ''),
+                'body': name,
+            })
+        return response
+
+    def close(self):
+        with self.lock:
+            self.archive.writestr('index.json', json.dumps(self.index, ensure_ascii=False, indent=1))
+            self.archive.close()
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+
+def course_key(trpr_id, trpr_degr, inst_cd):
+    return (str(trpr_id), str(trpr_degr), str(inst_cd))
+
+
+class FixtureArchive:
+    """녹화한 응답을 재생 서버가 쓰기 좋은 형태로 로드
+
+    - courses: 310L01 srchList 항목 (과정시작일 순, 중복 제거)
+    - detail_bodies / employment_bodies: (훈련과정 ID, 회차, 훈련기관ID) → 응답 본문
+    synthesize(scale) 로 과정 목록을 scale 배로 늘리면, 복제 과정의 응답은 원본 과정 응답을 재사용합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.courses = []
+        self.detail_bodies = {}
+        self.employment_bodies = {}
+        self.content_types = {}
+        self.origins = {}
+
+        seen_keys = set()
+        with zipfile.ZipFile(path) as archive:
+            index = json.loads(archive.read('index.json').decode('utf-8'))
+            for entry in index:
+                if entry['status'] != 200:
+                    continue
+                body = archive.read(entry['body'])
+                endpoint = entry['endpoint']
+                params = entry['params']
+                self.content_types.setdefault(endpoint, entry['content_type'])
+
+                if endpoint == 'basic':
+                    for item in json.loads(body.decode('utf-8')).get('srchList') or []:
+                        key = course_key(item.get('trprId', ''), item.get('trprDegr', ''), item.get('instCd', ''))
+                        if key not in seen_keys:
+                            seen_keys.add(key)
+                            self.courses.append(item)
+                else:
+                    key = course_key(params.get('srchTrprId', ''), params.get('srchTrprDegr', ''),
+                                     params.get('srchTorgId', ''))
+                    bodies = self.detail_bodies if endpoint == 'detail' else self.employment_bodies
+                    bodies[key] = body
+
+        self.courses.sort(key=lambda item: item.get('traStartDate', ''))
+
+    def synthesize(self, scale):
+        """과정 목록을 scale 배로 늘린 목록 (복제본은 훈련과정 ID 뒤에 -1, -2, ... 를 붙임)"""
+        courses = list(self.courses)
+        for copy_index in range(1, int(scale)):
+            for item in self.courses:
+                copy = dict(item, trprId=f"{item.get('trprId', '')}-{copy_index}")
+                origin = course_key(item.get('trprId', ''), item.get('trprDegr', ''), item.get('instCd', ''))
+                self.origins[course_key(copy['trprId'], copy.get('trprDegr', ''), copy.get('instCd', ''))] = origin
+                courses.append(copy)
+        courses.sort(key=lambda item: item.get('traStartDate', ''))
+        return courses
+
+    def body(self, endpoint, params):
+        """요청 파라미터에 맞는 녹화 응답 (복제 과정은 원본, 없으면 같은 엔드포인트의 아무 응답)"""
+        bodies = self.detail_bodies if endpoint == 'detail' else self.employment_bodies
+        key = course_key(params.get('srchTrprId', ''), params.get('srchTrprDegr', ''), params.get('srchTorgId', ''))
+        body = bodies.get(key) or bodies.get(self.origins.get(key))
+        if body is None and bodies:
+            body = next(iter(bodies.values()))
+        return body
+
+
+def record(start_date, end_date, path, limit=None, base_urls=None):
+    """실제 API 로 수집하면서 응답을 아카이브에 기록
+
+    limit: 상세/취업 정보까지 녹화할 최대 과정 수, base_urls: 다른 서버에서 녹화할 때 엔드포인트 URL
+    """
+    from automated_kdt_data_collector import AutomatedKDTDataCollector
+
+    collector = AutomatedKDTDataCollector(cache_path=None, employment_queue_path=None, checkpoint_dir=None,
+                                          metrics_path=None)
+    if base_urls:
+        collector.base_urls.update(base_urls)
+    recorder = FixtureRecorder(collector.transport, path)
+    collector.transport = recorder
+    try:
+        basic_data = collector.fetch_basic_data(start_date, end_date)
+        if limit:
+            basic_data = basic_data[:limit]
+        collector.engine.map(collector.enrich_course, basic_data)
+    finally:
+        recorder.close()
+    print(f"녹화 완료: {path} (과정 {len(basic_data)}개, 응답 {len(recorder.index)}건)")
+    return len(recorder.index)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        print(__doc__)
+        sys.exit(1)
+    record(sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4]) if len(sys.argv) > 4 else None)
@@ -0,0 +1,209 @@
+"""Work24 훈련과정 API(310L01/02/03)를 흉내 내는 로컬 서버 (벤치마크용)
+
+archive 를 지정하면 benchmarks/fixtures.py 로 녹화한 실제 응답을 재생하고, 지정하지 않으면
+make_course() 로 만든 가짜 과정을 응답합니다. scale 배로 과정 수를 늘릴 수 있고,
+응답 지연(latency + 0~latency_jitter 초), 5xx 오류(error_rate), 동시 처리 한도 초과 429 를 주입할 수 있습니다.
+"""
+import json
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_course(index):
+    """가짜 과정 1건 생성 (310L01 srchList 항목 형식)"""
+    start = date(2021, 1, 4) + timedelta(days=(index * 3) % 1800)
+    end = start + timedelta(days=150 + index % 60)
+    return {
+        'trprId': f"AIG2021{index:07d}",
+        'trprDegr': str(index % 12 + 1),
+        'instCd': f"5000{index % 400:05d}",
+        'instNm': f"테스트훈련기관{index % 400}",
+        'title': f"테스트 과정 {index}",
+        'trDcnt': '100',
+        'trtm': '800',
+        'traStartDate': start.strftime('%Y-%m-%d'),
+        'traEndDate': end.strftime('%Y-%m-%d'),
+        'ncsNm': '응용SW엔지니어링',
+        'ncsCd': '20010202',
+        'courseMan': str(5000000 + (index % 10) * 100000),
+        'yardMan': str(20 + index % 10),
+        'regCourseMan': str(15 + index % 10),
+        'stdgScor': '4.5',
+        'trngAreaCd': '11',
+        'address': '서울특별시',
+        'titleLink': f"https://www.work24.go.kr/course/{index}",
+    }
+
+
+def matching_courses(courses, params):
+    """srchTraStDt ~ srchTraEndDt 사이에 시작하는 과정 목록 (courses 는 시작일 순)"""
+    start = params.get('srchTraStDt', '00000000')
+    end = params.get('srchTraEndDt', '99999999')
+    return [course for course in courses if start <= course['traStartDate'].replace('-', '') <= end]
+
+
+def detail_xml(params):
+    """310L02 응답 본문"""
+    return (
+        "<HRDNet><inst_base_info>"
+        f"<trprId>{params.get('srchTrprId', '')}</trprId>"
+        "<instPerTrco>5500000</instPerTrco><perTrco>5000000</perTrco>"
+        "</inst_base_info></HRDNet>"
+    ).encode('utf-8')
+
+
+def employment_xml(params):
+    """310L03 응답 본문"""
+    return (
+        "<HRDNet><scn_list>"
+        f"<trprId>{params.get('srchTrprId', '')}</trprId>"
+        "<finiCnt>18</finiCnt>"
+        "<eiEmplCnt3>10</eiEmplCnt3><eiEmplRate3>55.6</eiEmplRate3>"
+        "<eiEmplCnt6>12</eiEmplCnt6><eiEmplRate6>66.7</eiEmplRate6>"
+        "</scn_list></HRDNet>"
+    ).encode('utf-8')
+
+
+def detail_json(params):
+    """310L02 응답 본문 (returnType=JSON)"""
+    return json.dumps({
+        'inst_base_info': {'trprId': params.get('srchTrprId', ''), 'instPerTrco': 5500000, 'perTrco': 5000000},
+    }).encode('utf-8')
+
+
+def employment_json(params):
+    """310L03 응답 본문 (returnType=JSON)"""
+    return json.dumps({
+        'scn_list': [{
+            'trprId': params.get('srchTrprId', ''), 'finiCnt': 18,
+            'eiEmplCnt3': 10, 'eiEmplRate3': 55.6, 'eiEmplCnt6': 12, 'eiEmplRate6': 66.7,
+        }],
+    }).encode('utf-8')
+
+
+class Work24Handler(BaseHTTPRequestHandler):
+    """엔드포인트 경로의 끝(310L01/02/03)으로 응답 종류를 결정"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        server = self.server
+
+        # 동시 처리 한도를 넘는 요청은 429, error_rate 비율만큼은 503 으로 거절 (과부하/장애 상황 재현)
+        with server.counter_lock:
+            server.in_flight += 1
+            throttled = server.max_concurrency and server.in_flight > server.max_concurrency
+            if throttled:
+                server.throttled += 1
+            failed = not throttled and server.error_rate > 0 and server.random.random() < server.error_rate
+            if failed:
+                server.injected_errors += 1
+            delay = server.latency + (server.random.uniform(0, server.latency_jitter) if server.latency_jitter else 0)
+        try:
+            if throttled or failed:
+                # 거절 응답도 정상 응답과 같은 왕복 시간이 걸림
+                if delay > 0:
+                    time.sleep(delay)
+                self.send_response(429 if throttled else 503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.respond(parsed, params, delay)
+        finally:
+            with server.counter_lock:
+                server.in_flight -= 1
+
+    def respond(self, parsed, params, delay):
+        server = self.server
+        if delay > 0:
+            time.sleep(delay)
+
+        if parsed.path.endswith('310L01.do'):
+            page_num = int(params.get('pageNum', 1))
+            page_size = int(params.get('pageSize', 100))
+            courses = matching_courses(server.courses, params)
+            first = (page_num - 1) * page_size
+            body = json.dumps({
+                'scn_cnt': len(courses),
+                'pageNum': page_num,
+                'pageSize': page_size,
+                'srchList': courses[first:first + page_size],
+            }, ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        elif parsed.path.endswith('310L02.do') or parsed.path.endswith('310L03.do'):
+            endpoint = 'detail' if parsed.path.endswith('310L02.do') else 'employment'
+            as_json = params.get('returnType') == 'JSON'
+            if server.archive:
+                body = server.archive.body(endpoint, params)
+            elif endpoint == 'detail':
+                body = detail_json(params) if as_json else detail_xml(params)
+            else:
+                body = employment_json(params) if as_json else employment_xml(params)
+            content_type = f"application/{'json' if as_json else 'xml'}; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        with server.counter_lock:
+            server.request_counts[parsed.path] = server.request_counts.get(parsed.path, 0) + 1
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 묻히지 않도록 접근 로그 생략
+        pass
+
+
+class Work24Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 요청이 많을 때 연결 대기열이 넘쳐 SYN 재전송 지연이 생기지 않도록 여유 있게 설정
+    request_queue_size = 256
+
+
+def start_server(course_count=200, latency=0.05, port=0, max_concurrency=0, archive=None, scale=1,
+                 latency_jitter=0.0, error_rate=0.0, seed=0):
+    """백그라운드 스레드에서 서버를 시작하고 (server, base_urls) 반환
+
+    max_concurrency=0 이면 동시 처리 무제한, archive 는 fixture 아카이브 경로 또는 FixtureArchive.
+    """
+    server = Work24Server(('127.0.0.1', port), Work24Handler)
+    if archive is not None:
+        from benchmarks.fixtures import FixtureArchive
+        server.archive = archive if isinstance(archive, FixtureArchive) else FixtureArchive(archive)
+        server.courses = server.archive.synthesize(scale)
+    else:
+        server.archive = None
+        server.courses = sorted((make_course(i) for i in range(int(course_count * scale))),
+                                key=lambda c: c['traStartDate'])
+    server.course_count = len(server.courses)
+    server.latency = latency
+    server.latency_jitter = latency_jitter
+    server.error_rate = error_rate
+    server.random = random.Random(seed)
+    server.request_counts = {}
+    server.max_concurrency = max_concurrency
+    server.in_flight = 0
+    server.throttled = 0
+    server.injected_errors = 0
+    server.counter_lock = threading.Lock()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address
+    base = f"http://{host}:{port}/cm/openApi/call/hr"
+    base_urls = {
+        'basic': f"{base}/callOpenApiSvcInfo310L01.do",
+        'detail': f"{base}/callOpenApiSvcInfo310L02.do",
+        'employment': f"{base}/callOpenApiSvcInfo310L03.do",
+    }
+    return server, base_urls
+
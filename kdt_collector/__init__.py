@@ -0,0 +1,2 @@
+# kdt_collector/__init__.py
+# automated_kdt_data_collector.py 에서 사용하는 수집 보조 모듈 모음
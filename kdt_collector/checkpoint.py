@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import threading
+
+
+class CheckpointJournal:
+    """상세 정보까지 수집된 과정을 한 줄씩 추가 기록하는 JSONL 체크포인트
+
+    중단된 실행을 다시 시작하면 기록된 고유값은 API 를 다시 호출하지 않고 재사용합니다.
+    """
+
+    def __init__(self, path, fsync_every=50):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.lock = threading.Lock()
+        self.pending_sync = 0
+        self.file = None
+
+    def load(self):
+        """기록된 과정을 {고유값: 행} 으로 반환 (마지막 줄이 잘린 경우 무시)"""
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    logging.warning(f"체크포인트 {line_no}번째 줄이 손상되어 건너뜀: {self.path}")
+                    continue
+                records[row['고유값']] = row
+
+        logging.info(f"체크포인트에서 {len(records)}개 과정 복원: {self.path}")
+        return records
+
+    def append(self, row):
+        """과정 1건 기록 (여러 수집 스레드에서 호출 가능)"""
+        line = json.dumps(row, ensure_ascii=False) + '\n'
+        with self.lock:
+            if self.file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self.truncate_partial_line()
+                self.file = open(self.path, 'a', encoding='utf-8')
+
+            self.file.write(line)
+            self.file.flush()
+
+            # 매 줄 fsync 는 느리므로 일정 개수마다 디스크에 확정
+            self.pending_sync += 1
+            if self.pending_sync >= self.fsync_every:
+                os.fsync(self.file.fileno())
+                self.pending_sync = 0
+
+    def truncate_partial_line(self):
+        """중단으로 잘린 마지막 줄을 지워 다음 기록이 그 줄 뒤에 붙지 않게 함"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if not size:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return
+
+            # 마지막 줄바꿈 위치를 뒤에서부터 찾음 (없으면 파일 전체가 잘린 한 줄)
+            position = size
+            while position > 0:
+                block = min(65536, position)
+                position -= block
+                f.seek(position)
+                index = f.read(block).rfind(b'\n')
+                if index >= 0:
+                    position += index + 1
+                    break
+            f.truncate(position)
+            os.fsync(f.fileno())
+        logging.warning(f"체크포인트 마지막 줄이 잘려 있어 {size - position}바이트 제거: {self.path}")
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.file.close()
+                self.file = None
+                self.pending_sync = 0
+
+    def remove(self):
+        """결과 저장이 끝난 뒤 체크포인트 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logging.info(f"체크포인트 삭제: {self.path}")
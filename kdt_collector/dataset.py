@@ -0,0 +1,360 @@
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+
+from kdt_collector.sinks import COLUMN_ORDER, NUMERIC_COLUMNS, collected_at_text
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# 과정시작일을 알 수 없는 과정이 들어가는 파티션
+UNKNOWN_PARTITION = 'unknown'
+
+DATE_COLUMNS = ['과정시작일', '과정종료일']
+INTEGER_COLUMNS = [
+    '총 훈련일수', '총 훈련시간', '훈련비', '정원', '수강신청 인원', '수료인원', '취업인원 (3개월)', '취업인원 (6개월)',
+]
+FLOAT_COLUMNS = ['만족도', '취업률 (3개월)', '취업률 (6개월)'] + NUMERIC_COLUMNS
+
+
+def column_kind(column):
+    """데이터셋 컬럼 타입 ('date', 'int', 'float', 'string')"""
+    if column in DATE_COLUMNS:
+        return 'date'
+    if column in INTEGER_COLUMNS:
+        return 'int'
+    if column in FLOAT_COLUMNS:
+        return 'float'
+    return 'string'
+
+
+def is_dataset_path(path):
+    """출력 경로가 파티션 데이터셋 디렉터리인지 (끝이 / 이거나 이미 있는 디렉터리)"""
+    return path.endswith(('/', os.sep)) or os.path.isdir(path)
+
+
+def partition_of(start_date):
+    """과정시작일 → 'YYYY-MM' 파티션 키"""
+    text = '' if start_date is None or start_date != start_date else str(start_date).replace('-', '')
+    if len(text) >= 6 and text[:6].isdigit():
+        return f"{text[:4]}-{text[4:6]}"
+    return UNKNOWN_PARTITION
+
+
+def partition_dir(key):
+    """파티션 키 → 'year=YYYY/month=MM' (hive 형식) 상대 경로"""
+    if key == UNKNOWN_PARTITION:
+        return f"year={UNKNOWN_PARTITION}/month={UNKNOWN_PARTITION}"
+    year, month = key.split('-')
+    return f"year={year}/month={month}"
+
+
+def read_manifest(path):
+    """데이터셋 매니페스트 로드 (없으면 빈 매니페스트)"""
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {'version': MANIFEST_VERSION, 'partitions': {}}
+    with open(manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"지원하지 않는 데이터셋 매니페스트 버전: {manifest.get('version')} ({manifest_path})")
+    return manifest
+
+
+def write_manifest(path, manifest):
+    """매니페스트를 임시 파일에 쓴 뒤 교체 (읽는 쪽은 항상 완성된 매니페스트를 봄)"""
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+
+class PartitionedDatasetSink:
+    """과정시작일 연/월 파티션으로 나눈 Parquet 데이터셋 출력기 (pyarrow 필요)
+
+    path/year=YYYY/month=MM/part-<실행 ID>.parquet 에 타입이 지정된 컬럼으로 쓰고, 파티션별 파일/행 수/기간을
+    path/manifest.json 에 기록합니다. 파티션별 collected_at 은 그 파티션에서 가장 오래된 행의 수집 시각입니다.
+    다시 실행하면 이번 실행에서 행이 들어온 파티션만 새 파일로 교체하며,
+    기존 파티션 파일의 과정 중 이번 결과에 없고 수집 기간(start_date~end_date) 밖에 있는 과정은 그대로 유지합니다.
+    """
+
+    def __init__(self, path, start_date=None, end_date=None, chunk_size=10000, columns=COLUMN_ORDER, collected_at=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("파티션 데이터셋 출력에는 pyarrow 가 필요합니다: pip install pyarrow") from e
+
+        self.pa = pa
+        self.pc = pc
+        self.pq = pq
+        self.path = path
+        self.start_date = self.parse_range_date(start_date)
+        self.end_date = self.parse_range_date(end_date)
+        self.chunk_size = chunk_size
+        self.columns = columns
+        types = {'date': pa.date32(), 'int': pa.int64(), 'float': pa.float64(), 'string': pa.string()}
+        self.schema = pa.schema([(column, types[column_kind(column)]) for column in columns])
+        self.run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}"
+        self.collected_at = collected_at_text(collected_at)
+        self.buffers = {}
+        self.writers = {}
+        self.invalid_counts = {}
+        self.rows_written = 0
+
+    def parse_range_date(self, value):
+        return datetime.strptime(value, '%Y%m%d').date() if value else None
+
+    def write_rows(self, rows):
+        for row in rows:
+            key = partition_of(row.get('과정시작일'))
+            buffer = self.buffers.setdefault(key, [])
+            buffer.append(row)
+            if len(buffer) >= self.chunk_size:
+                self.flush(key)
+
+    def flush(self, key):
+        """파티션 버퍼를 이번 실행의 임시 파일에 row group 으로 기록"""
+        buffer = self.buffers.get(key)
+        if not buffer:
+            return
+
+        table = self.to_table(buffer)
+        if key not in self.writers:
+            os.makedirs(os.path.join(self.path, partition_dir(key)), exist_ok=True)
+            self.writers[key] = self.pq.ParquetWriter(self.temp_path(key), self.schema)
+        self.writers[key].write_table(table)
+
+        self.rows_written += len(buffer)
+        self.buffers[key] = []
+
+    def to_table(self, rows):
+        arrays = []
+        for field in self.schema:
+            convert = getattr(self, f"to_{column_kind(field.name)}")
+            values = []
+            for row in rows:
+                value = row.get(field.name)
+                if value is None or value != value or value == '':
+                    values.append(None)
+                    continue
+                try:
+                    values.append(convert(value))
+                except ValueError:
+                    # 숫자/날짜로 읽을 수 없는 API 값은 빈 값으로 저장하고 개수만 기록
+                    self.invalid_counts[field.name] = self.invalid_counts.get(field.name, 0) + 1
+                    values.append(None)
+            arrays.append(self.pa.array(values, type=field.type))
+        return self.pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def to_date(self, value):
+        return datetime.strptime(str(value)[:10].replace('-', ''), '%Y%m%d').date()
+
+    def to_int(self, value):
+        try:
+            return int(value)
+        except ValueError:
+            number = float(value)
+            if not number.is_integer():
+                raise
+            return int(number)
+
+    def to_float(self, value):
+        return float(value)
+
+    def to_string(self, value):
+        return str(value)
+
+    def temp_path(self, key):
+        return os.path.join(self.path, partition_dir(key), f"part-{self.run_id}.parquet.tmp")
+
+    def close(self):
+        for key in list(self.buffers):
+            self.flush(key)
+        for writer in self.writers.values():
+            writer.close()
+
+        if self.writers:
+            self.commit()
+        self.writers = {}
+
+        for column, count in self.invalid_counts.items():
+            logging.warning(f"데이터셋 '{column}' 컬럼에서 변환할 수 없는 값 {count}개를 빈 값으로 저장")
+        logging.info(f"파티션 데이터셋 저장 완료: {self.path} ({self.rows_written}행)")
+
+    def commit(self):
+        """이번 실행에서 쓴 파티션을 기존 파티션과 합쳐 교체하고, 수집 기간 안의 과정이 빠진 파티션도 정리한 뒤 매니페스트 갱신"""
+        manifest = read_manifest(self.path)
+        partitions = manifest['partitions']
+        replaced_files = []
+        updated_at = datetime.now().isoformat(timespec='seconds')
+
+        for key in sorted(self.writers):
+            table = self.pq.read_table(self.temp_path(key))
+            kept_rows = 0
+            previous = partitions.get(key)
+            if previous:
+                previous_path = os.path.join(self.path, previous['path'])
+                kept = self.kept_rows(self.pq.read_table(previous_path, schema=self.schema), table)
+                kept_rows = kept.num_rows
+                if kept_rows:
+                    table = self.pa.concat_tables([kept, table])
+                replaced_files.append(previous_path)
+
+            relative_path = f"{partition_dir(key)}/part-{self.run_id}.parquet"
+            final_path = os.path.join(self.path, relative_path)
+            if kept_rows:
+                self.pq.write_table(table, final_path)
+                os.remove(self.temp_path(key))
+            else:
+                os.replace(self.temp_path(key), final_path)
+
+            # 기존 행을 유지한 파티션은 그 행들을 수집한 이전 시각을 그대로 둠
+            collected_at = self.collected_at
+            if kept_rows:
+                collected_at = min(collected_at, previous.get('collected_at') or previous['updated_at'])
+
+            start_dates = self.pc.min_max(table['과정시작일'])
+            partitions[key] = {
+                'path': relative_path,
+                'rows': table.num_rows,
+                'min_start': self.date_text(start_dates['min']),
+                'max_start': self.date_text(start_dates['max']),
+                'updated_at': updated_at,
+                'collected_at': collected_at,
+            }
+            logging.info(f"데이터셋 파티션 {key} 교체: {table.num_rows}행 (기존 유지 {kept_rows}행)")
+
+        # 수집 기간에 걸치지만 이번 실행에서 행이 하나도 들어오지 않은 파티션도 기간 안의 과정은 빼서 CSV 재수집과 같게 맞춤
+        # (목록에서 빠진 과정만 있던 달은 파티션 자체를 삭제)
+        empty_table = self.schema.empty_table()
+        for key in sorted(set(partitions) - set(self.writers)):
+            if not self.overlaps_window(key):
+                continue
+            previous = partitions[key]
+            previous_path = os.path.join(self.path, previous['path'])
+            previous_table = self.pq.read_table(previous_path, schema=self.schema)
+            kept = self.kept_rows(previous_table, empty_table)
+            if kept.num_rows == previous_table.num_rows:
+                continue
+
+            replaced_files.append(previous_path)
+            if not kept.num_rows:
+                del partitions[key]
+                logging.info(f"데이터셋 파티션 {key} 삭제: 수집 기간 안의 과정 {previous_table.num_rows}행이 이번 결과에 없음")
+                continue
+
+            relative_path = f"{partition_dir(key)}/part-{self.run_id}.parquet"
+            self.pq.write_table(kept, os.path.join(self.path, relative_path))
+            start_dates = self.pc.min_max(kept['과정시작일'])
+            partitions[key] = {
+                **previous,
+                'path': relative_path,
+                'rows': kept.num_rows,
+                'min_start': self.date_text(start_dates['min']),
+                'max_start': self.date_text(start_dates['max']),
+                'updated_at': updated_at,
+            }
+            logging.info(f"데이터셋 파티션 {key} 정리: {kept.num_rows}행 유지 "
+                         f"(수집 기간 안의 과정 {previous_table.num_rows - kept.num_rows}행 제거)")
+
+        manifest.update({
+            'version': MANIFEST_VERSION,
+            'partition_by': ['year', 'month'],
+            'columns': [{'name': field.name, 'type': column_kind(field.name)} for field in self.schema],
+            'updated_at': updated_at,
+            'partitions': dict(sorted(partitions.items())),
+        })
+        write_manifest(self.path, manifest)
+
+        # 매니페스트가 새 파일을 가리킨 뒤에 이전 파일 삭제
+        for path in replaced_files:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def overlaps_window(self, key):
+        """파티션 달이 수집 기간과 겹치는지 (기간을 지정하지 않았거나 과정시작일을 모르는 파티션은 False)"""
+        if key == UNKNOWN_PARTITION or not (self.start_date or self.end_date):
+            return False
+        year, month = map(int, key.split('-'))
+        first_day = date(year, month, 1)
+        last_day = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return ((self.start_date is None or last_day >= self.start_date)
+                and (self.end_date is None or first_day <= self.end_date))
+
+    def kept_rows(self, previous, table):
+        """기존 파티션 중 이번 결과에 없고 수집 기간 밖에 있는 과정"""
+        pc = self.pc
+        mask = pc.invert(pc.is_in(previous['고유값'], value_set=table['고유값']))
+        start = previous['과정시작일']
+        outside = pc.is_null(start)
+        if self.start_date:
+            outside = pc.or_(outside, pc.less(start, self.pa.scalar(self.start_date, self.pa.date32())))
+        if self.end_date:
+            outside = pc.or_(outside, pc.greater(start, self.pa.scalar(self.end_date, self.pa.date32())))
+        if self.start_date or self.end_date:
+            mask = pc.and_(mask, pc.fill_null(outside, True))
+        return previous.filter(mask)
+
+    def date_text(self, scalar):
+        return scalar.as_py().isoformat() if scalar.is_valid else None
+
+    def abort(self):
+        """실패한 실행의 임시 파일 삭제 (기존 데이터셋은 그대로 유지)"""
+        for key, writer in self.writers.items():
+            writer.close()
+            if os.path.exists(self.temp_path(key)):
+                os.remove(self.temp_path(key))
+        self.writers = {}
+        self.buffers = {}
+        logging.warning(f"파티션 데이터셋 저장 취소: {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def read_dataset_table(path, years=None, columns=None):
+    """파티션 데이터셋을 pyarrow Table 로 로드 (years 를 지정하면 해당 연도 파티션 파일만 읽음, 파티션이 없으면 None)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("파티션 데이터셋을 읽으려면 pyarrow 가 필요합니다: pip install pyarrow") from e
+
+    manifest = read_manifest(path)
+    wanted_years = {str(year) for year in years} if years is not None else None
+    tables = []
+    for key, partition in manifest['partitions'].items():
+        if wanted_years is not None and key.split('-')[0] not in wanted_years:
+            continue
+        tables.append(pq.read_table(os.path.join(path, partition['path']), columns=columns))
+
+    return pa.concat_tables(tables) if tables else None
+
+
+def load_dataset(path, years=None, columns=None):
+    """파티션 데이터셋을 DataFrame 으로 로드 (years 를 지정하면 해당 연도 파티션 파일만 읽음)"""
+    table = read_dataset_table(path, years=years, columns=columns)
+    if table is None:
+        import pandas as pd
+        manifest = read_manifest(path)
+        return pd.DataFrame(columns=columns or [column['name'] for column in manifest.get('columns', [])])
+
+    return table.to_pandas(date_as_object=False)
+
+
+def dataset_collected_at(path):
+    """데이터셋 전체의 수집 시각 (파티션별 collected_at 중 가장 이른 값, 이전 형식 매니페스트는 updated_at), 없으면 None"""
+    partitions = read_manifest(path)['partitions'].values()
+    times = [partition.get('collected_at') or partition.get('updated_at') for partition in partitions]
+    times = [value for value in times if value]
+    return min(times) if times else None
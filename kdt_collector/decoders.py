@@ -0,0 +1,176 @@
+import io
+import json
+import xml.etree.ElementTree as ET
+
+# 310L02: 훈련기관 기본 정보 (inst_base_info) 중 사용하는 필드
+DETAIL_RECORD = 'inst_base_info'
+DETAIL_FIELDS = {
+    'instPerTrco': '실제 훈련비',
+    'perTrco': '정부지원금',
+}
+
+# 310L03: 취업 통계 (첫 번째 scn_list) 중 사용하는 필드
+EMPLOYMENT_RECORD = 'scn_list'
+EMPLOYMENT_FIELDS = {
+    'eiEmplCnt3': '취업인원 (3개월)',
+    'eiEmplRate3': '취업률 (3개월)',
+    'eiEmplCnt6': '취업인원 (6개월)',
+    'eiEmplRate6': '취업률 (6개월)',
+    'finiCnt': '수료인원',
+}
+
+# 인증키 오류, 호출 한도 초과 등 오류 응답에 들어 있는 요소/키 (루트 또는 루트 바로 아래)
+ERROR_TAGS = ('error', 'errMsg', 'errorMsg')
+RETURN_CODE_TAG = 'returnCode'
+SUCCESS_RETURN_CODES = ('', '0', '00', '000')
+
+
+def error_message(tag, text):
+    """오류 응답을 나타내는 요소/키면 오류 내용, 아니면 None"""
+    if tag in ERROR_TAGS:
+        return (text or '').strip() or tag
+    if tag == RETURN_CODE_TAG and (text or '').strip() not in SUCCESS_RETURN_CODES:
+        return f"{tag}={text}"
+    return None
+
+
+def extract_fields(record, fields):
+    """record 요소의 직계 자식 중 fields 에 있는 태그의 텍스트를 {컬럼명: 값} 으로 반환 (같은 태그는 첫 번째)"""
+    data = {}
+    for tag, column in fields.items():
+        element = record.find(tag)
+        if element is not None:
+            data[column] = element.text
+    return data
+
+
+class ElementTreeDecoder:
+    """XML 전체를 ElementTree 로 파싱 (기존 방식)"""
+
+    name = 'xml'
+    return_type = 'XML'
+
+    def decode(self, content, record_tag, fields):
+        """루트 바로 아래 첫 record_tag 요소의 필드를 {컬럼명: 값} 으로 반환, 요소가 없으면 None
+
+        빈 본문이나 XML 이 아닌 본문은 ET.ParseError, 오류 응답은 ValueError 로 전달합니다.
+        """
+        root = ET.fromstring(content)
+        for element in (root, *root):
+            message = error_message(element.tag, element.text)
+            if message:
+                raise ValueError(f"오류 응답: {message}")
+
+        record = root.find(record_tag)
+        if record is None:
+            return None
+
+        return extract_fields(record, fields)
+
+
+class StreamingXmlDecoder(ElementTreeDecoder):
+    """XML 을 조금씩 읽으면서 첫 record_tag 요소가 끝나면 파싱 중단
+
+    결과는 ElementTreeDecoder 와 같고, 기관 시설/장비 목록처럼 뒤에 붙은 큰 부분은 읽지 않습니다.
+    작은 문서는 이벤트 처리 비용이 더 크므로 C 파서로 한 번에 파싱합니다.
+    """
+
+    name = 'xml-stream'
+    return_type = 'XML'
+
+    def __init__(self, chunk_size=4096, small_document_bytes=8192):
+        self.chunk_size = chunk_size
+        self.small_document_bytes = small_document_bytes
+
+    def decode(self, content, record_tag, fields):
+        if len(content) <= self.small_document_bytes:
+            return super().decode(content, record_tag, fields)
+
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        depth = 0
+        record = None
+        for offset in range(0, len(content), self.chunk_size):
+            parser.feed(content[offset:offset + self.chunk_size])
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if depth == 0 and error_message(element.tag, None):
+                        raise ValueError(f"오류 응답: {element.tag}")
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth == 1:
+                    message = error_message(element.tag, element.text)
+                    if message:
+                        raise ValueError(f"오류 응답: {message}")
+                # 루트 바로 아래 첫 record_tag 요소가 끝나면 나머지 문서는 읽지 않음
+                if depth == 1 and element.tag == record_tag:
+                    record = element
+                    break
+            if record is not None:
+                break
+        else:
+            parser.close()
+
+        if record is None:
+            return None
+
+        return extract_fields(record, fields)
+
+
+class JsonDecoder:
+    """returnType=JSON 응답에서 필드 추출 (값은 XML 과 같은 문자열로 변환)"""
+
+    name = 'json'
+    return_type = 'JSON'
+
+    def decode(self, content, record_tag, fields):
+        """ElementTreeDecoder.decode 와 같음 (JSON 이 아닌 본문, 오류 응답은 ValueError)"""
+        document = json.loads(content)
+        self.raise_for_error(document)
+        record = self.find_record(document, record_tag)
+        if isinstance(record, list):
+            record = record[0] if record else None
+        if not isinstance(record, dict):
+            return None
+
+        return {
+            column: (None if record[key] is None else str(record[key]))
+            for key, column in fields.items()
+            if key in record
+        }
+
+    def raise_for_error(self, document):
+        """최상위 또는 한 단계 감싼 객체에 오류 키가 있으면 ValueError"""
+        if not isinstance(document, dict):
+            return
+        for container in (document, *(value for value in document.values() if isinstance(value, dict))):
+            for key, value in container.items():
+                message = error_message(key, None if value is None else str(value))
+                if message:
+                    raise ValueError(f"오류 응답: {message}")
+
+    def find_record(self, document, record_tag):
+        """최상위 또는 한 단계 감싼 객체(예: {"HRDNet": {...}}) 안의 record_tag 값"""
+        if not isinstance(document, dict):
+            return None
+        if record_tag in document:
+            return document[record_tag]
+        for value in document.values():
+            if isinstance(value, dict) and record_tag in value:
+                return value[record_tag]
+        return None
+
+
+DECODERS = {decoder.name: decoder for decoder in (ElementTreeDecoder, StreamingXmlDecoder, JsonDecoder)}
+
+
+def get_decoder(name):
+    """응답 디코더 생성 ('xml', 'xml-stream', 'json')"""
+    if name not in DECODERS:
+        raise ValueError(f"지원하지 않는 응답 형식: {name} ({', '.join(DECODERS)})")
+    return DECODERS[name]()
+
+
+def cache_endpoint(endpoint, decoder):
+    """응답 캐시 저장 이름 (XML 은 기존 캐시와 호환되도록 그대로, JSON 은 'detail:json' 형태)"""
+    return endpoint if decoder.return_type == 'XML' else f"{endpoint}:{decoder.return_type.lower()}"
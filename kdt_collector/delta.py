@@ -0,0 +1,147 @@
+import csv
+import json
+import logging
+import os
+from datetime import date, datetime
+
+from kdt_collector.dataset import MANIFEST_NAME, dataset_collected_at, is_dataset_path, read_dataset_table
+from kdt_collector.decoders import DETAIL_FIELDS, EMPLOYMENT_FIELDS
+from kdt_collector.sinks import COLLECTED_AT_KEY, metadata_path
+
+# 310L01 목록에서 바로 채워지는 컬럼 (값이 바뀌면 과정을 다시 수집)
+BASIC_COLUMNS = [
+    '과정명', '훈련과정 ID', '회차', '훈련기관', '총 훈련일수', '총 훈련시간', '과정시작일', '과정종료일',
+    'NCS명', 'NCS코드', '훈련비', '정원', '수강신청 인원', '만족도', '지역', '주소', '과정페이지 링크',
+]
+
+# 310L02/310L03 으로 채워지는 컬럼 (변경 없는 과정은 이전 결과에서 그대로 가져옴)
+ENRICHED_COLUMNS = list(DETAIL_FIELDS.values()) + list(EMPLOYMENT_FIELDS.values()) + ['수료율']
+
+
+def normalize(value):
+    """비교용 문자열 (None/NaN 은 CSV 와 같이 빈 문자열, 숫자는 '20' 과 20.0 이 같도록 같은 형식)"""
+    if value is None or value != value:
+        return ''
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    text = str(value)
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return repr(number) if number == number and abs(number) != float('inf') else text
+
+
+def load_snapshot(path):
+    """이전 수집 결과(CSV/Parquet 파일 또는 파티션 데이터셋 디렉터리)를 {고유값: 행} 으로 로드"""
+    if is_dataset_path(path):
+        # 타입이 지정된 컬럼은 날짜만 CSV 와 같은 'YYYY-MM-DD' 로 바꾸고 숫자는 그대로 둠 (비교는 normalize)
+        table = read_dataset_table(path)
+        rows = [] if table is None else [
+            {column: value.strftime('%Y-%m-%d') if isinstance(value, date) else value for column, value in row.items()}
+            for row in table.to_pylist()
+        ]
+    elif os.path.splitext(path)[1].lower() == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet 결과 파일을 읽으려면 pyarrow 가 필요합니다: pip install pyarrow") from e
+        rows = pq.read_table(path).to_pylist()
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            rows = list(csv.DictReader(f))
+
+    snapshot = {row['고유값']: row for row in rows if row.get('고유값')}
+    logging.info(f"이전 수집 결과 로드: {path} ({len(snapshot)}개 과정)")
+    return snapshot
+
+
+def recorded_snapshot_date(path):
+    """이전 수집 결과에 기록된 수집 시각 (sinks.COLLECTED_AT_KEY 참고), 없으면 None"""
+    if is_dataset_path(path):
+        collected_at = dataset_collected_at(path)
+    elif os.path.splitext(path)[1].lower() == '.parquet':
+        import pyarrow.parquet as pq
+        metadata = pq.read_schema(path).metadata or {}
+        collected_at = metadata.get(COLLECTED_AT_KEY.encode('utf-8'), b'').decode('utf-8') or None
+    else:
+        try:
+            with open(metadata_path(path), encoding='utf-8') as f:
+                collected_at = json.load(f).get(COLLECTED_AT_KEY)
+        except (OSError, ValueError):
+            collected_at = None
+    return datetime.fromisoformat(collected_at) if collected_at else None
+
+
+def snapshot_date(path):
+    """이전 수집 결과를 수집한 시각 (결과에 기록된 수집 시각, 없으면 파일 수정 시각)
+
+    파일 수정 시각은 복사/재저장하면 바뀌고 수집보다 늦으므로, 그사이 열린 취업 통계를 놓칠 수 있습니다.
+    기록이 없는 이전 결과는 --previous-date 로 수집 날짜를 지정하세요.
+    """
+    recorded = recorded_snapshot_date(path)
+    if recorded is not None:
+        return recorded
+
+    modified_path = os.path.join(path, MANIFEST_NAME) if is_dataset_path(path) else path
+    modified = datetime.fromtimestamp(os.path.getmtime(modified_path))
+    logging.warning(f"이전 결과에 수집 시각 기록이 없어 파일 수정 시각({modified:%Y-%m-%d})을 사용합니다: {path}")
+    return modified
+
+
+def carry_over_row(item, previous_row):
+    """새 목록 항목(CourseRecord 또는 dict)에 이전 결과의 상세/취업 정보를 합친 사본"""
+    carried = item.copy()
+    for column in ENRICHED_COLUMNS:
+        if column in previous_row:
+            carried[column] = previous_row[column]
+    return carried
+
+
+class DeltaPlan:
+    """새 310L01 목록을 이전 결과와 비교해 과정별 처리 방식 결정
+
+    - full: 새 과정 또는 기본 정보가 바뀐 과정 → 상세/취업 정보 모두 수집
+    - employment: 이전 결과 이후 과정이 끝났거나 3개월/6개월 취업 통계가 새로 집계된 과정 → 310L03 만 수집
+    - carried: 변경 없는 과정 → 이전 결과의 상세/취업 정보 재사용 (API 호출 없음)
+    """
+
+    def __init__(self, items, previous, stage_now, stage_then):
+        # stage_now / stage_then: 과정종료일 → 현재 / 이전 결과 시점에 조회 가능했던 취업 통계 단계
+        self.full = []
+        self.employment = []
+        self.carried = {}
+        self.previous = previous
+        self.changed_count = 0
+
+        listed_keys = set()
+        for item in items:
+            key = item['고유값']
+            listed_keys.add(key)
+            previous_row = previous.get(key)
+            if previous_row is None:
+                self.full.append(item)
+            elif any(normalize(item.get(column)) != normalize(previous_row.get(column)) for column in BASIC_COLUMNS):
+                self.changed_count += 1
+                self.full.append(item)
+            elif self.employment_opened(item, stage_now, stage_then):
+                self.employment.append(item)
+            else:
+                self.carried[key] = carry_over_row(item, previous_row)
+
+        self.removed_count = sum(1 for key in previous if key not in listed_keys)
+        self.employment_keys = {item['고유값'] for item in self.employment}
+
+    def employment_opened(self, item, stage_now, stage_then):
+        now = stage_now(item.get('과정종료일'))
+        then = stage_then(item.get('과정종료일'))
+        if now is None or then is None:
+            return False
+        return now > then
+
+    def log_summary(self):
+        logging.info(
+            f"델타 수집: 신규 {len(self.full) - self.changed_count}개, 변경 {self.changed_count}개, "
+            f"취업 통계 갱신 {len(self.employment)}개, 유지 {len(self.carried)}개, "
+            f"목록에서 빠진 과정 {self.removed_count}개"
+        )
@@ -0,0 +1,119 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+# 과정 종료 후 310L03 에서 새 값이 나오는 시점 (개월): 0 수료인원, 3/6 취업 통계
+EMPLOYMENT_STAGES = (0, 3, 6)
+
+# 아직 끝나지 않은 과정 (수료인원도 없음)
+NOT_ENDED = -1
+
+
+class EmploymentScheduler:
+    """과정종료일 기준으로 310L03(수료인원/취업 통계) 조회 대상을 고르고, 다음 단계 통계를 기다리는 과정은 대기열에 보관"""
+
+    def __init__(self, queue_path='kdt_employment_queue.json', today=None):
+        self.queue_path = queue_path
+        self.today = pd.Timestamp(today or datetime.now()).normalize()
+        self.lock = threading.Lock()
+        self.skipped = 0
+        self.queue = self.load_queue()
+
+    def load_queue(self):
+        """이전 실행에서 저장한 대기열 로드"""
+        if not self.queue_path or not os.path.exists(self.queue_path):
+            return {}
+        try:
+            with open(self.queue_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"취업 통계 대기열 로드 실패: {e}")
+            return {}
+
+    def save_queue(self):
+        """대기열을 임시 파일에 쓴 뒤 교체 (중간에 중단되어도 기존 파일 유지)"""
+        if not self.queue_path:
+            return
+        with self.lock:
+            tmp_path = f"{self.queue_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.queue, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.queue_path)
+        logging.info(f"취업 통계 대기열 저장: {len(self.queue)}개 (이번 실행에서 건너뜀 {self.skipped}개)")
+
+    def available_stage(self, end_date, today=None):
+        """조회 가능한 310L03 단계 (NOT_ENDED: 진행 중, 0: 수료인원, 3: 3개월, 6: 6개월), 날짜 오류 시 None
+
+        today 를 지정하면 그 날짜 기준 (예: 이전 수집 결과를 만든 날짜)
+        """
+        end = pd.to_datetime(end_date, errors='coerce')
+        if pd.isna(end):
+            return None
+
+        today = pd.Timestamp(today).normalize() if today is not None else self.today
+        stage = NOT_ENDED
+        for months in EMPLOYMENT_STAGES:
+            if end + pd.DateOffset(months=months) <= today:
+                stage = months
+        return stage
+
+    def next_due_date(self, end_date, stage):
+        """다음 단계 값(수료인원 또는 취업 통계)이 나오는 날짜"""
+        end = pd.to_datetime(end_date)
+        for months in EMPLOYMENT_STAGES:
+            if months > stage:
+                return (end + pd.DateOffset(months=months)).strftime('%Y-%m-%d')
+        return None
+
+    def should_fetch(self, item):
+        """이번 실행에서 310L03 을 조회할지 판단하고 대기열 갱신
+
+        종료된 과정은 취업 통계 단계와 관계없이 조회해 수료인원을 채우고, 6개월 통계가 나오기 전이면
+        다음 단계를 위해 대기열에 남깁니다. 아직 끝나지 않은 과정만 조회하지 않고 종료일로 대기열에 넣습니다.
+        """
+        stage = self.available_stage(item.get('과정종료일'))
+        if stage is None:
+            # 종료일을 알 수 없으면 기존처럼 조회
+            return True
+
+        key = item['고유값']
+        with self.lock:
+            if stage < EMPLOYMENT_STAGES[-1]:
+                self.queue[key] = {
+                    '훈련과정 ID': item['훈련과정 ID'],
+                    '회차': item['회차'],
+                    '훈련기관ID': item['훈련기관ID'],
+                    '과정종료일': item['과정종료일'],
+                    'due_date': self.next_due_date(item['과정종료일'], stage),
+                }
+            else:
+                self.queue.pop(key, None)
+
+            if stage == NOT_ENDED:
+                self.skipped += 1
+                return False
+        return True
+
+    def merge_updates(self, updates, keys, skipped=0):
+        """다른 프로세스에서 갱신한 대기열 반영 (keys 중 updates 에 없는 과정은 대기열에서 제거)"""
+        with self.lock:
+            for key in keys:
+                if key in updates:
+                    self.queue[key] = updates[key]
+                else:
+                    self.queue.pop(key, None)
+            self.skipped += skipped
+
+    def due_items(self):
+        """대기열 중 다음 단계 통계가 나왔을 과정 목록"""
+        today = self.today.strftime('%Y-%m-%d')
+        with self.lock:
+            return [
+                {'고유값': key, **entry}
+                for key, entry in self.queue.items()
+                if entry.get('due_date') and entry['due_date'] <= today
+            ]
@@ -0,0 +1,80 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TokenBucket:
+    """초당 요청 수를 제한하는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate, capacity=None):
+        # rate: 초당 채워지는 토큰 수, capacity: 순간적으로 허용하는 최대 요청 수
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait_time = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+class EnrichmentEngine:
+    """동시 요청 수를 제한한 상세/취업 정보 수집 엔진"""
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max(1, int(max_workers))
+
+    def imap(self, func, items, progress_callback=None):
+        """입력 순서대로 결과를 반환하는 제너레이터
+
+        동시에 진행되는 작업은 max_workers 의 2배까지만 유지하므로
+        입력이 많아도 대기 중인 결과가 메모리에 쌓이지 않습니다.
+        progress_callback(완료 개수, 전체 개수)는 호출한 스레드에서 실행됩니다.
+        """
+        items = list(items)
+        total = len(items)
+        window = self.max_workers * 2
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            next_index = 0
+            completed = 0
+
+            while next_index < total or pending:
+                # 작업 창이 찰 때까지 제출
+                while next_index < total and len(pending) < window:
+                    pending.append(executor.submit(func, items[next_index]))
+                    next_index += 1
+
+                # 가장 먼저 제출한 작업부터 결과 반환 (입력 순서 보장)
+                result = pending.popleft().result()
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, total)
+
+                yield result
+
+    def map(self, func, items, progress_callback=None):
+        """입력 순서대로 정렬된 결과 리스트 반환"""
+        results = list(self.imap(func, items, progress_callback))
+        logging.info(f"병렬 수집 완료: {len(results)}개 (동시 요청 {self.max_workers}개)")
+        return results
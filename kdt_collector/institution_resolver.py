@@ -0,0 +1,100 @@
+from functools import lru_cache
+
+
+class TrieNode:
+    __slots__ = ('children', 'lengths', 'min_orders', 'entries')
+
+    def __init__(self):
+        self.children = {}
+        # 하위 변형명의 (길이, 그룹 순서) - build 후 길이순 정렬 + 누적 최소 그룹 순서
+        self.entries = []
+        self.lengths = []
+        self.min_orders = []
+
+
+class InstitutionResolver:
+    """기관명 → 그룹명 변환기 (KDTDataCalculator.group_institutions_advanced 와 같은 결과)
+
+    그룹 사전으로 정확 일치용 해시맵과 변형명 접두사 트라이를 한 번만 만들고,
+    원본 기관명별 결과는 크기 제한 LRU 캐시에 보관합니다.
+    """
+
+    def __init__(self, institution_groups, cache_size=4096):
+        self.group_names = list(institution_groups)
+
+        # 정확 일치: 변형명이 여러 그룹에 있으면 먼저 나온 그룹 우선
+        self.exact_map = {}
+        for group_name, variants in institution_groups.items():
+            for variant in variants:
+                self.exact_map.setdefault(variant, group_name)
+
+        # 유사도(공통 접두사 길이 / 긴 쪽 길이) 검색용 트라이
+        self.root = TrieNode()
+        for order, variants in enumerate(institution_groups.values()):
+            for variant in variants:
+                if not variant:
+                    continue
+                node = self.root
+                for char in variant:
+                    node = node.children.setdefault(char, TrieNode())
+                    node.entries.append((len(variant), order))
+        self.finalize(self.root)
+
+        self.resolve_cached = lru_cache(maxsize=cache_size)(self.resolve_uncached)
+
+    def finalize(self, node):
+        node.entries.sort()
+        node.lengths = [length for length, _ in node.entries]
+        running_min = None
+        for _, order in node.entries:
+            running_min = order if running_min is None else min(running_min, order)
+            node.min_orders.append(running_min)
+        node.entries = None
+        for child in node.children.values():
+            self.finalize(child)
+
+    def resolve(self, institution_name, similarity_threshold=0.6):
+        """기관명 그룹화 (빈 값은 그대로 반환)"""
+        if not institution_name:
+            return institution_name
+        return self.resolve_cached(institution_name, similarity_threshold)
+
+    def resolve_uncached(self, institution_name, similarity_threshold):
+        # 정확한 매칭 우선 확인
+        group_name = self.exact_map.get(institution_name)
+        if group_name is not None:
+            return group_name
+
+        if similarity_threshold <= 0:
+            # 임계값이 0 이하이면 어떤 변형명과도 유사한 것으로 판단 (첫 그룹)
+            return self.group_names[0] if self.group_names else institution_name
+
+        # 접두사 경로를 따라가며 조건을 만족하는 변형명 중 가장 앞선 그룹 선택
+        name_length = len(institution_name)
+        best_order = None
+        node = self.root
+        for depth, char in enumerate(institution_name, 1):
+            node = node.children.get(char)
+            if node is None:
+                break
+            if depth / name_length < similarity_threshold:
+                continue
+
+            # 길이가 짧은 변형명일수록 유사도가 높으므로 조건을 만족하는 최대 길이를 이분 탐색
+            low, high = 0, len(node.lengths)
+            while low < high:
+                middle = (low + high) // 2
+                if depth / max(name_length, node.lengths[middle]) >= similarity_threshold:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low > 0:
+                order = node.min_orders[low - 1]
+                best_order = order if best_order is None else min(best_order, order)
+
+        if best_order is not None:
+            return self.group_names[best_order]
+        return institution_name
+
+    def cache_info(self):
+        return self.resolve_cached.cache_info()
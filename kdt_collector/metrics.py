@@ -0,0 +1,261 @@
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+
+# 응답 시간 히스토그램 구간 상한 (1ms ~ 약 57초, 1.5배 간격)
+LATENCY_BUCKETS = tuple(round(0.001 * 1.5 ** i, 6) for i in range(28))
+
+# 리포트에 포함하는 응답 시간 백분위
+PERCENTILES = (50, 90, 99)
+
+
+def empty_endpoint_stats():
+    return {
+        'requests': 0,
+        'errors': 0,
+        'retries': 0,
+        'bytes': 0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'status_codes': {},
+        'latency_sum': 0.0,
+        'latency_max': 0.0,
+        # 구간별 개수 (마지막 칸은 LATENCY_BUCKETS 를 넘는 요청)
+        'latency_buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+    }
+
+
+def histogram_quantile(quantile, buckets, latency_max):
+    """히스토그램 구간 개수로 백분위 추정 (구간 안에서는 선형 보간)"""
+    total = sum(buckets)
+    if total == 0:
+        return 0.0
+
+    rank = quantile * total
+    cumulative = 0
+    for index, count in enumerate(buckets):
+        if count and cumulative + count >= rank:
+            if index == len(LATENCY_BUCKETS):
+                return latency_max
+            lower = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+            upper = min(LATENCY_BUCKETS[index], latency_max)
+            return lower + (max(upper, lower) - lower) * (rank - cumulative) / count
+        cumulative += count
+    return latency_max
+
+
+class CollectorMetrics:
+    """수집기 지표 (엔드포인트별 요청 수, 응답 시간 분포, 수신 바이트, 재시도, 캐시 적중, 처리 행 수)
+
+    path 를 지정하면 {path}.json 과 Prometheus 텍스트 형식 {path}.prom 으로 저장합니다.
+    여러 수집 스레드에서 동시에 기록할 수 있고, snapshot() 결과는 merge() 로 합칠 수 있습니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.reporter = None
+        self.stop_event = threading.Event()
+        self.reset()
+
+    def reset(self):
+        """새 실행을 위해 카운터, 히스토그램, 현재 값 지표를 모두 비움"""
+        with self.lock:
+            self.started_at = time.time()
+            self.endpoints = {}
+            self.gauges = {}
+            self.rows = 0
+
+    def endpoint_stats(self, endpoint):
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = empty_endpoint_stats()
+        return stats
+
+    def record_request(self, endpoint, elapsed, status, nbytes=0, failed=False):
+        """요청 1회 결과 기록 (status: HTTP 상태 코드 또는 오류 이름)"""
+        bucket = bisect_left(LATENCY_BUCKETS, elapsed)
+        with self.lock:
+            stats = self.endpoint_stats(endpoint)
+            stats['requests'] += 1
+            stats['bytes'] += nbytes
+            stats['latency_sum'] += elapsed
+            stats['latency_max'] = max(stats['latency_max'], elapsed)
+            stats['latency_buckets'][bucket] += 1
+            stats['status_codes'][str(status)] = stats['status_codes'].get(str(status), 0) + 1
+            if failed:
+                stats['errors'] += 1
+
+    def record_retry(self, endpoint):
+        with self.lock:
+            self.endpoint_stats(endpoint)['retries'] += 1
+
+    def record_cache(self, endpoint, hit):
+        with self.lock:
+            self.endpoint_stats(endpoint)['cache_hits' if hit else 'cache_misses'] += 1
+
+    def record_rows(self, count):
+        with self.lock:
+            self.rows += count
+
+    def set_gauge(self, name, endpoint, value):
+        """현재 값 지표 (예: 엔드포인트별 동시 요청 한도)"""
+        with self.lock:
+            self.gauges.setdefault(name, {})[endpoint] = value
+
+    def snapshot(self):
+        """현재까지의 지표를 JSON 으로 저장 가능한 dict 로 반환"""
+        with self.lock:
+            elapsed = time.time() - self.started_at
+            endpoints = {}
+            for endpoint, stats in self.endpoints.items():
+                latency_count = sum(stats['latency_buckets'])
+                endpoints[endpoint] = {
+                    **{key: value for key, value in stats.items() if not key.startswith('latency_')},
+                    'status_codes': dict(stats['status_codes']),
+                    'latency': {
+                        'count': latency_count,
+                        'sum_seconds': stats['latency_sum'],
+                        'max_seconds': stats['latency_max'],
+                        'mean_seconds': stats['latency_sum'] / latency_count if latency_count else 0.0,
+                        **{
+                            f"p{percentile}_seconds": histogram_quantile(
+                                percentile / 100, stats['latency_buckets'], stats['latency_max']
+                            )
+                            for percentile in PERCENTILES
+                        },
+                        'buckets': list(stats['latency_buckets']),
+                    },
+                }
+            return {
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+                'elapsed_seconds': elapsed,
+                'rows': self.rows,
+                'rows_per_second': self.rows / elapsed if elapsed > 0 else 0.0,
+                'latency_bucket_bounds': list(LATENCY_BUCKETS),
+                'endpoints': endpoints,
+                'gauges': {name: dict(values) for name, values in self.gauges.items()},
+            }
+
+    def merge(self, snapshot):
+        """다른 프로세스에서 만든 snapshot() 결과를 합산 (기간 분할 수집용)"""
+        with self.lock:
+            self.rows += snapshot.get('rows', 0)
+            for endpoint, other in snapshot.get('endpoints', {}).items():
+                stats = self.endpoint_stats(endpoint)
+                for key in ('requests', 'errors', 'retries', 'bytes', 'cache_hits', 'cache_misses'):
+                    stats[key] += other.get(key, 0)
+                for status, count in other.get('status_codes', {}).items():
+                    stats['status_codes'][status] = stats['status_codes'].get(status, 0) + count
+                latency = other.get('latency', {})
+                stats['latency_sum'] += latency.get('sum_seconds', 0.0)
+                stats['latency_max'] = max(stats['latency_max'], latency.get('max_seconds', 0.0))
+                for index, count in enumerate(latency.get('buckets', [])):
+                    stats['latency_buckets'][index] += count
+
+    def to_prometheus(self, snapshot=None):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 읽을 수 있음)"""
+        snapshot = snapshot or self.snapshot()
+        endpoints = snapshot['endpoints']
+        lines = []
+
+        def metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                label_text = ','.join(f'{key}="{label}"' for key, label in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        counters = [
+            ('kdt_requests_total', 'requests', "Work24 API 요청 수"),
+            ('kdt_request_errors_total', 'errors', "429/5xx 및 연결 오류 응답 수"),
+            ('kdt_request_retries_total', 'retries', "재시도 횟수"),
+            ('kdt_response_bytes_total', 'bytes', "수신한 응답 본문 바이트"),
+            ('kdt_cache_hits_total', 'cache_hits', "응답 캐시 적중 수"),
+            ('kdt_cache_misses_total', 'cache_misses', "응답 캐시 미적중 수"),
+        ]
+        for name, key, help_text in counters:
+            metric(name, 'counter', help_text,
+                   [({'endpoint': endpoint}, stats[key]) for endpoint, stats in endpoints.items()])
+
+        metric('kdt_responses_total', 'counter', "상태 코드별 응답 수", [
+            ({'endpoint': endpoint, 'status': status}, count)
+            for endpoint, stats in endpoints.items()
+            for status, count in stats['status_codes'].items()
+        ])
+
+        lines.append("# HELP kdt_request_duration_seconds Work24 API 응답 시간")
+        lines.append("# TYPE kdt_request_duration_seconds histogram")
+        for endpoint, stats in endpoints.items():
+            latency = stats['latency']
+            cumulative = 0
+            for bound, count in zip(list(LATENCY_BUCKETS) + ['+Inf'], latency['buckets']):
+                cumulative += count
+                lines.append(f'kdt_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+            lines.append(f'kdt_request_duration_seconds_sum{{endpoint="{endpoint}"}} {latency["sum_seconds"]}')
+            lines.append(f'kdt_request_duration_seconds_count{{endpoint="{endpoint}"}} {latency["count"]}')
+
+        metric('kdt_rows_total', 'counter', "처리한 과정 행 수", [({}, snapshot['rows'])])
+        metric('kdt_rows_per_second', 'gauge', "실행 시작 이후 초당 처리 행 수", [({}, snapshot['rows_per_second'])])
+        for name, values in snapshot['gauges'].items():
+            metric(f"kdt_{name}", 'gauge', name,
+                   [({'endpoint': endpoint}, value) for endpoint, value in values.items()])
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """{path}.json, {path}.prom 저장 (임시 파일 후 교체), path 가 없으면 아무것도 하지 않음"""
+        if not self.path:
+            return None
+        snapshot = self.snapshot()
+        for extension, content in (
+            ('json', json.dumps(snapshot, ensure_ascii=False, indent=1)),
+            ('prom', self.to_prometheus(snapshot)),
+        ):
+            path = f"{self.path}.{extension}"
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return snapshot
+
+    def start_periodic(self, interval=30, before_write=None):
+        """수집 중 interval 초마다 지표 파일 갱신 (before_write 는 저장 직전에 호출)"""
+        if not self.path or interval <= 0 or self.reporter is not None:
+            return
+        self.stop_event.clear()
+
+        def report():
+            while not self.stop_event.wait(interval):
+                try:
+                    if before_write:
+                        before_write()
+                    self.write()
+                except Exception as e:
+                    logging.error(f"수집 지표 저장 실패: {e}")
+
+        self.reporter = threading.Thread(target=report, daemon=True)
+        self.reporter.start()
+
+    def stop_periodic(self):
+        if self.reporter is not None:
+            self.stop_event.set()
+            self.reporter.join()
+            self.reporter = None
+
+    def log_summary(self, snapshot=None):
+        snapshot = snapshot or self.snapshot()
+        for endpoint, stats in snapshot['endpoints'].items():
+            latency = stats['latency']
+            logging.info(
+                f"[{endpoint}] 지표: 요청 {stats['requests']}회, 재시도 {stats['retries']}회, "
+                f"{stats['bytes'] / 1024:.0f}KB, 캐시 적중 {stats['cache_hits']}회, "
+                f"p50 {latency['p50_seconds'] * 1000:.0f}ms / p90 {latency['p90_seconds'] * 1000:.0f}ms / "
+                f"p99 {latency['p99_seconds'] * 1000:.0f}ms"
+            )
+        logging.info(f"처리 {snapshot['rows']}행, {snapshot['rows_per_second']:.1f}행/s"
+                     + (f" (지표 파일: {self.path}.json, {self.path}.prom)" if self.path else ""))
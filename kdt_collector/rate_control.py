@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+
+
+class AIMDController:
+    """엔드포인트별 동시 요청 한도를 AIMD 방식으로 조절하는 제어기
+
+    응답이 빠르고 정상이면 한도만큼 연속 성공할 때마다 한도를 1 늘리고(additive increase),
+    429/5xx, 연결 오류/타임아웃 또는 목표 응답 시간 초과 시 한도를 줄입니다(multiplicative decrease).
+    감소 직전에 보낸 요청들의 실패로 한도가 연달아 줄지 않도록, 마지막 감소 이후에
+    시작한 요청의 결과만 감소에 반영합니다.
+    """
+
+    def __init__(self, name, max_limit=16, min_limit=1, initial_limit=None,
+                 decrease_factor=0.5, latency_target=2.0):
+        self.name = name
+        self.max_limit = max(1, int(max_limit))
+        self.min_limit = max(1, min(int(min_limit), self.max_limit))
+        self.limit = float(initial_limit if initial_limit is not None else max(self.min_limit, self.max_limit // 2))
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+
+        self.in_flight = 0
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+        # 로그에 표시할 한도 변경 사이의 실제 처리량
+        self.completed = 0
+        self.rate_window_started = time.monotonic()
+
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """한도 안에서 요청 슬롯을 얻을 때까지 대기하고 요청 시작 시각 반환"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started, throttled=False, elapsed=None, reason=''):
+        """요청 결과 반영 (throttled: 429/5xx/타임아웃 등 서버 과부하 신호)"""
+        with self.condition:
+            self.in_flight -= 1
+            self.completed += 1
+
+            slow = elapsed is not None and self.latency_target and elapsed > self.latency_target
+            if throttled or slow:
+                if started >= self.last_decrease:
+                    self.decrease(reason if throttled else f"응답 {elapsed:.1f}s")
+            else:
+                self.successes += 1
+                if self.successes >= int(self.limit) and self.limit < self.max_limit:
+                    self.change_limit(self.limit + 1, "증가", logging.INFO, "정상 응답")
+                    self.increases += 1
+                    self.successes = 0
+
+            self.condition.notify_all()
+
+    def decrease(self, reason):
+        if int(self.limit) > self.min_limit:
+            self.change_limit(max(self.min_limit, int(self.limit * self.decrease_factor)), "감소", logging.WARNING, reason)
+            self.decreases += 1
+        self.successes = 0
+        self.last_decrease = time.monotonic()
+
+    def change_limit(self, new_limit, action, level, reason):
+        now = time.monotonic()
+        elapsed = now - self.rate_window_started
+        rate = self.completed / elapsed if elapsed > 0 else 0.0
+        logging.log(level, f"[{self.name}] 동시 요청 한도 {action}: {int(self.limit)} → {int(new_limit)} "
+                           f"({reason}, 최근 {rate:.1f}회/s)")
+        self.limit = float(new_limit)
+        self.completed = 0
+        self.rate_window_started = now
+
+    def log_summary(self):
+        with self.condition:
+            logging.info(f"[{self.name}] 최종 동시 요청 한도 {int(self.limit)} "
+                         f"(증가 {self.increases}회, 감소 {self.decreases}회)")
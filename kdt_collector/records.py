@@ -0,0 +1,144 @@
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
+
+import pandas as pd
+
+# 결과 컬럼명 → CourseRecord 필드명 (자동 계산 컬럼은 계산 단계에서 DataFrame 에 추가)
+COLUMN_FIELDS = {
+    '고유값': 'key',
+    '과정명': 'title',
+    '훈련과정 ID': 'trpr_id',
+    '회차': 'trpr_degr',
+    '훈련기관': 'inst_name',
+    '훈련기관ID': 'inst_id',
+    '총 훈련일수': 'train_days',
+    '총 훈련시간': 'train_hours',
+    '과정시작일': 'start_date',
+    '과정종료일': 'end_date',
+    'NCS명': 'ncs_name',
+    'NCS코드': 'ncs_code',
+    '훈련비': 'course_fee',
+    '정원': 'capacity',
+    '수강신청 인원': 'enrolled',
+    '수료인원': 'completed',
+    '수료율': 'completion_rate',
+    '만족도': 'satisfaction',
+    '취업인원 (3개월)': 'employed_3',
+    '취업률 (3개월)': 'employment_rate_3',
+    '취업인원 (6개월)': 'employed_6',
+    '취업률 (6개월)': 'employment_rate_6',
+    '지역': 'region',
+    '주소': 'address',
+    '과정페이지 링크': 'link',
+    '실제 훈련비': 'actual_fee',
+    '정부지원금': 'subsidy',
+}
+
+FIELD_COLUMNS = {field: column for column, field in COLUMN_FIELDS.items()}
+
+
+@dataclass(slots=True)
+class CourseRecord:
+    """수집 중인 과정 1건 (기본 정보 + 상세/취업 정보)
+
+    dict 대신 슬롯 필드에 값을 저장해 과정당 메모리를 줄이고, 상세/취업 정보는 제자리에서 갱신합니다.
+    record['과정종료일'], record.get('고유값') 처럼 결과 컬럼명으로도 읽고 쓸 수 있으며,
+    결과 파일 형식(dict)으로는 출력 단계에서 to_row()/to_frame() 으로 변환합니다.
+    """
+
+    key: str = ''
+    title: str = ''
+    trpr_id: str = ''
+    trpr_degr: str = ''
+    inst_name: str = ''
+    inst_id: str = ''
+    train_days: str = ''
+    train_hours: str = ''
+    start_date: str = ''
+    end_date: str = ''
+    ncs_name: str = ''
+    ncs_code: str = ''
+    course_fee: str = ''
+    capacity: str = ''
+    enrolled: str = ''
+    completed: str = ''
+    completion_rate: str = ''
+    satisfaction: str = ''
+    employed_3: str = ''
+    employment_rate_3: str = ''
+    employed_6: str = ''
+    employment_rate_6: str = ''
+    region: str = ''
+    address: str = ''
+    link: str = ''
+    actual_fee: str = ''
+    subsidy: str = ''
+
+    @classmethod
+    def from_api(cls, item):
+        """310L01 srchList 항목으로 생성"""
+        get = item.get
+        return cls(
+            key=f"{get('trprId', '')}_{get('trprDegr', '')}_{get('instCd', '')}",
+            title=get('title', ''),
+            trpr_id=get('trprId', ''),
+            trpr_degr=get('trprDegr', ''),
+            inst_name=get('instNm', ''),
+            inst_id=get('instCd', ''),
+            train_days=get('trDcnt', ''),
+            train_hours=get('trtm', ''),
+            start_date=get('traStartDate', ''),
+            end_date=get('traEndDate', ''),
+            ncs_name=get('ncsNm', ''),
+            ncs_code=get('ncsCd', ''),
+            course_fee=get('courseMan', ''),
+            capacity=get('yardMan', ''),
+            enrolled=get('regCourseMan', ''),
+            satisfaction=get('stdgScor', ''),
+            region=get('trngAreaCd', ''),
+            address=get('address', ''),
+            link=get('titleLink', ''),
+        )
+
+    @classmethod
+    def from_row(cls, row):
+        """결과 컬럼명 dict (체크포인트, 이전 결과 파일 등)로 생성, 모르는 컬럼은 무시"""
+        return cls(**{COLUMN_FIELDS[column]: value for column, value in row.items() if column in COLUMN_FIELDS})
+
+    def __getitem__(self, column):
+        return getattr(self, COLUMN_FIELDS[column])
+
+    def __setitem__(self, column, value):
+        setattr(self, COLUMN_FIELDS[column], value)
+
+    def __contains__(self, column):
+        return column in COLUMN_FIELDS
+
+    def get(self, column, default=None):
+        field = COLUMN_FIELDS.get(column)
+        return getattr(self, field) if field is not None else default
+
+    def update(self, values):
+        """{결과 컬럼명: 값} 을 제자리에서 반영 (상세/취업 정보 결합)"""
+        for column, value in values.items():
+            setattr(self, COLUMN_FIELDS[column], value)
+
+    def copy(self):
+        return replace(self)
+
+    def to_row(self):
+        """결과 컬럼명 dict 로 변환"""
+        return {column: getattr(self, field) for column, field in COLUMN_FIELDS.items()}
+
+
+RECORD_FIELDS = [field.name for field in fields(CourseRecord)]
+
+
+def to_frame(rows):
+    """과정 목록을 결과 컬럼명 DataFrame 으로 변환 (CourseRecord 는 컬럼 단위로 바로 구성)"""
+    if rows and isinstance(rows[0], CourseRecord):
+        return pd.DataFrame({
+            FIELD_COLUMNS[field]: list(map(attrgetter(field), rows))
+            for field in RECORD_FIELDS
+        })
+    return pd.DataFrame(rows)
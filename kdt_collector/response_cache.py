@@ -0,0 +1,119 @@
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+
+DAY_SECONDS = 24 * 60 * 60
+
+# 진행 중인 과정 응답의 엔드포인트별 유효 기간
+DEFAULT_TTLS = {
+    'detail': 30 * DAY_SECONDS,
+    'employment': 7 * DAY_SECONDS,
+}
+
+# 과정 종료 후 이 기간이 지난 뒤 받은 응답은 더 이상 바뀌지 않는 것으로 간주 (만료 없음)
+# 취업 통계는 6개월 취업률이 확정되는 시점까지 기다림
+DEFAULT_FINAL_AFTER_DAYS = {
+    'detail': 0,
+    'employment': 190,
+}
+
+
+def endpoint_kind(endpoint):
+    """저장 이름에서 응답 형식을 뗀 엔드포인트 이름 ('detail:json' → 'detail')"""
+    return endpoint.partition(':')[0]
+
+
+class ResponseCache:
+    """310L02/310L03 응답 본문을 (훈련과정 ID, 회차, 훈련기관ID, 엔드포인트) 기준으로 저장하는 SQLite 캐시
+
+    엔드포인트 이름에 ':json' 처럼 응답 형식을 붙여 XML/JSON 응답을 따로 저장할 수 있습니다.
+    """
+
+    def __init__(self, path='kdt_response_cache.sqlite3', ttls=None, final_after_days=None, busy_timeout=30.0):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.final_after_days = {**DEFAULT_FINAL_AFTER_DAYS, **(final_after_days or {})}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        # 여러 수집 스레드가 하나의 연결을 잠금으로 공유
+        # 기간 분할 수집에서는 여러 프로세스가 같은 파일에 쓰므로 잠금이 풀릴 때까지 busy_timeout 초 대기
+        self.conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self.conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                trpr_id TEXT NOT NULL,
+                trpr_degr TEXT NOT NULL,
+                inst_cd TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                fetched_at REAL NOT NULL,
+                is_final INTEGER NOT NULL,
+                PRIMARY KEY (trpr_id, trpr_degr, inst_cd, endpoint)
+            )
+        """)
+
+    def get(self, trpr_id, trpr_degr, inst_cd, endpoint):
+        """유효한 응답 본문(bytes) 반환, 없거나 만료되었으면 None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, fetched_at, is_final FROM responses "
+                "WHERE trpr_id = ? AND trpr_degr = ? AND inst_cd = ? AND endpoint = ?",
+                (str(trpr_id), str(trpr_degr), str(inst_cd), endpoint)
+            ).fetchone()
+
+            if row is not None:
+                body, fetched_at, is_final = row
+                if is_final or time.time() - fetched_at < self.ttls.get(endpoint_kind(endpoint), 0):
+                    self.hits += 1
+                    return body
+
+            self.misses += 1
+            return None
+
+    def put(self, trpr_id, trpr_degr, inst_cd, endpoint, body, end_date=None):
+        """응답 본문 저장 (과정 종료일 기준으로 확정 응답 여부 기록)
+
+        확정 응답은 만료되지 않으므로 호출하는 쪽에서 디코딩해 정상 응답인지 확인한 본문만 저장합니다.
+        """
+        is_final = self.is_final(endpoint, end_date)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (str(trpr_id), str(trpr_degr), str(inst_cd), endpoint, body, time.time(), int(is_final))
+            )
+
+    def invalidate(self, trpr_id, trpr_degr, inst_cd, endpoint):
+        """읽을 수 없는 저장 응답 삭제 (직전 get 은 미적중으로 집계)"""
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM responses WHERE trpr_id = ? AND trpr_degr = ? AND inst_cd = ? AND endpoint = ?",
+                (str(trpr_id), str(trpr_degr), str(inst_cd), endpoint)
+            )
+            self.hits -= 1
+            self.misses += 1
+
+    def is_final(self, endpoint, end_date, now=None):
+        """과정 종료 후 충분한 시간이 지나 응답이 바뀌지 않는지 여부"""
+        end = pd.to_datetime(end_date, errors='coerce')
+        if pd.isna(end):
+            return False
+
+        now = now or datetime.now()
+        return (now - end).days >= self.final_after_days.get(endpoint_kind(endpoint), 0)
+
+    def log_summary(self):
+        total = self.hits + self.misses
+        hit_rate = self.hits / total * 100 if total else 0.0
+        logging.info(f"응답 캐시: 적중 {self.hits}회, 미적중 {self.misses}회 (적중률 {hit_rate:.1f}%)")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,137 @@
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import time
+from datetime import datetime, timedelta
+
+from kdt_collector.sinks import metadata_path
+
+
+class SharedTokenBucket:
+    """여러 프로세스가 하나의 초당 요청 한도를 나눠 쓰는 토큰 버킷
+
+    TokenBucket 과 같은 acquire() 를 제공하며, 상태를 공유 메모리에 두므로
+    프로세스 풀 initializer 로 넘겨 모든 작업 프로세스에서 사용할 수 있습니다.
+    """
+
+    def __init__(self, rate, capacity=None, context=None):
+        context = context or multiprocessing.get_context()
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        # time.monotonic 은 같은 시스템의 프로세스끼리 공유되는 시계
+        self.tokens = context.Value('d', self.capacity, lock=False)
+        self.last_refill = context.Value('d', time.monotonic(), lock=False)
+        self.lock = context.Lock()
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens.value = min(self.capacity, self.tokens.value + (now - self.last_refill.value) * self.rate)
+                self.last_refill.value = now
+
+                if self.tokens.value >= tokens:
+                    self.tokens.value -= tokens
+                    return
+
+                wait_time = (tokens - self.tokens.value) / self.rate
+
+            time.sleep(wait_time)
+
+
+def split_date_range(start_date, end_date, shard='month'):
+    """YYYYMMDD 기간을 월/주 단위 [(시작, 종료), ...] 로 분할 (겹치지 않고 빈틈 없음)"""
+    start = datetime.strptime(start_date, '%Y%m%d')
+    end = datetime.strptime(end_date, '%Y%m%d')
+    if shard not in ('month', 'week'):
+        raise ValueError(f"지원하지 않는 분할 단위: {shard} (month 또는 week)")
+
+    shards = []
+    current = start
+    while current <= end:
+        if shard == 'month':
+            next_start = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            next_start = current + timedelta(days=7)
+        shard_end = min(next_start - timedelta(days=1), end)
+        shards.append((current.strftime('%Y%m%d'), shard_end.strftime('%Y%m%d')))
+        current = next_start
+    return shards
+
+
+class ShardStore:
+    """샤드별 결과 CSV 와 완료 표시 파일 관리 (중단 후 재실행 시 완료된 샤드는 건너뜀)"""
+
+    def __init__(self, shard_dir):
+        self.shard_dir = shard_dir
+        os.makedirs(shard_dir, exist_ok=True)
+
+    def rows_path(self, start_date, end_date):
+        return os.path.join(self.shard_dir, f"kdt_shard_{start_date}_{end_date}.csv")
+
+    def done_path(self, start_date, end_date):
+        return os.path.join(self.shard_dir, f"kdt_shard_{start_date}_{end_date}.done.json")
+
+    def load_done(self, start_date, end_date):
+        """완료된 샤드의 요약 ({'rows': 행 수, 'employment_queue': {...}}), 없으면 None"""
+        path = self.done_path(start_date, end_date)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def mark_done(self, start_date, end_date, summary):
+        """결과 파일을 모두 쓴 뒤 완료 표시 (임시 파일 후 교체)"""
+        path = self.done_path(start_date, end_date)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def iter_rows(self, start_date, end_date):
+        """샤드 결과 CSV 의 행을 순서대로 반환 (결과가 없던 샤드는 파일 없음)"""
+        path = self.rows_path(start_date, end_date)
+        if not os.path.exists(path):
+            return
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.DictReader(f)
+
+    def remove(self, shards):
+        """병합이 끝난 샤드 파일 삭제"""
+        for start_date, end_date in shards:
+            rows_path = self.rows_path(start_date, end_date)
+            for path in (rows_path, metadata_path(rows_path), self.done_path(start_date, end_date)):
+                if os.path.exists(path):
+                    os.remove(path)
+        if not os.listdir(self.shard_dir):
+            os.rmdir(self.shard_dir)
+
+
+def merge_shards(store, shards, sink):
+    """샤드 결과를 기간 순서대로 출력기에 기록 (고유값 중복 제거), 샤드별 고유값 목록 반환"""
+    seen_keys = set()
+    shard_keys = {}
+    duplicates = 0
+    for start_date, end_date in shards:
+        keys = []
+        for row in store.iter_rows(start_date, end_date):
+            key = row['고유값']
+            keys.append(key)
+            if key in seen_keys:
+                duplicates += 1
+                continue
+            seen_keys.add(key)
+            sink.write_rows([row])
+        shard_keys[(start_date, end_date)] = keys
+
+    logging.info(f"샤드 병합 완료: {len(shards)}개 샤드, {len(seen_keys)}개 과정 (중복 {duplicates}개 제거)")
+    return shard_keys
@@ -0,0 +1,211 @@
+import csv
+import json
+import logging
+import os
+from datetime import datetime
+
+# 수집 결과 파일의 컬럼 순서 (기존 result_kdtdata CSV 와 동일)
+COLUMN_ORDER = [
+    '고유값', '과정명', '훈련과정 ID', '회차', '훈련기관', '총 훈련일수', '총 훈련시간',
+    '과정시작일', '과정종료일', 'NCS명', 'NCS코드', '훈련비', '정원', '수강신청 인원',
+    '수료인원', '수료율', '만족도', '취업인원 (3개월)', '취업률 (3개월)',
+    '취업인원 (6개월)', '취업률 (6개월)', '지역', '주소', '과정페이지 링크',
+    '선도기업', '파트너기관', '매출 최소', '실 매출 대비', '매출 최대',
+    '2021년', '2022년', '2023년', '2024년', '2025년', '2026년'
+]
+
+# 자동 계산 단계에서 항상 숫자로 채워지는 컬럼
+NUMERIC_COLUMNS = ['매출 최소', '실 매출 대비', '매출 최대', '2021년', '2022년', '2023년', '2024년', '2025년', '2026년']
+
+# 결과를 수집한 시각 (델타 수집에서 이전 결과 이후 열린 취업 통계를 판단하는 기준)
+# Parquet 은 파일 메타데이터, CSV 는 <path>.meta.json, 파티션 데이터셋은 매니페스트의 파티션별 collected_at 에 기록
+COLLECTED_AT_KEY = 'kdt_collected_at'
+
+
+def metadata_path(path):
+    """CSV 결과 옆에 두는 메타데이터 파일 경로"""
+    return f"{path}.meta.json"
+
+
+def collected_at_text(collected_at=None):
+    """수집 시각 문자열 (기본: 지금, 출력기는 수집을 시작하기 전에 만들어지므로 실제 조회 시각보다 이르거나 같음)"""
+    return (collected_at or datetime.now()).isoformat(timespec='seconds')
+
+
+class CsvSink:
+    """행을 일정 개수씩 모아 CSV 에 바로 쓰는 출력기 (utf-8-sig, 고정 컬럼 순서)
+
+    <path>.tmp 에 쓰고 정상 종료 시에만 path 로 교체하므로, 수집 중 실패해도 기존 결과 파일은 그대로 남습니다.
+    수집 시각(collected_at, 기본: 출력기 생성 시각)은 <path>.meta.json 에 기록합니다.
+    """
+
+    def __init__(self, path, chunk_size=1000, columns=COLUMN_ORDER, collected_at=None):
+        self.path = path
+        self.temp_path = f"{path}.tmp"
+        self.collected_at = collected_at_text(collected_at)
+        self.chunk_size = chunk_size
+        self.columns = columns
+        self.buffer = []
+        self.rows_written = 0
+        self.file = None
+        self.writer = None
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.buffer.append(row)
+            if len(self.buffer) >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+
+        # 첫 행이 들어올 때 파일 생성 (수집 실패 시 빈 파일을 남기지 않음)
+        if self.file is None:
+            self.file = open(self.temp_path, 'w', newline='', encoding='utf-8-sig')
+            self.writer = csv.DictWriter(
+                self.file, fieldnames=self.columns, restval='', extrasaction='ignore',
+                lineterminator=os.linesep
+            )
+            self.writer.writeheader()
+
+        # DataFrame.to_csv 와 같이 None/NaN 은 빈 칸으로 기록
+        self.writer.writerows(
+            {key: ('' if value is None or value != value else value) for key, value in row.items()}
+            for row in self.buffer
+        )
+        self.rows_written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            os.replace(self.temp_path, self.path)
+            self.write_metadata()
+        logging.info(f"CSV 저장 완료: {self.path} ({self.rows_written}행)")
+
+    def write_metadata(self):
+        path = metadata_path(self.path)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump({COLLECTED_AT_KEY: self.collected_at, 'rows': self.rows_written}, f, ensure_ascii=False, indent=1)
+        os.replace(f"{path}.tmp", path)
+
+    def abort(self):
+        """실패한 실행의 임시 파일 삭제 (기존 결과 파일은 그대로 유지)"""
+        self.buffer = []
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+        logging.warning(f"CSV 저장 취소: {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class ParquetSink:
+    """행을 일정 개수씩 Parquet row group 으로 쓰는 출력기 (pyarrow 필요)
+
+    CsvSink 와 같이 <path>.tmp 에 쓰고 정상 종료 시에만 path 로 교체하며, 수집 시각은 파일 메타데이터에 기록합니다.
+    """
+
+    def __init__(self, path, chunk_size=10000, columns=COLUMN_ORDER, collected_at=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet 출력에는 pyarrow 가 필요합니다: pip install pyarrow") from e
+
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.temp_path = f"{path}.tmp"
+        self.chunk_size = chunk_size
+        self.columns = columns
+        # 계산 컬럼은 실수, 나머지는 API 원문 그대로 문자열
+        self.collected_at = collected_at_text(collected_at)
+        self.schema = pa.schema([
+            (column, pa.float64() if column in NUMERIC_COLUMNS else pa.string())
+            for column in columns
+        ], metadata={COLLECTED_AT_KEY: self.collected_at})
+        self.buffer = []
+        self.rows_written = 0
+        self.writer = None
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.buffer.append(row)
+            if len(self.buffer) >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+
+        arrays = []
+        for field in self.schema:
+            values = [row.get(field.name) for row in self.buffer]
+            if field.type == self.pa.float64():
+                values = [None if value in ('', None) else float(value) for value in values]
+            else:
+                values = [None if value is None or value != value else str(value) for value in values]
+            arrays.append(self.pa.array(values, type=field.type))
+
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.temp_path, self.schema)
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+        self.rows_written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            os.replace(self.temp_path, self.path)
+        logging.info(f"Parquet 저장 완료: {self.path} ({self.rows_written}행)")
+
+    def abort(self):
+        """실패한 실행의 임시 파일 삭제 (기존 결과 파일은 그대로 유지)"""
+        self.buffer = []
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+        logging.warning(f"Parquet 저장 취소: {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def open_sink(path, chunk_size=None, start_date=None, end_date=None, collected_at=None):
+    """경로에 맞는 출력기 생성 (디렉터리 → 파티션 데이터셋, .parquet → Parquet, 그 외 CSV)
+
+    start_date/end_date 는 파티션 데이터셋에서 다시 쓰는 파티션의 기존 과정 중 어느 것을 유지할지 정하는 수집 기간입니다.
+    collected_at 은 결과에 기록할 수집 시각 (기본: 지금, 수집이 끝난 뒤 만드는 출력기에는 수집 시작 시각을 넘김)
+    """
+    from kdt_collector.dataset import PartitionedDatasetSink, is_dataset_path
+
+    if is_dataset_path(path):
+        return PartitionedDatasetSink(path, start_date=start_date, end_date=end_date, chunk_size=chunk_size or 10000,
+                                      collected_at=collected_at)
+    if os.path.splitext(path)[1].lower() == '.parquet':
+        return ParquetSink(path, chunk_size=chunk_size or 10000, collected_at=collected_at)
+    return CsvSink(path, chunk_size=chunk_size or 1000, collected_at=collected_at)
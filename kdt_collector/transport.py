@@ -0,0 +1,207 @@
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from kdt_collector.rate_control import AIMDController
+
+
+class Work24TransportError(Exception):
+    """재시도 후에도 Work24 API 요청이 실패한 경우"""
+
+
+class CircuitOpenError(Work24TransportError):
+    """차단기가 열려 있어 요청을 보내지 않은 경우"""
+
+
+class CircuitBreaker:
+    """연속 실패가 누적되면 일정 시간 요청을 차단하는 회로 차단기"""
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        """요청 가능 여부 (열린 뒤 reset_timeout 이 지나면 시험 요청 1건 허용)"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self.trial_in_progress:
+                return False
+            self.trial_in_progress = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            if self.opened_at is not None:
+                logging.info(f"[{self.name}] 회로 차단기 닫힘 (API 정상화)")
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_progress = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_in_progress = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logging.warning(f"[{self.name}] 연속 {self.failures}회 실패로 회로 차단기 열림 ({self.reset_timeout}초)")
+                self.opened_at = time.monotonic()
+
+
+class Work24Transport:
+    """Work24 API 공용 전송 계층 (연결 재사용, 재시도, 회로 차단기, 응답 시간 집계)"""
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, base_urls, rate_limiter=None, pool_size=16, timeout=30,
+                 max_retries=3, backoff_base=0.5, backoff_max=10.0,
+                 failure_threshold=5, reset_timeout=30, adaptive=True, latency_target=2.0, metrics=None):
+        # base_urls 는 수집기의 dict 를 그대로 참조 (엔드포인트 이름 → URL)
+        self.base_urls = base_urls
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        # keep-alive 연결 풀 (동시 요청 수만큼 연결 유지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.breakers = {
+            endpoint: CircuitBreaker(endpoint, failure_threshold, reset_timeout)
+            for endpoint in base_urls
+        }
+        self.latency_stats = {}
+        self.stats_lock = threading.Lock()
+
+        # 엔드포인트별 지표 (kdt_collector.metrics.CollectorMetrics, 없으면 기록 안 함)
+        self.metrics = metrics
+
+        # 엔드포인트별 동시 요청 한도 자동 조절 (adaptive=False 이면 엔진 동시 요청 수 그대로 사용)
+        self.controllers = {
+            endpoint: AIMDController(endpoint, max_limit=pool_size, latency_target=latency_target)
+            for endpoint in base_urls
+        } if adaptive else {}
+
+    def get(self, endpoint, params):
+        """엔드포인트 GET 요청 (일시적 오류는 지수 백오프로 재시도)
+
+        어떤 예외로 끝나더라도 동시 요청 슬롯은 반납하고, 성공하지 못했으면 회로 차단기에 실패를 기록합니다.
+        """
+        breaker = self.breakers[endpoint]
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{endpoint} 회로 차단기가 열려 있어 요청을 건너뜁니다")
+
+        succeeded = False
+        try:
+            last_error = None
+            for attempt in range(self.max_retries + 1):
+                if attempt > 0:
+                    delay = self.backoff_delay(attempt, last_error)
+                    logging.info(f"[{endpoint}] 백오프 {delay:.2f}s 후 재시도 ({attempt}/{self.max_retries})")
+                    if self.metrics:
+                        self.metrics.record_retry(endpoint)
+                    time.sleep(delay)
+
+                response, last_error = self.attempt(endpoint, params, attempt)
+                if response is not None:
+                    breaker.record_success()
+                    succeeded = True
+                    return response
+        finally:
+            if not succeeded:
+                breaker.record_failure()
+
+        if isinstance(last_error, requests.Response):
+            raise Work24TransportError(f"{endpoint} 요청 실패: HTTP {last_error.status_code}")
+        raise Work24TransportError(f"{endpoint} 요청 실패: {last_error}")
+
+    def attempt(self, endpoint, params, attempt):
+        """요청 1회 (성공하면 (response, None), 재시도할 오류면 (None, 오류 또는 실패 응답))
+
+        슬롯은 finally 에서 반납하므로 requests 예외가 아닌 예외가 올라가도 엔드포인트가 막히지 않습니다.
+        """
+        controller = self.controllers.get(endpoint)
+        slot = controller.acquire() if controller else None
+        # 요청 전에 예외가 나면 (rate limiter 등) 서버 과부하 신호가 아니므로 한도를 줄이지 않음
+        throttled, reason, elapsed = False, '', None
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.get(self.base_urls[endpoint], params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                elapsed = time.perf_counter() - started
+                throttled, reason = True, type(e).__name__
+                self.record_latency(endpoint, elapsed, failed=True)
+                if self.metrics:
+                    self.metrics.record_request(endpoint, elapsed, reason, failed=True)
+                logging.warning(f"[{endpoint}] 요청 오류 (시도 {attempt + 1}/{self.max_retries + 1}): {e}")
+                return None, e
+
+            elapsed = time.perf_counter() - started
+            throttled = response.status_code in self.RETRY_STATUS_CODES
+            reason = f"HTTP {response.status_code}"
+            self.record_latency(endpoint, elapsed, failed=throttled)
+            if self.metrics:
+                self.metrics.record_request(endpoint, elapsed, response.status_code, len(response.content), throttled)
+            if throttled:
+                logging.warning(f"[{endpoint}] HTTP {response.status_code} (시도 {attempt + 1}/{self.max_retries + 1})")
+                return None, response
+            return response, None
+        finally:
+            if controller:
+                controller.release(slot, throttled=throttled, elapsed=elapsed, reason=reason)
+
+    def backoff_delay(self, attempt, last_error=None):
+        """재시도 대기 시간 (full jitter 지수 백오프, 429 의 Retry-After 우선)"""
+        if isinstance(last_error, requests.Response):
+            retry_after = last_error.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def record_latency(self, endpoint, elapsed, failed=False):
+        with self.stats_lock:
+            stats = self.latency_stats.setdefault(
+                endpoint, {'count': 0, 'errors': 0, 'total_seconds': 0.0, 'max_seconds': 0.0}
+            )
+            stats['count'] += 1
+            stats['total_seconds'] += elapsed
+            stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+            if failed:
+                stats['errors'] += 1
+
+    def log_latency_summary(self):
+        """엔드포인트별 요청 수, 응답 시간 및 동시 요청 한도 로그 출력"""
+        with self.stats_lock:
+            for endpoint, stats in self.latency_stats.items():
+                average = stats['total_seconds'] / stats['count'] if stats['count'] else 0.0
+                logging.info(
+                    f"[{endpoint}] 요청 {stats['count']}회, 오류 {stats['errors']}회, "
+                    f"평균 {average * 1000:.0f}ms, 최대 {stats['max_seconds'] * 1000:.0f}ms"
+                )
+        for controller in self.controllers.values():
+            controller.log_summary()
+
+    def update_metric_gauges(self):
+        """현재 엔드포인트별 동시 요청 한도를 지표에 반영"""
+        if self.metrics:
+            for endpoint, controller in self.controllers.items():
+                self.metrics.set_gauge('concurrency_limit', endpoint, int(controller.limit))
+
+    def close(self):
+        self.session.close()
@@ -12,6 +12,7 @@ import json
 import re
 from difflib import SequenceMatcher
 import math
+import os
 
 # NumPy 타입을 JSON 직렬화하기 위한 사용자 정의 인코더 추가
 class NumpyEncoder(json.JSONEncoder):
@@ -25,7 +26,7 @@ class NumpyEncoder(json.JSONEncoder):
         return super(NumpyEncoder, self).default(obj)
 
 # utils 모듈에서 함수 직접 임포트 (가독성 및 명시성 향상)
-from utils.data_loader import load_data_from_github
+from utils.data_loader import load_data_from_database, load_data_from_github
 from utils.data_preprocessing import preprocess_data
 from utils.data import calculate_yearly_revenue, apply_adjusted_revenue
 from utils.institution_grouping import group_institutions_advanced
@@ -2005,7 +2006,7 @@ def main():
 
     try:
         url = "https://github.com/yulechestnuts/KDT_Dataset/blob/main/result_kdtdata_202508.csv?raw=true" # Define URL here
-        df = load_data_from_github(url) # Use load_data_from_github
+        df = load_source_data(url) # KDT_DATA_SOURCE=db 이면 DB, 아니면 GitHub CSV
         if df.empty:
             st.error("데이터를 불러올 수 없습니다.")
             return
@@ -2805,10 +2806,31 @@ def setup_page():
         </style>
     """, unsafe_allow_html=True)
     
+def load_source_data(url):
+    """KDT_DATA_SOURCE=db 이면 DB courses 테이블(.env 의 DB_URL, TABLE_NAME)에서, 아니면 GitHub CSV(url)에서 로드
+
+    DB 는 사이드바에서 고른 과정시작 연도/훈련기관 조건을 WHERE 절로 넘겨 필요한 행만 읽습니다.
+    (순위/시장점유율 화면은 고른 범위 안에서 계산되므로 전체 비교가 필요하면 조건을 비워 두세요)
+    """
+    if os.getenv("KDT_DATA_SOURCE") != "db":
+        return load_data_from_github(url)
+
+    st.sidebar.title("DB 조회 조건")
+    years = ["전체 기간"] + [str(year) for year in range(datetime.now().year, 2020, -1)]
+    selected_year = st.sidebar.selectbox("과정시작 연도", years, key="db_year_filter")
+    institution_text = st.sidebar.text_input("훈련기관 (쉼표로 구분, 비우면 전체)", "", key="db_institution_filter")
+
+    # st.cache_data 키가 되도록 tuple 로 전달
+    institutions = tuple(name.strip() for name in institution_text.split(',') if name.strip()) or None
+    start_date = end_date = None
+    if selected_year != "전체 기간":
+        start_date, end_date = f"{selected_year}-01-01", f"{selected_year}-12-31"
+    return load_data_from_database(institutions=institutions, start_date=start_date, end_date=end_date)
+
 # 데이터 로딩 및 전처리 함수 정의
 def load_and_preprocess_data():
     url = "https://github.com/yulechestnuts/KDT_Dataset/blob/main/result_kdtdata_202504.csv?raw=true"
-    df = load_data_from_github(url)
+    df = load_source_data(url)
     if df.empty:
         st.error("데이터를 불러올 수 없습니다.")
         return pd.DataFrame()
@@ -1,27 +1,31 @@
 import pandas as pd
 import requests
-import io
+import time
 import streamlit as st
+from utils.download_cache import fetch_cached
+from utils.snapshot_store import load_csv_file
 
 @st.cache_data
 def load_data_from_github(url):
     """
     GitHub URL에서 CSV 파일을 로드하는 함수 (최대한 단순화, 디버깅 강화)
+
+    파일은 디스크 캐시에 내려받고 (재시작 시 ETag/Last-Modified 조건부 요청으로 변경 여부만 확인),
+    CSV 는 처음 한 번만 타입이 지정된 Arrow 스냅샷으로 변환하고, 같은 내용이면 스냅샷을 memory-map 으로 읽습니다.
     """
     print(f"load_data_from_github called with URL: {url}")  # Debug print: URL 확인
 
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        download = fetch_cached(url, timeout=30) # 디스크 캐시 (변경 없으면 304 로 본문을 다시 받지 않음)
 
-        print(f"Response status code: {response.status_code}") # Debug print: HTTP 상태 코드
-        print(f"Response content type: {response.headers.get('Content-Type')}") # Debug print: Content-Type 헤더
+        print(f"Download cache: {'hit' if download['from_cache'] else 'downloaded'}, {download['size']} bytes") # Debug print: 캐시 사용 여부
+        print(f"Response content type: {download.get('content_type')}") # Debug print: Content-Type 헤더
 
         if '.csv' in url.lower():
-            print("Trying to read as CSV file (basic)") # Debug print: CSV 로딩 시도 메시지
-            csv_text = response.content.decode('utf-8') # 응답 내용을 UTF-8 텍스트로 디코딩
-            print("CSV text sample (first 200 chars):", csv_text[:200]) # Debug print: CSV 텍스트 내용 일부 출력 (앞부분 200자)
-            df = pd.read_csv(io.StringIO(csv_text)) # 가장 기본적인 read_csv 호출 (index_col=0, 0값 행/열 제거 X)
+            print("Trying to read as CSV file (snapshot)") # Debug print: CSV 로딩 시도 메시지
+            started = time.perf_counter()
+            df = load_csv_file(download['path'], download['sha256'], url) # 내용 해시별 스냅샷 (CSV 파싱은 처음 한 번만)
+            print(f"CSV 로드 완료: {len(df)}행, {time.perf_counter() - started:.2f}초") # Debug print: 로드 시간
         else:
             st.error(f"Error: 지원하지 않는 파일 형식입니다: {url}")
             return pd.DataFrame()
@@ -45,4 +49,34 @@ def load_data_from_github(url):
         return pd.DataFrame()
     except Exception as e:
         st.error(f"Error: 데이터 처리 중 오류 발생: \n\n {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+@st.cache_data
+def load_data_from_database(table_name=None, institutions=None, start_date=None, end_date=None, training_types=None):
+    """
+    DB courses 테이블에서 화면에 필요한 행만 로드하는 함수 (.env 의 DB_URL, TABLE_NAME 사용)
+
+    기관/과정시작일 범위/훈련유형 조건은 SQL WHERE 절로 DB 에서 처리하고, 결과는 chunk 단위로 읽습니다.
+    institutions, training_types 는 st.cache_data 키가 되도록 tuple 로 넘겨주세요.
+    sqlalchemy/python-dotenv 는 DB 를 쓸 때만 필요하므로 여기서 가져옵니다. (GitHub CSV 경로는 설치하지 않아도 동작)
+    """
+    try:
+        from sqlalchemy import create_engine
+        from utils.database import get_db_settings, read_courses
+    except ImportError as e:
+        st.error(f"Error: DB 로딩에는 sqlalchemy 와 python-dotenv 가 필요합니다: pip install sqlalchemy python-dotenv \n\n {e}")
+        return pd.DataFrame()
+
+    try:
+        db_url, default_table = get_db_settings()
+        engine = create_engine(db_url, pool_pre_ping=True, pool_recycle=3600)
+        df = read_courses(
+            engine, table_name=table_name or default_table, institutions=institutions, start_date=start_date,
+            end_date=end_date, training_types=training_types, categories=False,
+        )
+        engine.dispose()
+        print(f"DB 로드 완료: {len(df)}행") # Debug print: 로드 행 수
+        return df
+    except Exception as e:
+        st.error(f"Error: DB 데이터 로딩 실패: \n\n {e}")
+        return pd.DataFrame()
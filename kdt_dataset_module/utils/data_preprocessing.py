@@ -4,6 +4,16 @@ from utils.training_type_classification import classify_training_type
 from utils.institution_grouping import group_institutions_advanced
 
 
+def to_numeric_column(series, strip_commas=False):
+    """숫자 컬럼으로 변환 (스냅샷처럼 이미 숫자 타입이면 문자열로 다시 파싱하지 않음)"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    text = series.astype(str)
+    if strip_commas:
+        text = text.str.replace(',', '').str.strip()
+    return pd.to_numeric(text, errors='coerce')
+
+
 def preprocess_data(df):
     """데이터 전처리 함수"""
     try:
@@ -11,14 +21,14 @@ def preprocess_data(df):
         numeric_columns = ['총 훈련일수', '총 훈련시간', '훈련비', '정원', '수강신청 인원', '수료인원', '수료율', '만족도', '취업인원', '취업률']
         for col in numeric_columns:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col].astype(str), errors='coerce').fillna(0)
+                df[col] = to_numeric_column(df[col]).fillna(0)
 
         # 2. 연도별 매출 관련 열 변환 및 누락된 컬럼 처리
         year_columns = ['2021년', '2022년', '2023년', '2024년', '2025년', '2026년']
         for year in year_columns:
             if year in df.columns:
                 # 먼저 소수점 제거 및 정수형으로 변환
-                df[year] = pd.to_numeric(df[year].astype(str).str.replace(',', ''), errors='coerce').fillna(0).astype(int)
+                df[year] = to_numeric_column(df[year], strip_commas=True).fillna(0).astype(int)
                 # 그 후 Int64로 변환
                 df[year] = df[year].astype('Int64')
             else:
@@ -83,8 +93,7 @@ def preprocess_data(df):
                     original_actual_sales = partner_rows['실 매출 대비'].copy()
                     
                     # 문자열을 숫자로 변환하여 계산
-                    actual_sales_numeric = pd.to_numeric(original_actual_sales.astype(str).str.replace(',', '').str.strip(), 
-                                                       errors='coerce').fillna(0)
+                    actual_sales_numeric = to_numeric_column(original_actual_sales, strip_commas=True).fillna(0)
                     
                     # 파트너기관(신규 훈련기관)에 90% 할당
                     new_training_rows['실 매출 대비'] = (actual_sales_numeric * 0.9).astype(int)
@@ -118,7 +127,7 @@ def preprocess_data(df):
         # 7. 누적매출 계산 (수정: "실 매출 대비" 컬럼 사용)
         if '실 매출 대비' in df.columns:
             # 쉼표 제거, 공백 제거 후 숫자 변환
-            df['누적매출'] = pd.to_numeric(df['실 매출 대비'].astype(str).str.replace(',', '').str.strip(), errors='coerce').fillna(0)
+            df['누적매출'] = to_numeric_column(df['실 매출 대비'], strip_commas=True).fillna(0)
         else:
             df['누적매출'] = 0  # 컬럼이 없으면 0으로 설정
             
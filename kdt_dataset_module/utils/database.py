@@ -1,52 +1,366 @@
+import argparse
+import json
+import math
 import os
-from sqlalchemy import create_engine
+import time
+import urllib.parse  # urllib.parse 모듈 import 추가
+
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
-import urllib.parse  # urllib.parse 모듈 import 추가
+from sqlalchemy import Column, Float, Index, MetaData, Numeric, Table, Text, create_engine, inspect, or_, select, text, type_coerce
+
+from .schema import apply_schema
+
+# 수집기 결과 컬럼 → courses 테이블 컬럼 (kdt-dashboard-new 의 saveProcessedCourses 와 같은 이름)
+COURSE_COLUMNS = {
+    '고유값': '고유값',
+    '과정명': '과정명',
+    '훈련과정 ID': '훈련과정_ID',
+    '회차': '회차',
+    '훈련기관': '훈련기관',
+    '과정시작일': '과정시작일',
+    '과정종료일': '과정종료일',
+    '수강신청 인원': '수강신청_인원',
+    '수료인원': '수료인원',
+    '취업인원 (3개월)': '취업인원_3개월',
+    '취업인원 (6개월)': '취업인원_6개월',
+    '수료율': '수료율',
+    '취업률 (3개월)': '취업률_3개월',
+    '취업률 (6개월)': '취업률_6개월',
+    '만족도': '만족도',
+    '훈련비': '훈련비',
+    '정원': '정원',
+    '총 훈련일수': '총훈련일수',
+    '총 훈련시간': '총훈련시간',
+    '실 매출 대비': '실_매출_대비',
+    '매출 최대': '매출_최대',
+    '매출 최소': '매출_최소',
+    '2021년': '2021년',
+    '2022년': '2022년',
+    '2023년': '2023년',
+    '2024년': '2024년',
+    '2025년': '2025년',
+    '2026년': '2026년',
+    'NCS명': 'NCS명',
+    'NCS코드': 'NCS코드',
+    '선도기업': '선도기업',
+    '파트너기관': '파트너기관',
+    '누적매출': '누적매출',
+    '훈련유형': '훈련유형',
+}
+
+# 숫자로 저장하는 컬럼 (빈 문자열은 NULL, 쉼표/% 는 제거)
+NUMERIC_COURSE_COLUMNS = [
+    '수강신청_인원', '수료인원', '취업인원_3개월', '취업인원_6개월', '수료율', '취업률_3개월', '취업률_6개월',
+    '만족도', '훈련비', '정원', '총훈련일수', '총훈련시간', '실_매출_대비', '매출_최대', '매출_최소',
+    '2021년', '2022년', '2023년', '2024년', '2025년', '2026년', '누적매출',
+]
+
+# supabase-indexes.sql 과 같은 인덱스 (로컬 테스트용 테이블 생성 시 사용)
+COURSE_INDEXES = {
+    '훈련기관': ['훈련기관'],
+    '과정시작일': ['과정시작일'],
+    '과정종료일': ['과정종료일'],
+    '훈련기관_과정시작일': ['훈련기관', '과정시작일'],
+    '훈련과정_ID': ['훈련과정_ID'],
+    '파트너기관': ['파트너기관'],
+}
 
-# .env 파일 로드
-load_dotenv()
 
-# 환경변수에서 DB 정보 가져오기
-db_url_env = os.getenv("DB_URL")  # DB_URL 환경 변수 원본 값 가져오기
-table_name = os.getenv("TABLE_NAME")
+def get_db_settings():
+    """.env/환경변수에서 (DB_URL, TABLE_NAME) 을 읽음 (비밀번호는 URL 디코딩)"""
+    # .env 파일 로드
+    load_dotenv()
 
-# DB_URL 파싱 및 비밀번호 URL 디코딩
-parsed_url = urllib.parse.urlparse(db_url_env)
-decoded_password = urllib.parse.unquote(parsed_url.password) # 비밀번호 URL 디코딩
-db_url = db_url_env.replace(parsed_url.password, decoded_password) # 디코딩된 비밀번호로 DB_URL 재구성
+    # 환경변수에서 DB 정보 가져오기
+    db_url_env = os.getenv("DB_URL")  # DB_URL 환경 변수 원본 값 가져오기
+    table_name = os.getenv("TABLE_NAME")
 
-# 디버깅: 환경 변수 확인
-if not db_url:
-    raise ValueError("DB_URL is not set. Please check your .env file.")
-if not table_name:
-    raise ValueError("TABLE_NAME is not set. Please check your .env file.")
+    if not db_url_env:
+        raise ValueError("DB_URL is not set. Please check your .env file.")
+    if not table_name:
+        raise ValueError("TABLE_NAME is not set. Please check your .env file.")
 
-def get_db_engine():
-    """DB 연결 엔진을 생성합니다."""
+    # DB_URL 파싱 및 비밀번호 URL 디코딩
+    parsed_url = urllib.parse.urlparse(db_url_env)
+    db_url = db_url_env
+    if parsed_url.password:
+        decoded_password = urllib.parse.unquote(parsed_url.password)  # 비밀번호 URL 디코딩
+        db_url = db_url_env.replace(parsed_url.password, decoded_password)  # 디코딩된 비밀번호로 DB_URL 재구성
+    return db_url, table_name
+
+
+def get_db_engine(db_url=None):
+    """DB 연결 엔진을 생성합니다. (db_url 을 넘기지 않으면 .env 의 DB_URL 사용)"""
     try:
+        db_url = db_url or get_db_settings()[0]
         engine = create_engine(db_url, pool_pre_ping=True, pool_recycle=3600) # 수정된 db_url 사용
         with engine.connect() as connection:
-            st.success(f"DB 연결 성공: {db_url}") # st.write -> st.success 로 변경 (성공 메시지 강조)
+            st.success(f"DB 연결 성공: {engine.url.render_as_string(hide_password=True)}") # st.write -> st.success 로 변경 (성공 메시지 강조)
         return engine
     except Exception as e:
         st.error(f"DB 연결 실패: {e}")
         return None
 
-def load_data_from_db(engine, table_name):
-    """데이터베이스에서 데이터를 로드"""
-    try:
-        query = f"SELECT * FROM {table_name} LIMIT 10"  # 예시 쿼리
-        df = pd.read_sql(query, engine)
-        st.success("데이터 로드 성공") # st.write -> st.success 로 변경 (성공 메시지 강조)
-        st.dataframe(df.head())  # st.write -> st.dataframe 으로 변경 (DataFrame 출력)
-        return df
-    except Exception as e:
-        st.error(f"쿼리 실행 중 오류 발생: {e}")
-        return pd.DataFrame()
+def load_data_from_db(engine, table_name, **filters):
+    """데이터베이스에서 데이터를 로드 (filters 는 read_courses 와 같음, 화면 출력 없이 DataFrame 만 반환)"""
+    return read_courses(engine, table_name=table_name, **filters)
 
 # DB 연결 및 데이터 로드 (streamlit_app_ver.1.03.py 에서는 이 부분은 필요 없음. utils.database.py 는 모듈로 사용됨)
 # engine = get_db_engine()
 # if engine:
-#     df = load_data_from_db(engine, table_name)
\ No newline at end of file
+#     df = load_data_from_db(engine, table_name)
+
+
+def course_column_type(db_column):
+    return Numeric if db_column in NUMERIC_COURSE_COLUMNS else Text
+
+
+def create_courses_table(engine, table_name='courses'):
+    """로컬 SQLite/Postgres 테스트용 courses 테이블과 인덱스 생성 (이미 있으면 그대로 둠)"""
+    metadata = MetaData()
+    columns = [Column('고유값', Text, primary_key=True)]
+    for db_column in COURSE_COLUMNS.values():
+        if db_column != '고유값':
+            columns.append(Column(db_column, course_column_type(db_column)))
+    table = Table(table_name, metadata, *columns)
+    for name, index_columns in COURSE_INDEXES.items():
+        Index(f"idx_{table_name}_{name}", *(table.c[column] for column in index_columns))
+    metadata.create_all(engine)
+    return table
+
+
+def add_course_columns(engine, table_name, db_columns):
+    """기존 courses 테이블에 빠진 컬럼을 create_courses_table 과 같은 타입으로 추가 (ALTER TABLE ... ADD COLUMN)"""
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as connection:
+        for db_column in db_columns:
+            column_type = course_column_type(db_column)().compile(dialect=engine.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {preparer.quote(table_name)} ADD COLUMN {preparer.quote(db_column)} {column_type}"
+            ))
+    print(f"{table_name} 테이블에 컬럼 추가: {', '.join(db_columns)}")
+
+
+def load_collector_output(path):
+    """수집기 결과(CSV, Parquet, 파티션 데이터셋 디렉터리)를 DataFrame 으로 로드"""
+    if os.path.isdir(path):
+        with open(os.path.join(path, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+        frames = [pd.read_parquet(os.path.join(path, partition['path'])) for partition in manifest['partitions'].values()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if os.path.splitext(path)[1].lower() == '.parquet':
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+
+def to_db_value(value, numeric):
+    """DB 에 넣을 값으로 변환 (빈 값/NaN → None, 숫자 컬럼은 float)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    if not numeric:
+        text = str(value)
+        return text if text != '' else None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).replace(',', '').replace('%', '').strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def course_records(courses, columns):
+    """DataFrame 행을 {DB 컬럼: 값} 목록으로 변환 (같은 고유값은 마지막 행 사용)"""
+    source_columns = [source for source, db_column in COURSE_COLUMNS.items() if db_column in columns and source in courses.columns]
+    numeric = [COURSE_COLUMNS[source] in NUMERIC_COURSE_COLUMNS for source in source_columns]
+    records = {}
+    for values in courses[source_columns].itertuples(index=False, name=None):
+        record = {
+            COURSE_COLUMNS[source]: to_db_value(value, is_numeric)
+            for source, value, is_numeric in zip(source_columns, values, numeric)
+        }
+        if record.get('고유값'):
+            records[record['고유값']] = record
+    return list(records.values())
+
+
+def upsert_statement(engine, table, columns):
+    """DB 종류별 INSERT ... ON CONFLICT(고유값) DO UPDATE 문 (한 번 만들어 모든 batch 에 재사용)"""
+    dialect = engine.dialect.name
+    update_columns = [column for column in columns if column != '고유값']
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert
+
+        statement = insert(table)
+        return statement.on_duplicate_key_update({column: statement.inserted[column] for column in update_columns})
+    else:
+        raise ValueError(f"upsert 를 지원하지 않는 DB 입니다: {dialect}")
+
+    statement = insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=['고유값'], set_={column: statement.excluded[column] for column in update_columns}
+    )
+
+
+def upsert_courses(engine, courses, table_name='courses', batch_size=500, add_missing_columns=False):
+    """수집기 결과를 courses 테이블에 고유값 기준으로 upsert (batch 마다 트랜잭션 1개)
+
+    courses 는 DataFrame 또는 결과 파일 경로. COURSE_COLUMNS 중 테이블에 없는 컬럼이 있으면 값이 조용히
+    빠지지 않도록 ValueError 를 내고, add_missing_columns 이면 컬럼을 추가한 뒤 기록합니다. 대시보드에서 채우는
+    나머지 컬럼(조정_* 등)은 그대로 둡니다. batch 는 미리 컴파일한 upsert 문 1개로 실행되어
+    Postgres/MySQL 에서는 multi-row VALUES 로, SQLite 에서는 executemany 로 전송됩니다.
+    {'rows', 'batches', 'seconds', 'rows_per_second'} 반환.
+    """
+    if isinstance(courses, str):
+        courses = load_collector_output(courses)
+
+    started = time.perf_counter()
+    table = Table(table_name, MetaData(), autoload_with=engine)
+    if '고유값' not in table.c:
+        raise ValueError(f"{table_name} 테이블에 고유값 컬럼이 없습니다.")
+    missing = [db_column for db_column in COURSE_COLUMNS.values() if db_column not in table.c]
+    if missing:
+        if not add_missing_columns:
+            raise ValueError(
+                f"{table_name} 테이블에 없는 컬럼입니다: {', '.join(missing)} "
+                f"(add_missing_columns=True 또는 --add-columns 로 추가)"
+            )
+        add_course_columns(engine, table_name, missing)
+        table = Table(table_name, MetaData(), autoload_with=engine)
+
+    records = course_records(courses, set(table.c.keys()))
+    batches = 0
+    if records:
+        statement = upsert_statement(engine, table, list(records[0]))
+        for offset in range(0, len(records), batch_size):
+            with engine.begin() as connection:
+                connection.execution_options(insertmanyvalues_page_size=batch_size).execute(
+                    statement, records[offset:offset + batch_size]
+                )
+            batches += 1
+
+    elapsed = time.perf_counter() - started
+    rows_per_second = len(records) / elapsed if elapsed > 0 else float('inf')
+    print(f"{table_name} upsert 완료: {len(records):,}행, {batches}개 batch, {elapsed:.2f}초 ({rows_per_second:,.0f}행/초)")
+    return {'rows': len(records), 'batches': batches, 'seconds': elapsed, 'rows_per_second': rows_per_second}
+
+
+def courses_query(table, columns=None, institutions=None, start_date=None, end_date=None, training_types=None,
+                  include_partners=True):
+    """courses 조회 SELECT 문 (조건은 모두 WHERE 절로 DB 에서 처리)
+
+    - institutions: 훈련기관 목록 (include_partners 이면 파트너기관이 같은 과정도 포함)
+      → idx_courses_훈련기관, idx_courses_파트너기관 사용
+    - start_date / end_date: 과정시작일 범위 (양 끝 포함) → idx_courses_과정시작일, 기관과 함께면 idx_courses_훈련기관_과정시작일
+    - training_types: 훈련유형 목록
+    컬럼은 수집기 결과 컬럼명(예: '수강신청 인원')으로 돌려주고, 숫자 컬럼은 Decimal 대신 float 로 받습니다.
+    """
+    db_columns = {db_column: source for source, db_column in COURSE_COLUMNS.items()}
+    if columns is None:
+        names = list(table.c.keys())
+    else:
+        names = [COURSE_COLUMNS.get(column, column) for column in columns]
+        missing = [name for name in names if name not in table.c]
+        if missing:
+            raise ValueError(f"{table.name} 테이블에 없는 컬럼입니다: {', '.join(missing)}")
+
+    selected = []
+    for name in names:
+        column = table.c[name]
+        if isinstance(column.type, Numeric) and not isinstance(column.type, Float):
+            column = type_coerce(column, Float)
+        selected.append(column.label(db_columns.get(name, name)))
+    query = select(*selected)
+
+    if institutions:
+        institutions = list(institutions)
+        condition = table.c['훈련기관'].in_(institutions)
+        if include_partners and '파트너기관' in table.c:
+            # 부분 인덱스(파트너기관 IS NOT NULL AND 파트너기관 != '')를 쓸 수 있도록 조건을 같이 적음
+            condition = or_(condition, (table.c['파트너기관'] != '') & table.c['파트너기관'].in_(institutions))
+        query = query.where(condition)
+    if start_date is not None:
+        query = query.where(table.c['과정시작일'] >= pd.Timestamp(start_date).strftime('%Y-%m-%d'))
+    if end_date is not None:
+        # 시각이 붙은 값('2024-12-31 00:00:00')도 포함되도록 다음 날 미만으로 비교
+        next_day = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+        query = query.where(table.c['과정시작일'] < next_day.strftime('%Y-%m-%d'))
+    if training_types:
+        if '훈련유형' not in table.c:
+            raise ValueError(f"{table.name} 테이블에 훈련유형 컬럼이 없습니다.")
+        query = query.where(table.c['훈련유형'].in_(list(training_types)))
+    return query
+
+
+def iter_courses(engine, table_name='courses', chunksize=10000, columns=None, institutions=None, start_date=None,
+                 end_date=None, training_types=None, include_partners=True):
+    """courses 테이블을 chunk 단위 DataFrame 으로 읽는 generator (조건은 courses_query 참고)
+
+    stream_results 로 실행하므로 Postgres(psycopg2)에서는 서버 측 cursor 로 chunksize 행씩만 가져옵니다.
+    chunk 마다 utils.schema 의 타입(날짜, 숫자)을 적용하며 category 변환은 하지 않습니다.
+    """
+    table = Table(table_name, MetaData(), autoload_with=engine)
+    query = courses_query(
+        table, columns=columns, institutions=institutions, start_date=start_date, end_date=end_date,
+        training_types=training_types, include_partners=include_partners,
+    )
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=chunksize).execute(query)
+        names = list(result.keys())
+        for rows in result.partitions():
+            yield apply_schema(pd.DataFrame(rows, columns=names), categories=False)
+
+
+def read_courses(engine, table_name='courses', chunksize=10000, columns=None, institutions=None, start_date=None,
+                 end_date=None, training_types=None, include_partners=True, categories=True):
+    """조건에 맞는 courses 행만 읽어 스키마 타입의 DataFrame 으로 반환 (Streamlit 출력 없음)
+
+    categories 이면 훈련기관/NCS명/지역/훈련유형 등은 chunk 를 합친 뒤 category 로 변환합니다.
+    조건에 맞는 행이 없으면 컬럼만 있는 빈 DataFrame 을 반환합니다.
+    """
+    started = time.perf_counter()
+    chunks = list(iter_courses(
+        engine, table_name=table_name, chunksize=chunksize, columns=columns, institutions=institutions,
+        start_date=start_date, end_date=end_date, training_types=training_types, include_partners=include_partners,
+    ))
+    if not chunks:
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        labels = [column.name for column in courses_query(table, columns=columns).selected_columns]
+        return pd.DataFrame(columns=labels)
+    df = apply_schema(pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0], categories=categories)
+    print(f"{table_name} 조회 완료: {len(df):,}행, {len(chunks)}개 chunk, {time.perf_counter() - started:.2f}초")
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="수집기 결과를 courses 테이블에 upsert")
+    parser.add_argument('path', help="수집기 결과 (CSV, Parquet, 파티션 데이터셋 디렉터리)")
+    parser.add_argument('--db-url', help="DB URL (기본: .env 의 DB_URL, 예: sqlite:///kdt_local.db)")
+    parser.add_argument('--table', help="테이블 이름 (기본: courses)")
+    parser.add_argument('--batch-size', type=int, default=500, help="multi-row 문 1개에 넣을 행 수")
+    parser.add_argument('--create-table', action='store_true', help="테이블이 없으면 생성 (로컬 테스트용)")
+    parser.add_argument('--add-columns', action='store_true', help="테이블에 없는 결과 컬럼을 추가한 뒤 기록")
+    args = parser.parse_args(argv)
+
+    db_url = args.db_url or get_db_settings()[0]
+    table_name = args.table or 'courses'
+    engine = create_engine(db_url, pool_pre_ping=True)
+    if args.create_table and not inspect(engine).has_table(table_name):
+        create_courses_table(engine, table_name)
+    upsert_courses(engine, args.path, table_name=table_name, batch_size=args.batch_size,
+                   add_missing_columns=args.add_columns)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
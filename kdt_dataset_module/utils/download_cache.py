@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import time
+
+import requests
+
+DOWNLOAD_CACHE_DIR = os.getenv(
+    'KDT_DOWNLOAD_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'kdt_dataset', 'downloads')
+)
+
+
+def cache_paths(url, cache_dir=None):
+    """URL 별 (본문 파일 이름 기준 경로, 메타데이터 파일) 경로"""
+    cache_dir = cache_dir or DOWNLOAD_CACHE_DIR
+    name = os.path.basename(url.split('?')[0]) or 'download'
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    base_path = os.path.join(cache_dir, f"{key}-{name}")
+    return base_path, f"{base_path}.json"
+
+
+def body_path_for(base_path, sha256):
+    """내용 해시를 앞에 붙인 본문 파일 경로 (같은 URL 의 새 본문이 메타데이터가 가리키는 본문을 덮어쓰지 않음)"""
+    directory, base = os.path.split(base_path)
+    return os.path.join(directory, f"{sha256[:16]}-{base}")
+
+
+def read_metadata(meta_path):
+    """저장된 메타데이터와 본문 경로 (메타데이터가 가리키는 본문 파일이 없거나 손상되었으면 None)"""
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # 본문 파일 이름이 없는 이전 형식 메타데이터는 본문과 짝이 맞는지 알 수 없으므로 다시 내려받음
+    if not metadata.get('file'):
+        return None
+    body_path = os.path.join(os.path.dirname(meta_path), metadata['file'])
+    if not os.path.exists(body_path):
+        return None
+    return {**metadata, 'path': body_path}
+
+
+def remove_stale_bodies(base_path, keep_path):
+    """메타데이터가 더 이상 가리키지 않는 같은 URL 의 본문 파일 삭제 (이전 본문, 중단된 실행이 남긴 본문)"""
+    directory, base = os.path.split(base_path)
+    for entry in os.listdir(directory):
+        path = os.path.join(directory, entry)
+        if path != keep_path and (entry == base or entry.endswith(f"-{base}")):
+            os.remove(path)
+
+
+def fetch_cached(url, cache_dir=None, timeout=30, chunk_size=1 << 20):
+    """URL 을 디스크 캐시로 내려받고 메타데이터 dict 반환 (path, sha256, etag, last_modified, size, from_cache)
+
+    캐시가 있으면 ETag/Last-Modified 로 조건부 요청을 보내고 304 이면 다시 받지 않습니다.
+    본문은 메모리에 모으지 않고 chunk 단위로 임시 파일에 쓴 뒤 sha256 을 붙인 이름으로 옮기고, 그다음 메타데이터를
+    임시 파일 교체로 바꿔 새 본문을 가리키게 합니다. 중간에 중단되어도 메타데이터는 항상 자신의 ETag/sha256 과
+    같은 본문을 가리킵니다.
+    네트워크 오류 시 캐시가 있으면 캐시를 사용하고, 없으면 requests 예외를 그대로 올립니다.
+    """
+    base_path, meta_path = cache_paths(url, cache_dir)
+    cached = read_metadata(meta_path)
+
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    started = time.perf_counter()
+    try:
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if response.status_code == 304 and cached:
+                print(f"다운로드 캐시 사용 (304 Not Modified): {url}")
+                return {**cached, 'from_cache': True}
+            response.raise_for_status()
+
+            os.makedirs(os.path.dirname(base_path), exist_ok=True)
+            tmp_path = f"{base_path}.tmp"
+            digest = hashlib.sha256()
+            size = 0
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            body_path = body_path_for(base_path, digest.hexdigest())
+            os.replace(tmp_path, body_path)
+
+            metadata = {
+                'url': url,
+                'file': os.path.basename(body_path),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_type': response.headers.get('Content-Type'),
+                'sha256': digest.hexdigest(),
+                'size': size,
+                'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+    except requests.exceptions.RequestException as e:
+        if not cached:
+            raise
+        print(f"다운로드 실패, 캐시 사용: {url} ({e})")
+        return {**cached, 'from_cache': True}
+
+    tmp_meta_path = f"{meta_path}.tmp"
+    with open(tmp_meta_path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_meta_path, meta_path)
+    remove_stale_bodies(base_path, body_path)
+
+    elapsed = time.perf_counter() - started
+    print(f"다운로드 완료: {url} ({size / 1e6:.1f}MB, {elapsed:.2f}초)")
+    return {**metadata, 'path': body_path, 'from_cache': False}
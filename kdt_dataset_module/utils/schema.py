@@ -0,0 +1,134 @@
+import pandas as pd
+
+# result_kdtdata 컬럼별 타입과 읽기 규칙
+# - id: 숫자처럼 보여도 문자열 (앞자리 0 보존)
+# - text: 일반 문자열 (읽기 함수 기본 동작)
+# - category: 값 종류가 적은 문자열 → pandas Categorical
+# - date: 날짜 (변환할 수 없는 값은 NaT)
+# - int / float: 숫자 (변환할 수 없는 값은 NaN, 빈 값이 있으면 int 도 float)
+# - revenue: 쉼표를 제거한 뒤 숫자
+RESULT_KDTDATA_SCHEMA = {
+    '고유값': 'id',
+    '과정명': 'text',
+    '훈련과정 ID': 'id',
+    '회차': 'text',
+    '훈련기관': 'category',
+    '훈련기관ID': 'id',
+    '총 훈련일수': 'int',
+    '총 훈련시간': 'int',
+    '과정시작일': 'date',
+    '과정종료일': 'date',
+    'NCS명': 'category',
+    'NCS코드': 'id',
+    '훈련비': 'int',
+    '정원': 'int',
+    '수강신청 인원': 'int',
+    '수료인원': 'int',
+    '수료율': 'float',
+    '만족도': 'float',
+    '취업인원 (3개월)': 'int',
+    '취업률 (3개월)': 'float',
+    '취업인원 (6개월)': 'int',
+    '취업률 (6개월)': 'float',
+    '지역': 'category',
+    '주소': 'text',
+    '과정페이지 링크': 'text',
+    '선도기업': 'category',
+    '파트너기관': 'category',
+    '훈련유형': 'category',
+    '매출 최소': 'revenue',
+    '실 매출 대비': 'revenue',
+    '매출 최대': 'revenue',
+    '누적매출': 'revenue',
+    '2021년': 'revenue',
+    '2022년': 'revenue',
+    '2023년': 'revenue',
+    '2024년': 'revenue',
+    '2025년': 'revenue',
+    '2026년': 'revenue',
+    # data_paste.xlsx (app.py 기관별 매출 요약) 의 기관명 컬럼
+    '기관명': 'text',
+}
+
+NUMERIC_KINDS = ('int', 'float', 'revenue')
+
+# 진입점별로 필요한 컬럼 (None 이면 전체, 목록에 없는 컬럼은 읽지 않음)
+REQUIRED_COLUMNS = {
+    # utils.data_preprocessing 과 visualization 보고서는 대부분의 컬럼을 사용
+    'dashboard': None,
+    'streamlit_app': [
+        '과정명', '회차', '훈련기관', '과정종료일', 'NCS명', '수강신청 인원', '수료인원', '만족도', '파트너기관',
+        '누적매출', '2021년', '2022년', '2023년', '2024년',
+    ],
+    'app': ['기관명', '2021년', '2022년', '2023년', '2024년'],
+    'machinelearning': ['훈련기관', '과정시작일', '수강신청 인원', '수료인원', '누적매출', '2025년'],
+}
+
+
+def columns_of_kind(*kinds):
+    return [column for column, kind in RESULT_KDTDATA_SCHEMA.items() if kind in kinds]
+
+
+def usecols_for(profile=None, extra_columns=()):
+    """읽기 함수에 넘길 usecols (헤더 앞뒤 공백은 무시), 전체 컬럼이 필요하면 None"""
+    required = REQUIRED_COLUMNS.get(profile) if profile else None
+    if required is None:
+        return None
+    wanted = set(required) | set(extra_columns)
+    return lambda column: str(column).strip() in wanted
+
+
+def reader_dtypes(categories=True):
+    """읽기 함수에 넘길 dtype (id 는 문자열, category 는 Categorical, 나머지는 읽은 뒤 apply_schema 로 변환)"""
+    dtypes = {column: str for column in columns_of_kind('id')}
+    if categories:
+        dtypes.update({column: 'category' for column in columns_of_kind('category')})
+    return dtypes
+
+
+def id_text(value):
+    """숫자로 읽힌 id 값을 문자열로 (정수는 소수점 없이, 빈 값은 그대로)"""
+    if pd.isna(value):
+        return value
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def apply_schema(df, categories=True):
+    """스키마의 읽기 규칙 적용 (이미 올바른 타입인 컬럼은 다시 변환하지 않음)"""
+    for column in df.columns:
+        kind = RESULT_KDTDATA_SCHEMA.get(str(column).strip())
+        series = df[column]
+        if kind == 'id' and pd.api.types.is_numeric_dtype(series):
+            df[column] = series.map(id_text)
+        elif kind == 'date' and not pd.api.types.is_datetime64_any_dtype(series):
+            df[column] = pd.to_datetime(series, errors='coerce')
+        elif kind in NUMERIC_KINDS and not pd.api.types.is_numeric_dtype(series):
+            text = series.astype(str)
+            if kind == 'revenue':
+                text = text.str.replace(',', '').str.strip()
+            df[column] = pd.to_numeric(text, errors='coerce')
+        elif kind == 'category' and categories and not isinstance(series.dtype, pd.CategoricalDtype):
+            df[column] = series.astype('category')
+    return df
+
+
+def read_result_csv(source, profile=None, categories=True, encoding='utf-8', extra_columns=()):
+    """result_kdtdata CSV 를 스키마대로 읽기 (필요 없는 컬럼은 만들지 않음, 쉼표가 든 매출은 파서가 바로 숫자로 읽음)"""
+    df = pd.read_csv(
+        source, encoding=encoding, usecols=usecols_for(profile, extra_columns), dtype=reader_dtypes(categories),
+        thousands=',',
+    )
+    return apply_schema(df, categories)
+
+
+def read_result_excel(source, profile=None, categories=True, extra_columns=()):
+    """result_kdtdata 엑셀을 스키마대로 읽기
+
+    openpyxl 은 시트 전체를 읽은 뒤에 컬럼을 고르므로 usecols/dtype 을 넘기면 오히려 느려집니다.
+    기본 설정으로 읽고 필요한 컬럼만 남긴 뒤 apply_schema 로 변환합니다.
+    """
+    df = pd.read_excel(source, engine='openpyxl')
+    wanted = usecols_for(profile, extra_columns)
+    if wanted is not None:
+        df = df[[column for column in df.columns if wanted(column)]].copy()
+    return apply_schema(df, categories)
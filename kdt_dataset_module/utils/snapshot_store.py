@@ -0,0 +1,249 @@
+import argparse
+import hashlib
+import io
+import os
+import time
+
+import pandas as pd
+
+from .schema import apply_schema, columns_of_kind, read_result_csv, read_result_excel, reader_dtypes, usecols_for
+
+# result_kdtdata CSV 컬럼별 스냅샷 타입 (utils.schema 기준, 목록에 없는 컬럼은 pyarrow 가 추론)
+DATE_COLUMNS = columns_of_kind('date')
+INTEGER_COLUMNS = columns_of_kind('int')
+FLOAT_COLUMNS = columns_of_kind('float')
+# 쉼표가 들어간 값이 있는 매출 컬럼 (preprocess_data 와 같이 쉼표 제거 후 숫자 변환)
+REVENUE_COLUMNS = columns_of_kind('revenue')
+# 값 종류가 적은 문자열 컬럼 (스냅샷에는 dictionary 인코딩으로 저장)
+CATEGORY_COLUMNS = columns_of_kind('category')
+# 숫자처럼 보여도 문자열로 유지하는 컬럼 (앞자리 0 보존)
+STRING_COLUMNS = columns_of_kind('id')
+
+SNAPSHOT_DIR = os.getenv('KDT_SNAPSHOT_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'kdt_dataset', 'snapshots'))
+
+
+def import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise ImportError("스냅샷 변환에는 pyarrow 가 필요합니다: pip install pyarrow") from e
+    return pa, pa_csv, feather
+
+
+def typed_column(pa, column, values):
+    """문자열로 읽은 컬럼을 스냅샷 타입으로 변환 (변환할 수 없는 값은 null, pd.to_numeric(errors='coerce') 와 동일)"""
+    if column in DATE_COLUMNS:
+        dates = pd.to_datetime(values.to_pandas(), errors='coerce')
+        return pa.array(dates, type=pa.timestamp('ns'))
+    if column in INTEGER_COLUMNS or column in FLOAT_COLUMNS or column in REVENUE_COLUMNS:
+        series = values.to_pandas()
+        if column in REVENUE_COLUMNS:
+            series = series.str.replace(',', '').str.strip()
+        numbers = pd.to_numeric(series, errors='coerce')
+        if column in INTEGER_COLUMNS and numbers.notna().all() and (numbers % 1 == 0).all():
+            return pa.array(numbers.astype('int64'))
+        return pa.array(numbers.astype('float64'))
+    if column in CATEGORY_COLUMNS:
+        return values.dictionary_encode()
+    return values
+
+
+def build_snapshot(csv_source, snapshot_path):
+    """result_kdtdata CSV(경로 또는 bytes)를 타입이 지정된 Arrow IPC(Feather v2, 비압축) 스냅샷으로 변환
+
+    날짜는 datetime, 인원/훈련비는 정수(빈 값이 있으면 실수), 매출은 실수, 기관/NCS/지역 등은 dictionary 로
+    저장합니다. 비압축이므로 load_snapshot 에서 memory-map 으로 바로 읽을 수 있습니다.
+    """
+    pa, pa_csv, feather = import_pyarrow()
+    started = time.perf_counter()
+
+    source = pa.BufferReader(csv_source) if isinstance(csv_source, bytes) else csv_source
+    # 헤더를 먼저 읽어 지정한 컬럼은 문자열로 읽은 뒤 직접 변환 (쉼표/오류 값 처리)
+    table = pa_csv.read_csv(
+        source,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={column: pa.string() for column in
+                          DATE_COLUMNS + INTEGER_COLUMNS + FLOAT_COLUMNS + REVENUE_COLUMNS + CATEGORY_COLUMNS + STRING_COLUMNS},
+            strings_can_be_null=True,
+        ),
+    )
+    columns = [typed_column(pa, name, table.column(name).combine_chunks()) for name in table.column_names]
+    table = pa.table(columns, names=table.column_names)
+
+    os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)), exist_ok=True)
+    tmp_path = f"{snapshot_path}.tmp"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, snapshot_path)
+    print(f"스냅샷 생성: {snapshot_path} ({table.num_rows}행, {time.perf_counter() - started:.2f}초)")
+    return snapshot_path
+
+
+def load_snapshot(snapshot_path, categories=None, columns=None):
+    """스냅샷을 memory-map 으로 열어 DataFrame 으로 변환
+
+    categories 에 넘긴 컬럼만 pandas Categorical 로 변환합니다. (preprocess_data 는 빈 값을 0 으로 채우고
+    기관명을 바꾸므로 대시보드는 기본값 None 으로 일반 문자열 컬럼을 사용)
+    columns 는 컬럼 이름 목록 또는 pandas usecols 와 같은 함수이며, 나머지 컬럼은 변환하지 않습니다.
+    """
+    pa, _, _ = import_pyarrow()
+    with pa.memory_map(snapshot_path, 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select([name for name in table.column_names if (columns(name) if callable(columns) else name in columns)])
+    categories = set(categories or []) & set(table.column_names)
+    columns = []
+    for name in table.column_names:
+        column = table.column(name)
+        if pa.types.is_dictionary(column.type) and name not in categories:
+            column = column.cast(column.type.value_type)
+        columns.append(column)
+    return pa.table(columns, names=table.column_names).to_pandas(categories=list(categories) or None)
+
+
+def snapshot_path_for(digest, name, snapshot_dir=None):
+    """CSV 내용 해시로 만든 스냅샷 경로 (내용이 바뀌면 새 스냅샷)"""
+    base = os.path.splitext(os.path.basename(name.split('?')[0]))[0]
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, f"{base}-{digest[:16]}.arrow")
+
+
+def load_csv_content(content, name, snapshot_dir=None):
+    """CSV 내용(bytes)을 스냅샷으로 로드 (처음 보는 내용이면 변환 후 저장, pyarrow 가 없으면 CSV 직접 파싱)"""
+    return load_csv_file(content, hashlib.sha256(content).hexdigest(), name, snapshot_dir)
+
+
+def load_csv_file(csv_source, digest, name, snapshot_dir=None):
+    """CSV 파일 경로(또는 bytes)를 내용 해시 digest 의 스냅샷으로 로드
+
+    스냅샷이 이미 있으면 CSV 는 읽지 않습니다. (다운로드 캐시의 sha256 을 넘기면 재시작 시 CSV 를 다시 읽지 않음)
+    """
+    try:
+        import_pyarrow()
+    except ImportError as e:
+        print(f"{e} - CSV 를 직접 파싱합니다.")
+        return read_result_csv(io.BytesIO(csv_source) if isinstance(csv_source, bytes) else csv_source, categories=False)
+
+    snapshot_path = snapshot_path_for(digest, name, snapshot_dir)
+    if not os.path.exists(snapshot_path):
+        build_snapshot(csv_source, snapshot_path)
+        remove_stale_snapshots(snapshot_path)
+    return load_snapshot(snapshot_path)
+
+
+def remove_stale_snapshots(snapshot_path):
+    """같은 파일 이름의 이전 내용 스냅샷 삭제"""
+    directory, current = os.path.split(snapshot_path)
+    prefix = current.rsplit('-', 1)[0] + '-'
+    for name in os.listdir(directory):
+        if name != current and name.startswith(prefix) and name.endswith('.arrow') and len(name) == len(current):
+            os.remove(os.path.join(directory, name))
+
+
+def resolve_workbook(path):
+    """엑셀 잠금 파일(~$이름.xlsx)이면 같은 폴더의 원본 통합문서 경로로 바꿈
+
+    엑셀은 통합문서를 여는 동안 '~$' 로 시작하는 작은 잠금 파일을 만듭니다. (이름이 길면 앞 글자가 잘림)
+    """
+    directory, name = os.path.split(path)
+    if not name.startswith('~$'):
+        return path
+    suffix = name[2:]
+    candidates = sorted(
+        candidate for candidate in os.listdir(directory or '.')
+        if not candidate.startswith('~$') and candidate.endswith(suffix)
+    )
+    if suffix in candidates:
+        candidates = [suffix]
+    if len(candidates) != 1:
+        raise FileNotFoundError(f"{path} 는 엑셀 잠금 파일이고 원본 통합문서를 찾을 수 없습니다: *{suffix}")
+    workbook = os.path.join(directory, candidates[0])
+    print(f"엑셀 잠금 파일 대신 원본 통합문서 사용: {workbook}")
+    return workbook
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def arrow_column(pa, column, values):
+    """DataFrame 컬럼을 Arrow 배열로 변환 (숫자/문자가 섞인 엑셀 컬럼은 문자열로 저장)"""
+    try:
+        array = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        array = pa.array(values.map(lambda value: None if pd.isna(value) else str(value)), type=pa.string())
+    if column in CATEGORY_COLUMNS and pa.types.is_string(array.type):
+        return array.dictionary_encode()
+    return array
+
+
+def build_excel_snapshot(workbook, snapshot_path, sheet_name=0):
+    """엑셀 시트를 스키마 타입을 적용한 Arrow IPC(Feather v2, 비압축) 스냅샷으로 변환 (openpyxl 은 여기서만 사용)"""
+    pa, _, feather = import_pyarrow()
+    started = time.perf_counter()
+
+    df = pd.read_excel(workbook, sheet_name=sheet_name, engine='openpyxl', dtype=reader_dtypes(categories=False), thousands=',')
+    df = apply_schema(df, categories=False)
+    names = [str(column) for column in df.columns]
+    table = pa.table([arrow_column(pa, name.strip(), df.iloc[:, index]) for index, name in enumerate(names)], names=names)
+
+    os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)), exist_ok=True)
+    tmp_path = f"{snapshot_path}.tmp"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, snapshot_path)
+    print(f"엑셀 스냅샷 생성: {snapshot_path} ({table.num_rows}행, {time.perf_counter() - started:.2f}초)")
+    return snapshot_path
+
+
+def load_excel_file(workbook, digest=None, name=None, snapshot_dir=None, sheet_name=0, profile=None, categories=None):
+    """엑셀 통합문서를 내용 해시 digest 의 스냅샷으로 로드 (통합문서가 바뀌었을 때만 openpyxl 로 다시 변환)
+
+    workbook 은 로컬 경로이며 엑셀 잠금 파일(~$...xlsx)을 넘기면 원본 통합문서를 사용합니다.
+    digest 를 넘기지 않으면 파일 내용으로 계산합니다. (다운로드 캐시의 sha256 을 넘기면 다시 읽지 않음)
+    profile 은 utils.schema.REQUIRED_COLUMNS 의 진입점 이름으로, 필요한 컬럼만 DataFrame 으로 변환합니다.
+    """
+    original = workbook
+    workbook = resolve_workbook(workbook)
+    try:
+        import_pyarrow()
+    except ImportError as e:
+        print(f"{e} - 엑셀을 직접 파싱합니다.")
+        return read_result_excel(workbook, profile=profile, categories=bool(categories))
+
+    if workbook != original:
+        digest = None
+    digest = digest or file_digest(workbook)
+    stem = os.path.splitext(os.path.basename((name or workbook).split('?')[0]))[0]
+    snapshot_path = snapshot_path_for(digest, f"{stem}_sheet{sheet_name}", snapshot_dir)
+    if not os.path.exists(snapshot_path):
+        build_excel_snapshot(workbook, snapshot_path, sheet_name=sheet_name)
+        remove_stale_snapshots(snapshot_path)
+    return load_snapshot(snapshot_path, categories=categories, columns=usecols_for(profile))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="result_kdtdata CSV/엑셀을 타입이 지정된 Arrow 스냅샷으로 변환")
+    parser.add_argument('csv_path', help="변환할 CSV 또는 엑셀(.xlsx) 파일")
+    parser.add_argument('--output', help="스냅샷 경로 (기본: CSV 와 같은 위치의 .arrow, 엑셀은 스냅샷 폴더의 내용 해시 경로)")
+    args = parser.parse_args(argv)
+
+    if os.path.splitext(args.csv_path)[1].lower() in ('.xlsx', '.xlsm'):
+        workbook = resolve_workbook(args.csv_path)
+        if args.output:
+            build_excel_snapshot(workbook, args.output)
+        else:
+            load_excel_file(workbook)
+        return 0
+
+    output = args.output or f"{os.path.splitext(args.csv_path)[0]}.arrow"
+    build_snapshot(args.csv_path, output)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
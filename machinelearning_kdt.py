@@ -1,14 +1,16 @@
 import pandas as pd
 import plotly.express as px
 from datetime import datetime
+from kdt_dataset_module.utils.schema import read_result_csv
 
 # 데이터 로딩 및 전처리 (2025년까지만 고려)
 def load_and_preprocess_data(filepath):
 
+    # 필요한 컬럼만 스키마 타입으로 읽음 (날짜/인원/매출은 변환된 상태, 훈련기관은 category)
     try:
-        df = pd.read_csv(filepath, encoding='utf-8')
+        df = read_result_csv(filepath, profile='machinelearning', encoding='utf-8')
     except UnicodeDecodeError:  # 만약 utf-8이 아닌 다른 인코딩으로 되어 있다면
-        df = pd.read_csv(filepath, encoding='cp949')  # 또는 'euc-kr' 등 적절한 인코딩
+        df = read_result_csv(filepath, profile='machinelearning', encoding='cp949')  # 또는 'euc-kr' 등 적절한 인코딩
 
 
     # 2025년 매출 3배 처리 (2026년은 제외)
@@ -33,8 +35,9 @@ def load_and_preprocess_data(filepath):
     
     if df['누적매출'].dtype == object:
         df['누적매출'] = pd.to_numeric(df['누적매출'].astype(str).str.replace(",",""), errors='coerce')
-    # 누락값 0으로 처리 (다른 값으로 채워도 됩니다)
-    df.fillna(0, inplace=True)
+    # 누락값 0으로 처리 (다른 값으로 채워도 됩니다, category 인 훈련기관과 날짜는 그대로 둠)
+    numeric_columns = df.select_dtypes('number').columns
+    df[numeric_columns] = df[numeric_columns].fillna(0)
     
     df['수강신청 인원'] = df['수강신청 인원'].astype(int)
     df['수료인원'] = df['수료인원'].astype(int)
@@ -51,7 +54,7 @@ def visualize_data(df):
     
     # 그룹핑 및 집계
     # 2025년 매출은 3배를 했기 때문에 원래 값으로 다시 나눠줍니다.
-    grouped = df.groupby(['훈련기관', '연도', '월']).agg({'수강신청 인원': 'sum', '누적매출': 'sum', "수료인원": 'sum'}).reset_index()
+    grouped = df.groupby(['훈련기관', '연도', '월'], observed=True).agg({'수강신청 인원': 'sum', '누적매출': 'sum', "수료인원": 'sum'}).reset_index()
     grouped.loc[grouped['연도']==2025, "누적매출"] = grouped.loc[grouped['연도']==2025, "누적매출"] / 3  # 원래 매출 값으로 표시
 
     # --- Plotly를 사용한 시각화 ---
@@ -5,6 +5,7 @@ import altair as alt
 from datetime import datetime
 import requests
 import io
+from kdt_dataset_module.utils.schema import read_result_excel
 
 @st.cache_data
 def load_data():
@@ -12,7 +13,8 @@ def load_data():
     try:
         response = requests.get(url, timeout=10)
         if response.status_code == 200:
-            df = pd.read_excel(io.BytesIO(response.content), engine="openpyxl")
+            # 화면에서 쓰는 컬럼만 읽음 (훈련기관/NCS명/파트너기관은 category, 매출은 숫자)
+            df = read_result_excel(io.BytesIO(response.content), profile='streamlit_app')
             return df
     except Exception as e:
         st.error(f"데이터를 불러올 수 없습니다: {e}")
@@ -93,7 +95,7 @@ def analyze_training_institution(df):
     total_market = df[year_columns].sum() / 1e8
     market_share = (yearly_sales / total_market * 100).round(1)
     total_revenue = inst_data['누적매출'].sum() / 1e8
-    overall_rank = df.groupby('훈련기관')['누적매출'].sum().rank(ascending=False, method='min')[institution]
+    overall_rank = df.groupby('훈련기관', observed=True)['누적매출'].sum().rank(ascending=False, method='min')[institution]
     
     # 주요 지표 표시
     col1, col2 = st.columns(2)
@@ -215,7 +217,7 @@ def analyze_ncs(df):
     total_revenue = ncs_data['누적매출'].sum() / 1e8
     total_market = df['누적매출'].sum() / 1e8
     market_share = (total_revenue / total_market * 100)
-    market_rank = df.groupby('NCS명')['누적매출'].sum().rank(ascending=False, method='min')[ncs]
+    market_rank = df.groupby('NCS명', observed=True)['누적매출'].sum().rank(ascending=False, method='min')[ncs]
     
     st.subheader("NCS 전체 통계")
     st.write(f"누적 매출: **{total_revenue:.0f}억 원**")
@@ -372,7 +374,7 @@ def analyze_ncs(df):
     total_revenue = ncs_data['누적매출'].sum() / 1e8
     total_market = df['누적매출'].sum() / 1e8
     market_share = (total_revenue / total_market * 100)
-    market_rank = df.groupby('NCS명')['누적매출'].sum().rank(ascending=False, method='min')[ncs]
+    market_rank = df.groupby('NCS명', observed=True)['누적매출'].sum().rank(ascending=False, method='min')[ncs]
     
     # 수강/수료 정보 계산 (종료된 과정만)
     total_applicants = completed_courses['수강신청 인원'].sum()